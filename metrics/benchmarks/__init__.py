@@ -3,4 +3,21 @@ from .most_similar_command import *
 from .finds_appropriate_handler import *
 from .validate_routers_for_collisions import *
 from .input_command_parse import *
-from .flag_validation import *
\ No newline at end of file
+from .flag_validation import *
+from .parse_cache import *
+from .input_flags_scaling import *
+from .trigger_prefix_tree import *
+from .similarity_index import *
+from .history_completion import *
+from .argument_completion import *
+from .import_time import *
+from .banner_cache import *
+from .one_shot import *
+from .script_throughput import *
+from .subcommands import *
+from .lazy_router import *
+from .plugin_manifest import *
+from .startup_snapshot import *
+from .codegen import *
+from .middleware import *
+from .typed_flags import *
@@ -0,0 +1,90 @@
+__all__ = [
+    "benchmark_build_completion_schema_with_500_flags",
+    "benchmark_complete_flag_name_in_500_flags",
+    "benchmark_complete_all_flags_of_500_flags",
+    "benchmark_complete_flag_value_in_500_values",
+]
+
+from functools import cache
+
+from prompt_toolkit.completion import CompleteEvent
+from prompt_toolkit.document import Document
+from prompt_toolkit.history import InMemoryHistory
+
+from argenta.app.autocompleter.completers import HistoryCompleter
+from argenta.app.completion_schemas import CompletionSchemas
+from argenta.command import Flag, Flags
+from argenta.command.models import Command
+from argenta.response import Response
+from argenta.router import Router
+
+from .entity import benchmarks
+
+FLAGS_COUNT: int = 500
+
+
+@cache
+def _get_router_with_many_flags() -> Router:
+    router = Router()
+
+    @router.command(Command("deploy", flags=Flags(
+        [Flag(f"option{i}", possible_values=[f"value{j}" for j in range(FLAGS_COUNT)]) for i in range(FLAGS_COUNT)]
+    )))
+    def handler(_res: Response) -> None:
+        pass
+
+    return router
+
+
+@cache
+def _get_completer() -> HistoryCompleter:
+    return HistoryCompleter(
+        InMemoryHistory(),
+        {"deploy"},
+        completion_schemas=CompletionSchemas([_get_router_with_many_flags()]),
+    )
+
+
+def _setup() -> None:
+    _get_completer()
+
+
+def _press_tab(text: str) -> None:
+    for _ in _get_completer().get_completions(Document(text), CompleteEvent()):
+        pass
+
+
+@benchmarks.register(
+    type_="argument_completion",
+    description="Build completion schema (1 command, 500 flags x 500 values)",
+    setup=_setup,
+)
+def benchmark_build_completion_schema_with_500_flags() -> None:
+    CompletionSchemas([_get_router_with_many_flags()])
+
+
+@benchmarks.register(
+    type_="argument_completion",
+    description="Complete flag name (500 flags, 11 matches)",
+    setup=_setup,
+)
+def benchmark_complete_flag_name_in_500_flags() -> None:
+    _press_tab("deploy --option1 value1 --option42")
+
+
+@benchmarks.register(
+    type_="argument_completion",
+    description="Complete any flag (500 flags, all match)",
+    setup=_setup,
+)
+def benchmark_complete_all_flags_of_500_flags() -> None:
+    _press_tab("deploy ")
+
+
+@benchmarks.register(
+    type_="argument_completion",
+    description="Complete flag value (500 values, 11 matches)",
+    setup=_setup,
+)
+def benchmark_complete_flag_value_in_500_values() -> None:
+    _press_tab("deploy --option7 value42")
@@ -0,0 +1,51 @@
+__all__ = [
+    "benchmark_banner_render_with_art",
+    "benchmark_banner_from_disk_cache",
+]
+
+import os
+import subprocess
+import sys
+
+from argenta.app.banner_cache import BannerCache
+
+from .core.models import BenchmarkDirectory
+from .entity import benchmarks
+
+BANNER_TEXT: str = "Argenta"
+BANNER_FONT: str = "tarty1"
+BANNER_CACHE_DIRECTORY: BenchmarkDirectory = BenchmarkDirectory(prefix="argenta-banners-")
+
+
+def _setup() -> None:
+    BANNER_CACHE_DIRECTORY.create()
+    BannerCache(BANNER_CACHE_DIRECTORY.path).get_or_render(BANNER_TEXT, BANNER_FONT)
+
+
+def _run_in_fresh_interpreter(statement: str) -> None:
+    subprocess.run(
+        [sys.executable, "-c", statement],
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, sys.path))},
+    )
+
+
+@benchmarks.register(type_="banner", description="Render the initial banner with art in a fresh interpreter")
+def benchmark_banner_render_with_art() -> None:
+    _run_in_fresh_interpreter(
+        "from argenta.app.banner_cache import BannerCache; "
+        f"BannerCache._render({BANNER_TEXT!r}, {BANNER_FONT!r})"
+    )
+
+
+@benchmarks.register(
+    type_="banner",
+    description="Read the initial banner from the disk cache in a fresh interpreter",
+    setup=_setup,
+    teardown=BANNER_CACHE_DIRECTORY.remove,
+)
+def benchmark_banner_from_disk_cache() -> None:
+    _run_in_fresh_interpreter(
+        "from argenta.app.banner_cache import BannerCache; "
+        f"BannerCache({BANNER_CACHE_DIRECTORY.path!r}).get_or_render({BANNER_TEXT!r}, {BANNER_FONT!r})"
+    )
@@ -0,0 +1,112 @@
+__all__ = [
+    "benchmark_decorated_app_startup",
+    "benchmark_generated_dispatch_module_startup",
+]
+
+import os
+import subprocess
+import sys
+
+from .core.models import BenchmarkDirectory
+from .entity import benchmarks
+
+HANDLER_MODULES_COUNT: int = 100
+COMMANDS_PER_MODULE: int = 100
+
+HANDLER_FUNCTION: str = """
+
+@router.command(Command("cmd{module}_{index}", description="Synthetic command {index}", aliases={{"c{module}_{index}"}},
+                        flags=Flags([Flag("mode", possible_values=["fast", "slow"]), Flag("verbose")])))
+def handler_{index}(_response: Response) -> None:
+    pass
+"""
+HANDLER_MODULE_HEADER: str = """
+from argenta import Command, Router
+from argenta.command import Flag, Flags
+from argenta.response import Response
+
+router = Router(title="Commands {module}:")
+"""
+APP_MODULE: str = f"""
+from importlib import import_module
+
+from argenta import App
+
+app = App(override_system_messages=True, disable_banners=True)
+for i in range({HANDLER_MODULES_COUNT}):
+    app.include_router(import_module(f"synthetic_handlers.module_{{i}}").router)
+"""
+DECORATED_APP_SCRIPT: str = """
+from synthetic_app import app
+
+app.execute("cmd0_0")
+"""
+GENERATED_APP_SCRIPT: str = """
+from argenta import App
+from synthetic_dispatch import ROUTES
+
+app = App(override_system_messages=True, disable_banners=True)
+app.include_compiled_routes(ROUTES)
+app.execute("cmd0_0")
+"""
+
+BENCHMARK_DIRECTORY: BenchmarkDirectory = BenchmarkDirectory(prefix="argenta-codegen-")
+
+
+def _get_benchmark_environment() -> dict[str, str]:
+    # both startups are measured with the bytecode caches written, as in a deployment
+    return {
+        **{name: value for name, value in os.environ.items() if name != "PYTHONDONTWRITEBYTECODE"},
+        "PYTHONPATH": os.pathsep.join(filter(None, [BENCHMARK_DIRECTORY.path, *sys.path])),
+    }
+
+
+def _run_app_script(app_script: str) -> None:
+    subprocess.run(
+        [sys.executable, "-c", app_script],
+        stdout=subprocess.DEVNULL,
+        check=True,
+        env=_get_benchmark_environment(),
+    )
+
+
+def _setup() -> None:
+    BENCHMARK_DIRECTORY.create()
+    handlers_directory: str = os.path.join(BENCHMARK_DIRECTORY.path, "synthetic_handlers")
+    os.mkdir(handlers_directory)
+    open(os.path.join(handlers_directory, "__init__.py"), "w").close()
+    for module_index in range(HANDLER_MODULES_COUNT):
+        with open(os.path.join(handlers_directory, f"module_{module_index}.py"), "w", encoding="utf-8") as module_file:
+            module_file.write(HANDLER_MODULE_HEADER.format(module=module_index))
+            for handler_index in range(COMMANDS_PER_MODULE):
+                module_file.write(HANDLER_FUNCTION.format(module=module_index, index=handler_index))
+    with open(os.path.join(BENCHMARK_DIRECTORY.path, "synthetic_app.py"), "w", encoding="utf-8") as app_file:
+        app_file.write(APP_MODULE)
+    subprocess.run(
+        [sys.executable, "-m", "argenta.codegen", "synthetic_app:app", "-o", "synthetic_dispatch.py"],
+        cwd=BENCHMARK_DIRECTORY.path,
+        check=True,
+        env=_get_benchmark_environment(),
+    )
+    _run_app_script(DECORATED_APP_SCRIPT)
+    _run_app_script(GENERATED_APP_SCRIPT)
+
+
+@benchmarks.register(
+    type_="codegen",
+    description="10k commands in 100 modules registered by decorators, one command",
+    setup=_setup,
+    teardown=BENCHMARK_DIRECTORY.remove,
+)
+def benchmark_decorated_app_startup() -> None:
+    _run_app_script(DECORATED_APP_SCRIPT)
+
+
+@benchmarks.register(
+    type_="codegen",
+    description="10k commands from the generated dispatch module, one command",
+    setup=_setup,
+    teardown=BENCHMARK_DIRECTORY.remove,
+)
+def benchmark_generated_dispatch_module_startup() -> None:
+    _run_app_script(GENERATED_APP_SCRIPT)
@@ -1,6 +1,7 @@
 __all__ = [
     "Benchmark",
     "Benchmarks",
+    "BenchmarkDirectory",
     "BenchmarkResult",
     "BenchmarkGroupResult"
 ]
@@ -11,6 +12,7 @@ from dataclasses import dataclass
 import time
 import gc
 import statistics
+from tempfile import TemporaryDirectory
 from typing import Callable, override
 
 from .exceptions import BenchmarkNotFound, BenchmarksNotFound, BenchmarksWithSameNameAlreadyExists
@@ -46,12 +48,16 @@ class Benchmark:
             *,
             type_: str,
             name: str,
-            description: str
+            description: str,
+            setup: FuncForBenchmark | None = None,
+            teardown: FuncForBenchmark | None = None
     ) -> None:
         self.func = func
         self.type_ = type_
         self.name = name
         self.description = description
+        self.setup = setup
+        self.teardown = teardown
 
     def single_run(self) -> float:
         with redirect_stdout(io.StringIO()):
@@ -61,6 +67,16 @@ class Benchmark:
         return (end - start) * MILLISECONDS_IN_SECONDS
 
     def multiple_runs(self, iterations: int, is_gc_disabled: bool = False) -> tuple[float, ...]:
+        if self.setup is not None:
+            with redirect_stdout(io.StringIO()):
+                self.setup()
+        try:
+            return self._timed_runs(iterations, is_gc_disabled)
+        finally:
+            if self.teardown is not None:
+                self.teardown()
+
+    def _timed_runs(self, iterations: int, is_gc_disabled: bool) -> tuple[float, ...]:
         run_attempts: list[float] = []
         if is_gc_disabled:
             was_gc_enabled = gc.isenabled()
@@ -85,6 +101,27 @@ class Benchmark:
         return f'benchmark {self.name} with type {self.type_}'
 
 
+class BenchmarkDirectory:
+    def __init__(self, prefix: str) -> None:
+        self.prefix = prefix
+        self._temporary_directory: TemporaryDirectory[str] | None = None
+
+    @property
+    def path(self) -> str:
+        if self._temporary_directory is None:
+            raise RuntimeError(f'benchmark directory {self.prefix}* is used outside of the benchmark setup')
+        return self._temporary_directory.name
+
+    def create(self) -> None:
+        self.remove()
+        self._temporary_directory = TemporaryDirectory(prefix=self.prefix)
+
+    def remove(self) -> None:
+        if self._temporary_directory is not None:
+            self._temporary_directory.cleanup()
+            self._temporary_directory = None
+
+
 class Benchmarks:
     def __init__(self, *benchmarks: Benchmark) -> None:
         self._benchmarks: list[Benchmark] = list(benchmarks)
@@ -94,7 +131,10 @@ class Benchmarks:
     def register(
             self,
             type_: str,
-            description: str = ""
+            description: str = "",
+            *,
+            setup: FuncForBenchmark | None = None,
+            teardown: FuncForBenchmark | None = None
     ) -> Callable[[FuncForBenchmark], FuncForBenchmark]:
         def decorator(func: FuncForBenchmark) -> FuncForBenchmark:
             benchmark = Benchmark(
@@ -102,6 +142,8 @@ class Benchmarks:
                 type_=type_,
                 name=func.__name__,
                 description=description or f'description for {func.__name__} with type {type_}',
+                setup=setup,
+                teardown=teardown,
             )
             if self._benchmarks_paired_by_name.get(func.__name__):
                 raise BenchmarksWithSameNameAlreadyExists(func.__name__)
@@ -3,9 +3,12 @@ __all__ = [
     "benchmark_command_with_flags",
     "benchmark_many_commands",
     "benchmark_command_with_many_flags",
-    "benchmark_extreme_router"
+    "benchmark_extreme_router",
+    "benchmark_end_to_end_router_chain",
+    "benchmark_end_to_end_dispatch_table"
 ]
 
+from argenta.app import App
 from argenta.command.models import Command, InputCommand
 from argenta.command import Flag, Flags
 from argenta.response import Response
@@ -78,3 +81,47 @@ def benchmark_extreme_router() -> None:
 
     input_cmd = InputCommand.parse('cmd50 -f50_0 -f50_1 -f50_2')
     router.finds_appropriate_handler(input_cmd)
+
+
+def _build_app_with_many_routers() -> App:
+    app = App(override_system_messages=True, printer=lambda _: None)
+
+    for i in range(20):
+        router = Router()
+        for j in range(50):
+            @router.command(Command(f'cmd{i}_{j}', flags=Flags([Flag('a'), Flag('b')])))
+            def handler(_res: Response) -> None:
+                pass
+        app.include_router(router)
+
+    app._pre_cycle_setup()
+    return app
+
+
+APP_WITH_MANY_ROUTERS: App = _build_app_with_many_routers()
+END_TO_END_INPUTS: list[InputCommand] = [
+    InputCommand.parse(f'cmd{i % 20}_{i % 50} -a -b') for i in range(1000)
+]
+
+
+@benchmarks.register(
+    type_="finds_appropriate_handler",
+    description="End-to-end router chain (20 routers x 50 commands, 1000 inputs)"
+)
+def benchmark_end_to_end_router_chain() -> None:
+    app = APP_WITH_MANY_ROUTERS
+    for input_command in END_TO_END_INPUTS:
+        dispatch_entry = app._dispatch_table.get(input_command.trigger)
+        if dispatch_entry is None or dispatch_entry.is_exit_command:
+            continue
+        dispatch_entry.router.finds_appropriate_handler(input_command)
+
+
+@benchmarks.register(
+    type_="finds_appropriate_handler",
+    description="End-to-end dispatch table (20 routers x 50 commands, 1000 inputs)"
+)
+def benchmark_end_to_end_dispatch_table() -> None:
+    app = APP_WITH_MANY_ROUTERS
+    for input_command in END_TO_END_INPUTS:
+        app._dispatch_input_command(input_command)
@@ -7,12 +7,17 @@ __all__ = [
     "benchmark_validate_regex_complex",
     "benchmark_validate_multiple_flags_10",
     "benchmark_validate_multiple_flags_50",
-    "benchmark_validate_extreme_100_flags"
+    "benchmark_validate_extreme_100_flags",
+    "benchmark_validate_allow_list_10k_interpreted",
+    "benchmark_validate_allow_list_10k_compiled",
+    "benchmark_structuring_10k_allow_lists_20_flags",
 ]
 
 import re
 
+from argenta.command import Command, Flags, InputFlags
 from argenta.command.flag import Flag, InputFlag, PossibleValues
+from argenta.router import Router
 
 from .entity import benchmarks
 
@@ -100,3 +105,30 @@ def benchmark_validate_extreme_100_flags() -> None:
     
     for flag, input_flag in zip(flags, input_flags):
         flag.validate_input_flag_value(input_flag.input_value)
+
+
+ALLOW_LIST_10K: list[str] = [f"value{i}" for i in range(10_000)]
+ALLOW_LIST_10K_FLAG: Flag = Flag("option", possible_values=ALLOW_LIST_10K)
+ALLOW_LIST_10K_VALIDATOR = ALLOW_LIST_10K_FLAG.compile_value_validator()
+ALLOW_LIST_10K_COMMAND: Command = Command(
+    "deploy",
+    flags=Flags([Flag(f"option{i}", possible_values=ALLOW_LIST_10K) for i in range(20)]),
+)
+
+
+@benchmarks.register(type_="flag_validation", description="Allow-list of 10k values, per-call isinstance dispatch (100 checks)")
+def benchmark_validate_allow_list_10k_interpreted() -> None:
+    for _ in range(100):
+        ALLOW_LIST_10K_FLAG.validate_input_flag_value("value9999")
+
+
+@benchmarks.register(type_="flag_validation", description="Allow-list of 10k values, compiled validator (100 checks)")
+def benchmark_validate_allow_list_10k_compiled() -> None:
+    for _ in range(100):
+        ALLOW_LIST_10K_VALIDATOR("value9999")
+
+
+@benchmarks.register(type_="flag_validation", description="Structuring 20 input flags against 10k-value allow-lists")
+def benchmark_structuring_10k_allow_lists_20_flags() -> None:
+    input_flags = InputFlags([InputFlag(f"option{i}", input_value=f"value{9999 - i}") for i in range(20)])
+    Router._structuring_input_flags(ALLOW_LIST_10K_COMMAND, input_flags)
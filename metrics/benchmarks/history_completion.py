@@ -0,0 +1,115 @@
+__all__ = [
+    "benchmark_tab_with_1k_history_entries",
+    "benchmark_tab_with_100k_history_entries",
+    "benchmark_tab_with_1m_history_entries",
+    "benchmark_append_and_tab_with_1m_history_entries",
+    "benchmark_tab_with_1k_history_entries_without_index",
+    "benchmark_tab_with_100k_history_entries_without_index",
+]
+
+from functools import cache
+from typing import Callable
+
+from prompt_toolkit.completion import CompleteEvent
+from prompt_toolkit.document import Document
+from prompt_toolkit.history import InMemoryHistory
+
+from argenta.app.autocompleter.completers import HistoryCompleter
+from argenta.app.history import IndexedHistory
+
+from .entity import benchmarks
+
+STATIC_COMMANDS: set[str] = {f"command{i}" for i in range(100)}
+TAB_DOCUMENT: Document = Document("deploy --host 10.0.17.3 ")
+
+
+def _history_strings(entries_count: int) -> list[str]:
+    return [f"deploy --host 10.0.{i % 256}.{i // 256 % 256} --port {i}" for i in range(entries_count)]
+
+
+@cache
+def _get_indexed_completer(entries_count: int) -> tuple[HistoryCompleter, IndexedHistory]:
+    history = IndexedHistory(InMemoryHistory(_history_strings(entries_count)))
+    completer = HistoryCompleter(history, STATIC_COMMANDS)
+    list(completer.get_completions(TAB_DOCUMENT, CompleteEvent()))
+    return completer, history
+
+
+@cache
+def _get_scanning_completer(entries_count: int) -> HistoryCompleter:
+    return HistoryCompleter(InMemoryHistory(_history_strings(entries_count)), STATIC_COMMANDS)
+
+
+def _setup_indexed_completer(entries_count: int) -> Callable[[], None]:
+    def setup() -> None:
+        _get_indexed_completer(entries_count)
+
+    return setup
+
+
+def _setup_scanning_completer(entries_count: int) -> Callable[[], None]:
+    def setup() -> None:
+        _get_scanning_completer(entries_count)
+
+    return setup
+
+
+def _press_tab(completer: HistoryCompleter) -> None:
+    for _ in completer.get_completions(TAB_DOCUMENT, CompleteEvent()):
+        pass
+
+
+@benchmarks.register(
+    type_="history_completion",
+    description="Tab with 1k history entries (indexed)",
+    setup=_setup_indexed_completer(1_000),
+)
+def benchmark_tab_with_1k_history_entries() -> None:
+    _press_tab(_get_indexed_completer(1_000)[0])
+
+
+@benchmarks.register(
+    type_="history_completion",
+    description="Tab with 100k history entries (indexed)",
+    setup=_setup_indexed_completer(100_000),
+)
+def benchmark_tab_with_100k_history_entries() -> None:
+    _press_tab(_get_indexed_completer(100_000)[0])
+
+
+@benchmarks.register(
+    type_="history_completion",
+    description="Tab with 1M history entries (indexed)",
+    setup=_setup_indexed_completer(1_000_000),
+)
+def benchmark_tab_with_1m_history_entries() -> None:
+    _press_tab(_get_indexed_completer(1_000_000)[0])
+
+
+@benchmarks.register(
+    type_="history_completion",
+    description="Append entry, then Tab with 1M history entries (indexed)",
+    setup=_setup_indexed_completer(1_000_000),
+)
+def benchmark_append_and_tab_with_1m_history_entries() -> None:
+    completer, history = _get_indexed_completer(1_000_000)
+    history.append_string(f"deploy --host 10.0.1.1 --port {len(history.index)}")
+    _press_tab(completer)
+
+
+@benchmarks.register(
+    type_="history_completion",
+    description="Tab with 1k history entries (reload and scan)",
+    setup=_setup_scanning_completer(1_000),
+)
+def benchmark_tab_with_1k_history_entries_without_index() -> None:
+    _press_tab(_get_scanning_completer(1_000))
+
+
+@benchmarks.register(
+    type_="history_completion",
+    description="Tab with 100k history entries (reload and scan)",
+    setup=_setup_scanning_completer(100_000),
+)
+def benchmark_tab_with_100k_history_entries_without_index() -> None:
+    _press_tab(_get_scanning_completer(100_000))
@@ -0,0 +1,72 @@
+__all__ = [
+    "HistoryStartupResult",
+    "measure_history_startup",
+]
+
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from prompt_toolkit.history import FileHistory, History
+
+from argenta.app.history import TailFileHistory
+
+HISTORY_FILE_SIZES: tuple[int, ...] = (5 * 1024 ** 2, 50 * 1024 ** 2, 500 * 1024 ** 2)
+FILE_HISTORY_MAX_SIZE: int = 50 * 1024 ** 2
+LOADED_ENTRIES_LIMIT: int = 1000
+ENTRIES_PER_CHUNK: int = 10_000
+
+
+@dataclass(frozen=True, slots=True)
+class HistoryStartupResult:
+    description: str
+    file_size: int  # in bytes
+    loaded_entries: int
+    load_time: float  # in ms
+
+
+def _write_history_file(filename: str, file_size: int) -> None:
+    chunk: bytes = b"".join(
+        f"\n# 2025-01-01 00:00:00.000000\n+deploy --host 10.0.{i % 256}.{i // 256 % 256} --port {i}\n".encode()
+        for i in range(ENTRIES_PER_CHUNK)
+    )
+    with open(filename, "wb") as history_file:
+        for _ in range(file_size // len(chunk) + 1):
+            history_file.write(chunk)
+
+
+def _measure_load(history_factory: Callable[[], History]) -> tuple[int, float]:
+    start = time.perf_counter()
+    loaded_entries = sum(1 for _ in history_factory().load_history_strings())
+    return loaded_entries, (time.perf_counter() - start) * 1000
+
+
+def measure_history_startup() -> list[HistoryStartupResult]:
+    results: list[HistoryStartupResult] = []
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "history")
+        for file_size in HISTORY_FILE_SIZES:
+            _write_history_file(filename, file_size)
+            actual_file_size = os.path.getsize(filename)
+
+            loaded_entries, load_time = _measure_load(
+                lambda: TailFileHistory(filename, loaded_entries_limit=LOADED_ENTRIES_LIMIT)
+            )
+            results.append(HistoryStartupResult(
+                description=f"TailFileHistory, newest {LOADED_ENTRIES_LIMIT} entries",
+                file_size=actual_file_size,
+                loaded_entries=loaded_entries,
+                load_time=round(load_time, 4),
+            ))
+
+            if file_size <= FILE_HISTORY_MAX_SIZE:
+                loaded_entries, load_time = _measure_load(lambda: FileHistory(filename))
+                results.append(HistoryStartupResult(
+                    description="FileHistory, whole file",
+                    file_size=actual_file_size,
+                    loaded_entries=loaded_entries,
+                    load_time=round(load_time, 4),
+                ))
+    return results
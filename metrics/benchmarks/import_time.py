@@ -0,0 +1,94 @@
+__all__ = [
+    "ImportTimeResult",
+    "measure_import_time",
+    "benchmark_import_argenta",
+    "benchmark_app_construction",
+    "benchmark_import_autocompleter",
+    "benchmark_non_interactive_autocompleter_setup",
+]
+
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+
+from .entity import benchmarks
+
+IMPORT_ARGENTA_STATEMENT: str = "import argenta"
+APP_CONSTRUCTION_STATEMENT: str = "from argenta import App, Command, Router; App().include_router(Router())"
+NON_INTERACTIVE_SETUP_STATEMENT: str = (
+    "from argenta import App; "
+    "App(); "
+    "from argenta.app import AutoCompleter; "
+    "autocompleter = AutoCompleter(); "
+    "autocompleter.initial_setup({'start', 'stop'})"
+)
+LAZY_MODULES: tuple[str, ...] = ("prompt_toolkit", "art", "rich", "dishka")
+
+
+@dataclass(frozen=True, slots=True)
+class ImportTimeResult:
+    statement: str
+    total_import_time: float  # in ms, cumulative time of the top-level imports
+    imported_modules: frozenset[str]
+
+    def is_imported(self, module_name: str) -> bool:
+        return module_name in self.imported_modules
+
+
+def measure_import_time(statement: str) -> ImportTimeResult:
+    """
+    Runs the statement in a fresh interpreter with -X importtime and stdin that is not a tty
+    """
+    completed_process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, sys.path))},
+    )
+
+    total_import_time: int = 0
+    imported_modules: set[str] = set()
+    for line in completed_process.stderr.splitlines():
+        if not line.startswith("import time:") or line.endswith("imported package"):
+            continue
+        _, cumulative_time, module_column = line.removeprefix("import time:").split("|")
+        module_name = module_column.strip()
+        imported_modules.add(module_name)
+        if not module_column.startswith("  "):
+            total_import_time += int(cumulative_time)
+
+    return ImportTimeResult(
+        statement=statement,
+        total_import_time=round(total_import_time / 1000, 3),
+        imported_modules=frozenset(imported_modules),
+    )
+
+
+def _run_guarded(statement: str) -> None:
+    result = measure_import_time(statement)
+    for module_name in LAZY_MODULES:
+        if result.is_imported(module_name):
+            raise RuntimeError(f"{module_name} must not be imported by: {statement}")
+
+
+@benchmarks.register(type_="import_time", description="Import argenta in a fresh interpreter")
+def benchmark_import_argenta() -> None:
+    _run_guarded(IMPORT_ARGENTA_STATEMENT)
+
+
+@benchmarks.register(type_="import_time", description="App construction in a fresh interpreter")
+def benchmark_app_construction() -> None:
+    _run_guarded(APP_CONSTRUCTION_STATEMENT)
+
+
+@benchmarks.register(type_="import_time", description="Import AutoCompleter in a fresh interpreter")
+def benchmark_import_autocompleter() -> None:
+    _run_guarded("from argenta.app import AutoCompleter")
+
+
+@benchmarks.register(type_="import_time", description="Non-tty AutoCompleter setup in a fresh interpreter")
+def benchmark_non_interactive_autocompleter_setup() -> None:
+    _run_guarded(NON_INTERACTIVE_SETUP_STATEMENT)
@@ -5,10 +5,18 @@ __all__ = [
     "benchmark_command_with_mixed_prefixes",
     "benchmark_command_with_long_values",
     "benchmark_command_with_quoted_values",
-    "benchmark_extreme_many_flags"
+    "benchmark_extreme_many_flags",
+    "benchmark_long_flag_heavy_line_shlex_baseline",
+    "benchmark_long_flag_heavy_line_tokenize",
+    "benchmark_long_flag_heavy_line",
+    "benchmark_long_quoted_flag_heavy_line_shlex_baseline",
+    "benchmark_long_quoted_flag_heavy_line_tokenize",
 ]
 
+import shlex
+
 from argenta.command.models import InputCommand
+from argenta.command.tokenizer import tokenize
 
 from .entity import benchmarks
 
@@ -49,3 +57,41 @@ def benchmark_command_with_quoted_values() -> None:
 def benchmark_extreme_many_flags() -> None:
     flags = " ".join(f"--flag{i} value{i}" for i in range(50))
     InputCommand.parse(f"command {flags}")
+
+
+LONG_FLAG_HEAVY_LINE: str = "command " + " ".join(f"--flag{i} value{i} -s{i}" for i in range(200))
+LONG_QUOTED_FLAG_HEAVY_LINE: str = "command " + " ".join(
+    f"--flag{i} 'quoted value {i}' --path{i} \"/usr/local/bin {i}\"" for i in range(100)
+)
+
+
+def _shlex_tokens(raw_command: str) -> list[str]:
+    lexer = shlex.shlex(raw_command, posix=True)
+    lexer.whitespace_split = True
+    lexer.commenters = ""
+    return list(lexer)
+
+
+@benchmarks.register(type_="input_command_parse", description="Tokenizing via shlex, baseline (400 flags)")
+def benchmark_long_flag_heavy_line_shlex_baseline() -> None:
+    _shlex_tokens(LONG_FLAG_HEAVY_LINE)
+
+
+@benchmarks.register(type_="input_command_parse", description="Tokenizing via single-pass scanner (400 flags)")
+def benchmark_long_flag_heavy_line_tokenize() -> None:
+    list(tokenize(LONG_FLAG_HEAVY_LINE))
+
+
+@benchmarks.register(type_="input_command_parse", description="Long flag-heavy line, full parse (400 flags)")
+def benchmark_long_flag_heavy_line() -> None:
+    InputCommand.parse(LONG_FLAG_HEAVY_LINE)
+
+
+@benchmarks.register(type_="input_command_parse", description="Tokenizing via shlex, baseline (200 quoted flags)")
+def benchmark_long_quoted_flag_heavy_line_shlex_baseline() -> None:
+    _shlex_tokens(LONG_QUOTED_FLAG_HEAVY_LINE)
+
+
+@benchmarks.register(type_="input_command_parse", description="Tokenizing via single-pass scanner (200 quoted flags)")
+def benchmark_long_quoted_flag_heavy_line_tokenize() -> None:
+    list(tokenize(LONG_QUOTED_FLAG_HEAVY_LINE))
@@ -0,0 +1,71 @@
+__all__ = [
+    "benchmark_parse_line_with_1_flag",
+    "benchmark_parse_line_with_10_flags",
+    "benchmark_parse_line_with_50_flags",
+    "benchmark_parse_line_with_100_flags",
+    "benchmark_parse_line_with_250_flags",
+    "benchmark_parse_line_with_500_flags",
+    "benchmark_lookup_by_name_in_500_flags",
+    "benchmark_lookup_by_name_and_status_in_500_flags",
+]
+
+from argenta.command.flag import ValidationStatus
+from argenta.command.models import InputCommand
+
+from .entity import benchmarks
+
+
+def _line_with_flags(flags_count: int) -> str:
+    return "command " + " ".join(f"--flag{i} value{i}" for i in range(flags_count))
+
+
+LINES_BY_FLAGS_COUNT: dict[int, str] = {
+    flags_count: _line_with_flags(flags_count) for flags_count in (1, 10, 50, 100, 250, 500)
+}
+PARSED_500_FLAGS: InputCommand = InputCommand.parse(LINES_BY_FLAGS_COUNT[500])
+for _input_flag in PARSED_500_FLAGS.input_flags:
+    _input_flag.status = ValidationStatus.VALID
+
+
+@benchmarks.register(type_="input_flags_scaling", description="Parse line with 1 flag")
+def benchmark_parse_line_with_1_flag() -> None:
+    InputCommand.parse(LINES_BY_FLAGS_COUNT[1])
+
+
+@benchmarks.register(type_="input_flags_scaling", description="Parse line with 10 flags")
+def benchmark_parse_line_with_10_flags() -> None:
+    InputCommand.parse(LINES_BY_FLAGS_COUNT[10])
+
+
+@benchmarks.register(type_="input_flags_scaling", description="Parse line with 50 flags")
+def benchmark_parse_line_with_50_flags() -> None:
+    InputCommand.parse(LINES_BY_FLAGS_COUNT[50])
+
+
+@benchmarks.register(type_="input_flags_scaling", description="Parse line with 100 flags")
+def benchmark_parse_line_with_100_flags() -> None:
+    InputCommand.parse(LINES_BY_FLAGS_COUNT[100])
+
+
+@benchmarks.register(type_="input_flags_scaling", description="Parse line with 250 flags")
+def benchmark_parse_line_with_250_flags() -> None:
+    InputCommand.parse(LINES_BY_FLAGS_COUNT[250])
+
+
+@benchmarks.register(type_="input_flags_scaling", description="Parse line with 500 flags")
+def benchmark_parse_line_with_500_flags() -> None:
+    InputCommand.parse(LINES_BY_FLAGS_COUNT[500])
+
+
+@benchmarks.register(type_="input_flags_scaling", description="Lookup of every flag by name (500 flags)")
+def benchmark_lookup_by_name_in_500_flags() -> None:
+    input_flags = PARSED_500_FLAGS.input_flags
+    for i in range(500):
+        input_flags.get_flag_by_name(f"flag{i}")
+
+
+@benchmarks.register(type_="input_flags_scaling", description="Lookup of every flag by name and status (500 flags)")
+def benchmark_lookup_by_name_and_status_in_500_flags() -> None:
+    input_flags = PARSED_500_FLAGS.input_flags
+    for i in range(500):
+        input_flags.get_flag_by_name(f"flag{i}", with_status=ValidationStatus.VALID)
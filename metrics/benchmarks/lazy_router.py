@@ -0,0 +1,89 @@
+__all__ = [
+    "benchmark_eager_routers_startup",
+    "benchmark_lazy_routers_startup",
+]
+
+import os
+import subprocess
+import sys
+
+from .core.models import BenchmarkDirectory
+from .entity import benchmarks
+
+ROUTER_MODULES_COUNT: int = 60
+
+HEAVY_ROUTER_MODULE: str = """
+from argenta import Command, Router
+from argenta.response import Response
+
+HEAVY_DEPENDENCY = sorted(str(i) for i in range(20_000))
+
+router = Router()
+
+
+@router.command(Command("cmd{index}", description="Synthetic command {index}"))
+def handler(_response: Response) -> None:
+    pass
+"""
+EAGER_APP_SCRIPT: str = f"""
+from importlib import import_module
+
+from argenta import App
+
+app = App(override_system_messages=True, disable_banners=True)
+for i in range({ROUTER_MODULES_COUNT}):
+    app.include_router(import_module(f"heavy_routers.router_{{i}}").router)
+app.execute("cmd0")
+"""
+LAZY_APP_SCRIPT: str = f"""
+from argenta import App, Command
+
+app = App(override_system_messages=True, disable_banners=True)
+for i in range({ROUTER_MODULES_COUNT}):
+    app.include_lazy_router(
+        f"heavy_routers.router_{{i}}:router",
+        triggers=[Command(f"cmd{{i}}", description=f"Synthetic command {{i}}")],
+    )
+app.execute("cmd0")
+"""
+
+BENCHMARK_DIRECTORY: BenchmarkDirectory = BenchmarkDirectory(prefix="argenta-lazy-router-")
+
+
+def _setup() -> None:
+    BENCHMARK_DIRECTORY.create()
+    routers_directory: str = os.path.join(BENCHMARK_DIRECTORY.path, "heavy_routers")
+    os.mkdir(routers_directory)
+    open(os.path.join(routers_directory, "__init__.py"), "w").close()
+    for index in range(ROUTER_MODULES_COUNT):
+        with open(os.path.join(routers_directory, f"router_{index}.py"), "w", encoding="utf-8") as module_file:
+            module_file.write(HEAVY_ROUTER_MODULE.replace("{index}", str(index)))
+
+
+def _run_app_script(app_script: str) -> None:
+    subprocess.run(
+        [sys.executable, "-c", app_script],
+        stdout=subprocess.DEVNULL,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [BENCHMARK_DIRECTORY.path, *sys.path]))},
+    )
+
+
+@benchmarks.register(
+    type_="lazy_router",
+    description="60 heavy router modules imported eagerly, one command",
+    setup=_setup,
+    teardown=BENCHMARK_DIRECTORY.remove,
+)
+def benchmark_eager_routers_startup() -> None:
+    _run_app_script(EAGER_APP_SCRIPT)
+
+
+@benchmarks.register(
+    type_="lazy_router",
+    description="60 heavy router modules included lazily, one command",
+    setup=_setup,
+    teardown=BENCHMARK_DIRECTORY.remove,
+)
+def benchmark_lazy_routers_startup() -> None:
+    _run_app_script(LAZY_APP_SCRIPT)
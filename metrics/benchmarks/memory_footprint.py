@@ -0,0 +1,75 @@
+__all__ = [
+    "MemoryFootprintResult",
+    "measure_memory_footprints",
+]
+
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable
+
+from argenta.command import Flag, Flags
+from argenta.command.models import Command, InputCommand
+from argenta.response import Response, ResponseStatus
+from argenta.router import Router
+
+COMMANDS_COUNT: int = 20_000
+PARSED_INPUTS_COUNT: int = 20_000
+
+
+@dataclass(frozen=True, slots=True)
+class MemoryFootprintResult:
+    description: str
+    units: int
+    total_bytes: int
+
+    @property
+    def bytes_per_unit(self) -> float:
+        return round(self.total_bytes / self.units, 1)
+
+
+def _measure_retained_bytes(allocate: Callable[[], object]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        retained = allocate()
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del retained
+    return after - before
+
+
+def _register_commands() -> Router:
+    router = Router()
+    for i in range(COMMANDS_COUNT):
+        @router.command(Command(f"cmd{i}", flags=Flags([Flag("host"), Flag("port")])))
+        def handler(_res: Response) -> None:
+            pass
+    return router
+
+
+def _parse_inputs() -> list[tuple[InputCommand, Response]]:
+    parsed_inputs: list[tuple[InputCommand, Response]] = []
+    for i in range(PARSED_INPUTS_COUNT):
+        input_command = InputCommand.parse(f"cmd{i} --host localhost --port {i} -v")
+        response = Response(ResponseStatus.ALL_FLAGS_VALID, input_flags=input_command.input_flags)
+        parsed_inputs.append((input_command, response))
+    return parsed_inputs
+
+
+def measure_memory_footprints() -> list[MemoryFootprintResult]:
+    return [
+        MemoryFootprintResult(
+            description=f"Registered command with 2 flags ({COMMANDS_COUNT} commands)",
+            units=COMMANDS_COUNT,
+            total_bytes=_measure_retained_bytes(_register_commands),
+        ),
+        MemoryFootprintResult(
+            description=f"Parsed input with 3 flags and its response ({PARSED_INPUTS_COUNT} inputs)",
+            units=PARSED_INPUTS_COUNT,
+            total_bytes=_measure_retained_bytes(_parse_inputs),
+        ),
+    ]
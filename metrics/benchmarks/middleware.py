@@ -0,0 +1,63 @@
+__all__ = [
+    "benchmark_dispatch_without_middlewares",
+    "benchmark_dispatch_with_1_middleware",
+    "benchmark_dispatch_with_5_middlewares",
+    "benchmark_dispatch_with_10_middlewares",
+]
+
+from typing import Callable
+
+from argenta.command.models import Command, InputCommand
+from argenta.response import Response
+from argenta.router import Router
+
+from .entity import benchmarks
+
+DISPATCHES_COUNT: int = 10_000
+
+
+def _passthrough_middleware(response: Response, call_next: Callable[[Response], None]) -> None:
+    call_next(response)
+
+
+def _build_router(layers_count: int) -> Router:
+    router = Router()
+
+    @router.command(Command("test"))
+    def handler(_res: Response) -> None:
+        pass
+
+    for _ in range(layers_count):
+        router.add_middleware(_passthrough_middleware)
+    router.compile_middlewares()
+    return router
+
+
+INPUT_COMMAND: InputCommand = InputCommand.parse("test")
+ROUTERS: dict[int, Router] = {layers_count: _build_router(layers_count) for layers_count in (0, 1, 5, 10)}
+
+
+def _dispatch(layers_count: int) -> None:
+    router: Router = ROUTERS[layers_count]
+    for _ in range(DISPATCHES_COUNT):
+        router.finds_appropriate_handler(INPUT_COMMAND)
+
+
+@benchmarks.register(type_="middleware", description="10k dispatches, no middlewares")
+def benchmark_dispatch_without_middlewares() -> None:
+    _dispatch(0)
+
+
+@benchmarks.register(type_="middleware", description="10k dispatches, 1 middleware")
+def benchmark_dispatch_with_1_middleware() -> None:
+    _dispatch(1)
+
+
+@benchmarks.register(type_="middleware", description="10k dispatches, 5 middlewares")
+def benchmark_dispatch_with_5_middlewares() -> None:
+    _dispatch(5)
+
+
+@benchmarks.register(type_="middleware", description="10k dispatches, 10 middlewares")
+def benchmark_dispatch_with_10_middlewares() -> None:
+    _dispatch(10)
@@ -0,0 +1,75 @@
+__all__ = [
+    "benchmark_one_shot_from_argv",
+    "benchmark_interactive_from_stdin",
+]
+
+import os
+import subprocess
+import sys
+
+from .core.models import BenchmarkDirectory
+from .entity import benchmarks
+
+APP_SCRIPT: str = """
+import sys
+
+from argenta import App, Command, Orchestrator, Router
+from argenta.response import Response
+
+router = Router()
+
+
+@router.command(Command("noop"))
+def noop(_response: Response) -> None:
+    pass
+
+
+app = App()
+app.include_router(router)
+orchestrator = Orchestrator()
+if len(sys.argv) > 1:
+    sys.exit(orchestrator.run_once(app))
+orchestrator.start_polling(app)
+"""
+BENCHMARK_DIRECTORY: BenchmarkDirectory = BenchmarkDirectory(prefix="argenta-one-shot-")
+
+
+def _get_app_script_path() -> str:
+    return os.path.join(BENCHMARK_DIRECTORY.path, "app.py")
+
+
+def _setup() -> None:
+    BENCHMARK_DIRECTORY.create()
+    with open(_get_app_script_path(), "w", encoding="utf-8") as app_script_file:
+        app_script_file.write(APP_SCRIPT)
+
+
+def _run_app_script(args: list[str], stdin_input: str | None) -> None:
+    subprocess.run(
+        [sys.executable, _get_app_script_path(), *args],
+        input=stdin_input,
+        stdout=subprocess.DEVNULL,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, sys.path))},
+    )
+
+
+@benchmarks.register(
+    type_="one_shot",
+    description="One-shot command from argv, process start to exit",
+    setup=_setup,
+    teardown=BENCHMARK_DIRECTORY.remove,
+)
+def benchmark_one_shot_from_argv() -> None:
+    _run_app_script(["noop"], stdin_input=None)
+
+
+@benchmarks.register(
+    type_="one_shot",
+    description="Same command through the interactive loop fed by stdin",
+    setup=_setup,
+    teardown=BENCHMARK_DIRECTORY.remove,
+)
+def benchmark_interactive_from_stdin() -> None:
+    _run_app_script([], stdin_input="noop\nq\n")
@@ -0,0 +1,90 @@
+__all__ = [
+    "benchmark_zipf_workload_without_cache",
+    "benchmark_zipf_workload_with_cache",
+    "benchmark_zipf_workload_with_small_cache",
+]
+
+import random
+from itertools import accumulate
+from typing import Iterator, override
+
+from argenta import App
+from argenta.app import AutoCompleter
+from argenta.app.completion_schemas import CompletionSchemas
+from argenta.app.prefix_tree import PrefixTree
+from argenta.command import Flag, Flags
+from argenta.command.models import Command
+from argenta.response import Response
+from argenta.router import Router
+
+from .entity import benchmarks
+
+DISTINCT_COMMANDS_COUNT: int = 300
+WORKLOAD_LENGTH: int = 5000
+ZIPF_EXPONENT: float = 1.1
+
+
+class ReplayAutoCompleter(AutoCompleter):
+    def __init__(self, raw_commands: list[str]) -> None:
+        super().__init__()
+        self._raw_commands: Iterator[str] = iter(raw_commands)
+
+    @override
+    def initial_setup(
+            self,
+            all_commands: set[str],
+            triggers_prefix_tree: PrefixTree | None = None,
+            completion_schemas: CompletionSchemas | None = None,
+    ) -> None:
+        pass
+
+    @override
+    def prompt(self, prompt_text: object = ">>> ") -> str:
+        return next(self._raw_commands)
+
+
+def _generate_zipf_workload() -> list[str]:
+    rnd = random.Random(2026)
+    distinct_commands = [
+        f"cmd{i % 10} --host 10.0.{i}.1 --port {8000 + i} --mode 'profile {i}' -v"
+        for i in range(DISTINCT_COMMANDS_COUNT)
+    ]
+    weights = [1 / rank ** ZIPF_EXPONENT for rank in range(1, DISTINCT_COMMANDS_COUNT + 1)]
+    cumulative_weights = list(accumulate(weights))
+    return rnd.choices(distinct_commands, cum_weights=cumulative_weights, k=WORKLOAD_LENGTH) + ["q"]
+
+
+ZIPF_WORKLOAD: list[str] = _generate_zipf_workload()
+
+
+def _replay_workload(parse_cache_size: int | None) -> None:
+    app = App(
+        override_system_messages=True,
+        autocompleter=ReplayAutoCompleter(ZIPF_WORKLOAD),
+        printer=lambda _text: None,
+        parse_cache_size=parse_cache_size,
+    )
+    router = Router()
+
+    for i in range(10):
+        @router.command(Command(f"cmd{i}", flags=Flags([Flag("host"), Flag("port"), Flag("mode"), Flag("v", prefix="-")])))
+        def handler(_res: Response) -> None:
+            pass
+
+    app.include_router(router)
+    app._run_polling()
+
+
+@benchmarks.register(type_="parse_cache", description="Zipf workload, 5000 commands, no cache")
+def benchmark_zipf_workload_without_cache() -> None:
+    _replay_workload(parse_cache_size=None)
+
+
+@benchmarks.register(type_="parse_cache", description="Zipf workload, 5000 commands, cache of 512")
+def benchmark_zipf_workload_with_cache() -> None:
+    _replay_workload(parse_cache_size=512)
+
+
+@benchmarks.register(type_="parse_cache", description="Zipf workload, 5000 commands, cache of 32")
+def benchmark_zipf_workload_with_small_cache() -> None:
+    _replay_workload(parse_cache_size=32)
@@ -0,0 +1,93 @@
+__all__ = [
+    "benchmark_plugin_discovery_without_manifest",
+    "benchmark_plugin_discovery_with_manifest",
+]
+
+import os
+import subprocess
+import sys
+from tempfile import mkdtemp
+
+from .core.models import BenchmarkDirectory
+from .entity import benchmarks
+
+PLUGINS_COUNT: int = 30
+
+PLUGIN_MODULE: str = """
+from argenta import Command, Router
+from argenta.response import Response
+
+HEAVY_DEPENDENCY = sorted(str(i) for i in range(20_000))
+
+router = Router(title="Plugin {index}:")
+
+
+@router.command(Command("plugin{index}", description="Synthetic plugin command {index}", aliases=["p{index}"]))
+def handler(_response: Response) -> None:
+    pass
+"""
+APP_SCRIPT: str = """
+import sys
+
+from argenta import App
+from argenta.app.plugin_manifest import PluginManifestCache
+
+app = App(override_system_messages=True, disable_banners=True)
+app.include_entry_point_routers("argenta_benchmark.routers", manifest_cache=PluginManifestCache(sys.argv[1]))
+app.execute("plugin0")
+"""
+
+BENCHMARK_DIRECTORY: BenchmarkDirectory = BenchmarkDirectory(prefix="argenta-plugins-")
+
+
+def _get_site_directory() -> str:
+    return os.path.join(BENCHMARK_DIRECTORY.path, "site")
+
+
+def _get_manifest_directory() -> str:
+    return os.path.join(BENCHMARK_DIRECTORY.path, "manifests")
+
+
+def _setup() -> None:
+    BENCHMARK_DIRECTORY.create()
+    site_directory: str = _get_site_directory()
+    os.mkdir(site_directory)
+    for index in range(PLUGINS_COUNT):
+        with open(os.path.join(site_directory, f"argenta_plugin_{index}.py"), "w", encoding="utf-8") as module_file:
+            module_file.write(PLUGIN_MODULE.replace("{index}", str(index)))
+        dist_info_directory: str = os.path.join(site_directory, f"argenta_plugin_{index}-1.0.dist-info")
+        os.mkdir(dist_info_directory)
+        with open(os.path.join(dist_info_directory, "METADATA"), "w", encoding="utf-8") as metadata_file:
+            metadata_file.write(f"Metadata-Version: 2.1\nName: argenta-plugin-{index}\nVersion: 1.0\n")
+        with open(os.path.join(dist_info_directory, "entry_points.txt"), "w", encoding="utf-8") as entry_points_file:
+            entry_points_file.write(f"[argenta_benchmark.routers]\nplugin{index} = argenta_plugin_{index}:router\n")
+    _run_app_script(_get_manifest_directory())
+
+
+def _run_app_script(manifest_directory: str) -> None:
+    subprocess.run(
+        [sys.executable, "-c", APP_SCRIPT, manifest_directory],
+        stdout=subprocess.DEVNULL,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [_get_site_directory(), *sys.path]))},
+    )
+
+
+@benchmarks.register(
+    type_="plugin_manifest",
+    description="Discover 30 heavy plugins without manifest, one command",
+    setup=_setup,
+    teardown=BENCHMARK_DIRECTORY.remove,
+)
+def benchmark_plugin_discovery_without_manifest() -> None:
+    _run_app_script(mkdtemp(dir=BENCHMARK_DIRECTORY.path))
+
+
+@benchmarks.register(
+    type_="plugin_manifest",
+    description="Discover 30 heavy plugins from cached manifest, one command",
+    setup=_setup,
+    teardown=BENCHMARK_DIRECTORY.remove,
+)
+def benchmark_plugin_discovery_with_manifest() -> None:
+    _run_app_script(_get_manifest_directory())
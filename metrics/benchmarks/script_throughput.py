@@ -0,0 +1,111 @@
+__all__ = [
+    "ScriptThroughputResult",
+    "measure_script_throughput",
+    "benchmark_run_script",
+    "benchmark_execute_many",
+    "benchmark_interactive_loop_with_piped_commands",
+]
+
+import io
+import os
+import time
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from typing import Callable, Iterator
+from unittest.mock import patch
+
+from argenta import App
+from argenta.command import Command
+from argenta.response import Response
+from argenta.router import Router
+
+from .entity import benchmarks
+
+SCRIPT_LENGTHS: tuple[int, ...] = (1_000, 10_000, 100_000)
+BENCHMARK_SCRIPT_LENGTH: int = 1_000
+SCRIPT_COMMANDS: tuple[str, ...] = ("noop", "echo --text hello", "noop --unknown", "# comment")
+
+
+@dataclass(frozen=True, slots=True)
+class ScriptThroughputResult:
+    description: str
+    commands_count: int
+    total_time: float  # in ms
+    commands_per_second: int
+
+
+def _create_app() -> App:
+    router = Router(disable_redirect_stdout=True)
+
+    @router.command(Command("noop"))
+    def noop(_response: Response) -> None:  # pyright: ignore[reportUnusedFunction]
+        pass
+
+    @router.command(Command("echo"))
+    def echo(response: Response) -> None:  # pyright: ignore[reportUnusedFunction]
+        print(response.input_flags)
+
+    app = App(override_system_messages=True, printer=print, disable_banners=True)
+    app.include_router(router)
+    return app
+
+
+def _iter_script_lines(commands_count: int) -> Iterator[str]:
+    for index in range(commands_count):
+        yield SCRIPT_COMMANDS[index % len(SCRIPT_COMMANDS)] + "\n"
+
+
+def _run_script(commands_count: int) -> None:
+    _create_app().run_script(_iter_script_lines(commands_count))
+
+
+def _execute_many(commands_count: int) -> None:
+    app: App = _create_app()
+    raw_commands: list[str] = ["noop"] * commands_count
+    for _ in app.execute_many(raw_commands):
+        pass
+
+
+def _run_interactive_loop(commands_count: int) -> None:
+    lines: Iterator[str] = iter([*(line.rstrip("\n") for line in _iter_script_lines(commands_count)), "q"])
+    with patch("builtins.input", lambda _prompt="": next(lines)):
+        _create_app()._run_polling()
+
+
+def _measure(description: str, commands_count: int, runner: Callable[[int], None]) -> ScriptThroughputResult:
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        start = time.perf_counter()
+        runner(commands_count)
+        total_time = time.perf_counter() - start
+    return ScriptThroughputResult(
+        description=description,
+        commands_count=commands_count,
+        total_time=round(total_time * 1000, 4),
+        commands_per_second=int(commands_count / total_time),
+    )
+
+
+def measure_script_throughput() -> list[ScriptThroughputResult]:
+    results: list[ScriptThroughputResult] = []
+    for commands_count in SCRIPT_LENGTHS:
+        results.append(_measure("App.run_script", commands_count, _run_script))
+        results.append(_measure("Interactive loop with piped input", commands_count, _run_interactive_loop))
+        results.append(_measure("App.execute_many, no-op only", commands_count, _execute_many))
+    return results
+
+
+@benchmarks.register(type_="script", description=f"App.run_script with {BENCHMARK_SCRIPT_LENGTH} commands")
+def benchmark_run_script() -> None:
+    with redirect_stdout(io.StringIO()):
+        _run_script(BENCHMARK_SCRIPT_LENGTH)
+
+
+@benchmarks.register(type_="script", description=f"App.execute_many with {BENCHMARK_SCRIPT_LENGTH} no-op commands")
+def benchmark_execute_many() -> None:
+    _execute_many(BENCHMARK_SCRIPT_LENGTH)
+
+
+@benchmarks.register(type_="script", description=f"Interactive loop with {BENCHMARK_SCRIPT_LENGTH} piped commands")
+def benchmark_interactive_loop_with_piped_commands() -> None:
+    with redirect_stdout(io.StringIO()):
+        _run_interactive_loop(BENCHMARK_SCRIPT_LENGTH)
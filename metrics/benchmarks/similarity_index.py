@@ -0,0 +1,182 @@
+__all__ = [
+    "SimilarityQualityResult",
+    "measure_similarity_quality",
+    "benchmark_difflib_100_triggers",
+    "benchmark_trigram_index_100_triggers",
+    "benchmark_difflib_10k_triggers",
+    "benchmark_trigram_index_10k_triggers",
+    "benchmark_trigram_index_100k_triggers",
+    "benchmark_build_trigram_index_100k_triggers",
+]
+
+import difflib
+import random
+import time
+from dataclasses import dataclass
+from functools import cache
+from typing import Callable
+
+from argenta.app.similarity_index import TrigramIndex
+
+from .entity import benchmarks
+
+SYLLABLES: tuple[str, ...] = (
+    "ka", "lo", "mi", "ne", "ru", "sta", "po", "ver", "tion", "de", "ploy", "get", "set", "list", "sync", "ex",
+)
+QUALITY_QUERIES_COUNT: int = 50
+
+
+def _generate_triggers(triggers_count: int, seed: int) -> list[str]:
+    rnd = random.Random(seed)
+    triggers: set[str] = set()
+    while len(triggers) < triggers_count:
+        triggers.add("".join(rnd.choice(SYLLABLES) for _ in range(rnd.randint(2, 5))))
+    return sorted(triggers)
+
+
+def _make_typo(trigger: str, rnd: random.Random) -> str:
+    position = rnd.randrange(len(trigger))
+    match rnd.randrange(3):
+        case 0:
+            return trigger[:position] + trigger[position + 1:]
+        case 1:
+            return trigger[:position] + rnd.choice("aeiostr") + trigger[position:]
+        case _:
+            return trigger[:position] + rnd.choice("aeiostr") + trigger[position + 1:]
+
+
+def _build_index(triggers: list[str]) -> TrigramIndex:
+    index = TrigramIndex()
+    index.build(triggers)
+    return index
+
+
+TRIGGERS_COUNTS: tuple[int, ...] = (100, 10_000, 100_000)
+
+
+@cache
+def _get_triggers(triggers_count: int) -> list[str]:
+    return _generate_triggers(triggers_count, seed=triggers_count)
+
+
+@cache
+def _get_index(triggers_count: int) -> TrigramIndex:
+    return _build_index(_get_triggers(triggers_count))
+
+
+@cache
+def _get_typo(triggers_count: int) -> str:
+    triggers: list[str] = _get_triggers(triggers_count)
+    return _make_typo(triggers[len(triggers) // 2], random.Random(triggers_count))
+
+
+def _setup_fixtures(triggers_count: int) -> Callable[[], None]:
+    def setup() -> None:
+        _get_index(triggers_count)
+        _get_typo(triggers_count)
+
+    return setup
+
+
+@dataclass(frozen=True, slots=True)
+class SimilarityQualityResult:
+    triggers_count: int
+    queries_count: int
+    agreements_with_difflib: int
+    hits_of_original_trigger: int
+    difflib_hits_of_original_trigger: int
+    index_total_time: float  # in seconds
+    difflib_total_time: float  # in seconds
+
+    @property
+    def agreement_rate(self) -> float:
+        return round(100 * self.agreements_with_difflib / self.queries_count, 1)
+
+    @property
+    def index_avg_time(self) -> float:  # in ms
+        return round(1000 * self.index_total_time / self.queries_count, 4)
+
+    @property
+    def difflib_avg_time(self) -> float:  # in ms
+        return round(1000 * self.difflib_total_time / self.queries_count, 4)
+
+
+def measure_similarity_quality() -> list[SimilarityQualityResult]:
+    results: list[SimilarityQualityResult] = []
+    for triggers_count in TRIGGERS_COUNTS:
+        triggers = _get_triggers(triggers_count)
+        rnd = random.Random(triggers_count)
+        index = _get_index(triggers_count)
+        agreements = hits = difflib_hits = 0
+        index_total_time = difflib_total_time = 0.0
+        for trigger in rnd.sample(triggers, QUALITY_QUERIES_COUNT):
+            typo = _make_typo(trigger, rnd)
+
+            start = time.perf_counter()
+            expected = difflib.get_close_matches(typo, triggers, n=1)
+            difflib_total_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            actual = index.get_most_similar(typo, limit=1)
+            index_total_time += time.perf_counter() - start
+
+            agreements += actual == expected
+            hits += actual == [trigger]
+            difflib_hits += expected == [trigger]
+        results.append(
+            SimilarityQualityResult(
+                triggers_count=triggers_count,
+                queries_count=QUALITY_QUERIES_COUNT,
+                agreements_with_difflib=agreements,
+                hits_of_original_trigger=hits,
+                difflib_hits_of_original_trigger=difflib_hits,
+                index_total_time=index_total_time,
+                difflib_total_time=difflib_total_time,
+            )
+        )
+    return results
+
+
+@benchmarks.register(
+    type_="similarity_index", description="difflib.get_close_matches (100 triggers)", setup=_setup_fixtures(100)
+)
+def benchmark_difflib_100_triggers() -> None:
+    difflib.get_close_matches(_get_typo(100), _get_triggers(100), n=1)
+
+
+@benchmarks.register(
+    type_="similarity_index", description="TrigramIndex.get_most_similar (100 triggers)", setup=_setup_fixtures(100)
+)
+def benchmark_trigram_index_100_triggers() -> None:
+    _get_index(100).get_most_similar(_get_typo(100))
+
+
+@benchmarks.register(
+    type_="similarity_index", description="difflib.get_close_matches (10k triggers)", setup=_setup_fixtures(10_000)
+)
+def benchmark_difflib_10k_triggers() -> None:
+    difflib.get_close_matches(_get_typo(10_000), _get_triggers(10_000), n=1)
+
+
+@benchmarks.register(
+    type_="similarity_index", description="TrigramIndex.get_most_similar (10k triggers)", setup=_setup_fixtures(10_000)
+)
+def benchmark_trigram_index_10k_triggers() -> None:
+    _get_index(10_000).get_most_similar(_get_typo(10_000))
+
+
+# difflib over 100k triggers takes seconds per query, it is compared only in measure_similarity_quality
+@benchmarks.register(
+    type_="similarity_index",
+    description="TrigramIndex.get_most_similar (100k triggers)",
+    setup=_setup_fixtures(100_000),
+)
+def benchmark_trigram_index_100k_triggers() -> None:
+    _get_index(100_000).get_most_similar(_get_typo(100_000))
+
+
+@benchmarks.register(
+    type_="similarity_index", description="Build TrigramIndex over 100k triggers", setup=_setup_fixtures(100_000)
+)
+def benchmark_build_trigram_index_100k_triggers() -> None:
+    _build_index(_get_triggers(100_000))
@@ -0,0 +1,96 @@
+__all__ = [
+    "benchmark_startup_without_snapshot",
+    "benchmark_startup_cold_snapshot",
+    "benchmark_startup_warm_snapshot",
+]
+
+from tempfile import mkdtemp
+
+from argenta import App
+from argenta.app import StartupSnapshot
+from argenta.command import Command, Flag, Flags
+from argenta.response import Response
+from argenta.router import Router
+
+from .core.models import BenchmarkDirectory
+from .entity import benchmarks
+
+COMMANDS_COUNT: int = 10_000
+ROUTERS_COUNT: int = 10
+
+SNAPSHOT_DIRECTORY: BenchmarkDirectory = BenchmarkDirectory(prefix="argenta-startup-snapshot-")
+ROUTERS: list[Router] = []
+
+
+def _noop_handler(_response: Response) -> None:
+    pass
+
+
+def _build_routers() -> list[Router]:
+    routers: list[Router] = []
+    for i in range(ROUTERS_COUNT):
+        router = Router(title=f"Router {i}")
+        router.register_many(
+            (
+                Command(
+                    f"cmd{i}_{j}",
+                    description=f"Synthetic command {j}",
+                    aliases={f"c{i}_{j}"},
+                    flags=Flags([Flag("mode", possible_values=["fast", "slow"]), Flag("verbose")]),
+                ),
+                _noop_handler,
+            )
+            for j in range(COMMANDS_COUNT // ROUTERS_COUNT)
+        )
+        routers.append(router)
+    return routers
+
+
+def _start_app(startup_snapshot: StartupSnapshot | None) -> None:
+    app = App(
+        override_system_messages=True,
+        disable_banners=True,
+        printer=lambda _: None,
+        startup_snapshot=startup_snapshot,
+    )
+    app.include_routers(*ROUTERS)
+    app._pre_cycle_setup()
+
+
+def _get_warm_snapshot() -> StartupSnapshot:
+    return StartupSnapshot(SNAPSHOT_DIRECTORY.path, name="benchmark")
+
+
+def _setup() -> None:
+    SNAPSHOT_DIRECTORY.create()
+    ROUTERS[:] = _build_routers()
+    _start_app(_get_warm_snapshot())
+
+
+def _teardown() -> None:
+    ROUTERS.clear()
+    SNAPSHOT_DIRECTORY.remove()
+
+
+@benchmarks.register(
+    type_="startup_snapshot", description="10k commands, no snapshot", setup=_setup, teardown=_teardown
+)
+def benchmark_startup_without_snapshot() -> None:
+    _start_app(None)
+
+
+@benchmarks.register(
+    type_="startup_snapshot",
+    description="10k commands, cold snapshot: compiled and stored",
+    setup=_setup,
+    teardown=_teardown,
+)
+def benchmark_startup_cold_snapshot() -> None:
+    _start_app(StartupSnapshot(mkdtemp(dir=SNAPSHOT_DIRECTORY.path), name="benchmark"))
+
+
+@benchmarks.register(
+    type_="startup_snapshot", description="10k commands, warm snapshot: loaded", setup=_setup, teardown=_teardown
+)
+def benchmark_startup_warm_snapshot() -> None:
+    _start_app(_get_warm_snapshot())
@@ -0,0 +1,77 @@
+__all__ = [
+    "benchmark_parse_subcommand_in_10k_commands",
+    "benchmark_dispatch_subcommand_in_10k_commands",
+    "benchmark_render_group_help_in_10k_commands",
+    "benchmark_render_full_help_in_10k_commands",
+    "benchmark_complete_group_in_10k_commands",
+]
+
+from functools import cache
+
+from argenta.app import App
+from argenta.app.presentation.renderers import PlainRenderer
+from argenta.command import Command, Flag, Flags
+from argenta.response import Response
+from argenta.router import Router
+
+from .entity import benchmarks
+
+GROUPS_COUNT: int = 100
+GROUP_COMMANDS_COUNT: int = 100
+
+
+@cache
+def _get_app_with_subcommands() -> App:
+    app = App(override_system_messages=True, printer=lambda _: None, disable_banners=True)
+
+    for i in range(GROUPS_COUNT):
+        router = Router(title=f"Group {i}:")
+        for j in range(GROUP_COMMANDS_COUNT):
+            @router.command(Command(f"cmd{j}", flags=Flags([Flag("force")])))
+            def handler(_res: Response) -> None:
+                pass
+        app.include_router(router, prefix=f"group{i} sub")
+
+    app._pre_cycle_setup()
+    return app
+
+
+SUBCOMMAND: str = "group42 sub cmd42 --force"
+GROUP: str = "group42"
+
+
+def _setup() -> None:
+    _get_app_with_subcommands()
+
+
+@benchmarks.register(type_="subcommands", description="Parse 3-level subcommand in 10k commands", setup=_setup)
+def benchmark_parse_subcommand_in_10k_commands() -> None:
+    _get_app_with_subcommands()._parse_input_command(SUBCOMMAND)
+
+
+@benchmarks.register(
+    type_="subcommands", description="Parse and dispatch 3-level subcommand in 10k commands", setup=_setup
+)
+def benchmark_dispatch_subcommand_in_10k_commands() -> None:
+    _get_app_with_subcommands()._run_raw_command(SUBCOMMAND)
+
+
+@benchmarks.register(type_="subcommands", description="Render help of one group (100 of 10k commands)", setup=_setup)
+def benchmark_render_group_help_in_10k_commands() -> None:
+    app = _get_app_with_subcommands()
+    group_routers = app.registered_routers.get_group(GROUP)
+    PlainRenderer.render_command_groups_description(
+        app._description_message_generator, group_routers  # type: ignore[arg-type]
+    )
+
+
+@benchmarks.register(type_="subcommands", description="Render help of all 10k commands", setup=_setup)
+def benchmark_render_full_help_in_10k_commands() -> None:
+    app = _get_app_with_subcommands()
+    PlainRenderer.render_command_groups_description(app._description_message_generator, app.registered_routers)
+
+
+@benchmarks.register(type_="subcommands", description="Complete subcommands of one group in 10k commands", setup=_setup)
+def benchmark_complete_group_in_10k_commands() -> None:
+    prefix_tree = _get_app_with_subcommands()._triggers_prefix_tree
+    prefix_tree.get_keys_with_prefix(f"{GROUP} sub cmd4")  # type: ignore[union-attr]
@@ -0,0 +1,61 @@
+__all__ = [
+    "benchmark_build_prefix_tree_with_50k_triggers",
+    "benchmark_resolve_unique_prefix_in_50k_triggers",
+    "benchmark_linear_scan_unique_prefix_in_50k_triggers",
+    "benchmark_count_ambiguous_prefix_in_50k_triggers",
+    "benchmark_complete_prefix_in_50k_triggers",
+    "benchmark_linear_scan_complete_prefix_in_50k_triggers",
+]
+
+from functools import cache
+
+from argenta.app.prefix_tree import PrefixTree
+
+from .entity import benchmarks
+
+TRIGGERS_COUNT: int = 50_000
+
+TRIGGERS: list[str] = [f"command_{i:05d}" for i in range(TRIGGERS_COUNT)]
+UNIQUE_PREFIX: str = "command_31415"
+AMBIGUOUS_PREFIX: str = "command_3"
+COMPLETION_PREFIX: str = "command_314"
+
+
+@cache
+def _get_prefix_tree() -> PrefixTree:
+    return PrefixTree(TRIGGERS)
+
+
+def _setup() -> None:
+    _get_prefix_tree()
+
+
+@benchmarks.register(type_="trigger_prefix_tree", description="Build prefix tree over 50k triggers")
+def benchmark_build_prefix_tree_with_50k_triggers() -> None:
+    PrefixTree(TRIGGERS)
+
+
+@benchmarks.register(type_="trigger_prefix_tree", description="Resolve unique prefix in 50k triggers (tree)", setup=_setup)
+def benchmark_resolve_unique_prefix_in_50k_triggers() -> None:
+    _get_prefix_tree().resolve_unique_prefix(UNIQUE_PREFIX)
+
+
+@benchmarks.register(type_="trigger_prefix_tree", description="Resolve unique prefix in 50k triggers (linear scan)")
+def benchmark_linear_scan_unique_prefix_in_50k_triggers() -> None:
+    matches = [trigger for trigger in TRIGGERS if trigger.startswith(UNIQUE_PREFIX)]
+    _ = matches[0] if len(matches) == 1 else None
+
+
+@benchmarks.register(type_="trigger_prefix_tree", description="Count 10k ambiguous matches in 50k triggers (tree)", setup=_setup)
+def benchmark_count_ambiguous_prefix_in_50k_triggers() -> None:
+    _get_prefix_tree().count_keys_with_prefix(AMBIGUOUS_PREFIX)
+
+
+@benchmarks.register(type_="trigger_prefix_tree", description="Complete prefix with 100 matches in 50k triggers (tree)", setup=_setup)
+def benchmark_complete_prefix_in_50k_triggers() -> None:
+    _get_prefix_tree().get_keys_with_prefix(COMPLETION_PREFIX)
+
+
+@benchmarks.register(type_="trigger_prefix_tree", description="Complete prefix with 100 matches in 50k triggers (linear scan)")
+def benchmark_linear_scan_complete_prefix_in_50k_triggers() -> None:
+    sorted(trigger for trigger in TRIGGERS if trigger.startswith(COMPLETION_PREFIX))
@@ -0,0 +1,67 @@
+__all__ = [
+    "benchmark_structuring_untyped_flags",
+    "benchmark_structuring_typed_flags",
+    "benchmark_handler_reparses_untyped_flags",
+    "benchmark_handler_reads_typed_flags",
+]
+
+from datetime import timedelta
+
+from argenta.command import Command, Flags, InputFlags
+from argenta.command.flag import Flag, InputFlag
+from argenta.command.flag.converters import to_duration
+from argenta.router import Router
+
+from .entity import benchmarks
+
+STRUCTURINGS_COUNT: int = 10_000
+HELPERS_COUNT: int = 3
+
+UNTYPED_COMMAND: Command = Command("serve", flags=Flags([Flag("port"), Flag("ratio"), Flag("timeout")]))
+TYPED_COMMAND: Command = Command("serve", flags=Flags([
+    Flag("port", type=int),
+    Flag("ratio", type=float),
+    Flag("timeout", type=timedelta),
+]))
+
+
+def _input_flags() -> InputFlags:
+    return InputFlags([
+        InputFlag("port", input_value="8080"),
+        InputFlag("ratio", input_value="0.75"),
+        InputFlag("timeout", input_value="1m30s"),
+    ])
+
+
+def _structure(command: Command) -> list[InputFlags]:
+    return [
+        Router._structuring_input_flags(command, _input_flags()).input_flags for _ in range(STRUCTURINGS_COUNT)
+    ]
+
+
+@benchmarks.register(type_="typed_flags", description="10k validations of 3 untyped flags")
+def benchmark_structuring_untyped_flags() -> None:
+    _structure(UNTYPED_COMMAND)
+
+
+@benchmarks.register(type_="typed_flags", description="10k validations with conversion of 3 typed flags")
+def benchmark_structuring_typed_flags() -> None:
+    _structure(TYPED_COMMAND)
+
+
+@benchmarks.register(type_="typed_flags", description="10k untyped dispatches, values parsed by 3 helpers each")
+def benchmark_handler_reparses_untyped_flags() -> None:
+    for input_flags in _structure(UNTYPED_COMMAND):
+        for _ in range(HELPERS_COUNT):
+            int(input_flags.get_flag_by_name("port").input_value)
+            float(input_flags.get_flag_by_name("ratio").input_value)
+            to_duration(input_flags.get_flag_by_name("timeout").input_value)
+
+
+@benchmarks.register(type_="typed_flags", description="10k typed dispatches, values read by 3 helpers each")
+def benchmark_handler_reads_typed_flags() -> None:
+    for input_flags in _structure(TYPED_COMMAND):
+        for _ in range(HELPERS_COUNT):
+            input_flags.get_value("port")
+            input_flags.get_value("ratio")
+            input_flags.get_value("timeout")
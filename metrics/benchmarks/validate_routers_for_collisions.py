@@ -3,7 +3,11 @@ __all__ = [
     "benchmark_many_routers",
     "benchmark_many_commands_per_router",
     "benchmark_many_aliases_per_command",
-    "benchmark_extreme_routers"
+    "benchmark_extreme_routers",
+    "benchmark_10k_commands_decorator",
+    "benchmark_10k_commands_register_many",
+    "benchmark_100k_commands_decorator",
+    "benchmark_100k_commands_register_many",
 ]
 
 from argenta import App
@@ -100,3 +104,48 @@ def benchmark_extreme_routers() -> None:
 
     app._setup_system_router()
     app._validate_routers_for_collisions()
+
+
+def _noop_handler(_res: Response) -> None:
+    pass
+
+
+def _run_large_registration(commands_count: int, *, is_bulk: bool) -> None:
+    app = App(override_system_messages=True)
+    commands_per_router = commands_count // 10
+
+    for i in range(10):
+        router = Router()
+        commands = [
+            Command(f'cmd{i}_{j}', aliases={f'a{i}_{j}', f'b{i}_{j}'}) for j in range(commands_per_router)
+        ]
+        if is_bulk:
+            router.register_many((command, _noop_handler) for command in commands)
+        else:
+            for command in commands:
+                router.command(command)(_noop_handler)
+
+        app.include_router(router)
+
+    app._setup_system_router()
+    app._validate_routers_for_collisions()
+
+
+@benchmarks.register(type_="validate_routers_for_collisions", description="10k commands, 2 aliases each, decorator")
+def benchmark_10k_commands_decorator() -> None:
+    _run_large_registration(10_000, is_bulk=False)
+
+
+@benchmarks.register(type_="validate_routers_for_collisions", description="10k commands, 2 aliases each, register_many")
+def benchmark_10k_commands_register_many() -> None:
+    _run_large_registration(10_000, is_bulk=True)
+
+
+@benchmarks.register(type_="validate_routers_for_collisions", description="100k commands, 2 aliases each, decorator")
+def benchmark_100k_commands_decorator() -> None:
+    _run_large_registration(100_000, is_bulk=False)
+
+
+@benchmarks.register(type_="validate_routers_for_collisions", description="100k commands, 2 aliases each, register_many")
+def benchmark_100k_commands_register_many() -> None:
+    _run_large_registration(100_000, is_bulk=True)
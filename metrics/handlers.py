@@ -12,6 +12,10 @@ from argenta.response import Response
 from argenta.router import Router
 from .benchmarks.core.models import BenchmarkGroupResult
 from .benchmarks.entity import benchmarks as registered_benchmarks
+from .benchmarks.history_startup import measure_history_startup
+from .benchmarks.memory_footprint import measure_memory_footprints
+from .benchmarks.script_throughput import measure_script_throughput
+from .benchmarks.similarity_index import measure_similarity_quality
 from .services.report_table_generator import ReportTableGenerator
 from .services.system_info_reader import get_system_info
 from .services.diagram_generator import DiagramGenerator
@@ -106,6 +110,34 @@ def run_type_handler(response: Response) -> None:
     console.print(report_generator.generate_benchmark_report_table(benchmark_group_result))
 
 
+@router.command(Command("memory-footprint", description="Print bytes per registered command and per parsed input"))
+def memory_footprint_handler(_: Response) -> None:
+    console.print("[dim]Measuring retained memory with tracemalloc...[/dim]\n")
+    console.print(ReportTableGenerator.generate_memory_footprint_header())
+    console.print(ReportTableGenerator.generate_memory_footprint_table(measure_memory_footprints()))
+
+
+@router.command(Command("history-startup", description="Compare history loading on files up to 500 MB"))
+def history_startup_handler(_: Response) -> None:
+    console.print("[dim]Writing temporary history files of 5, 50 and 500 MB...[/dim]\n")
+    console.print(ReportTableGenerator.generate_history_startup_header())
+    console.print(ReportTableGenerator.generate_history_startup_table(measure_history_startup()))
+
+
+@router.command(Command("similarity-quality", description="Compare the similarity index with difflib on typos"))
+def similarity_quality_handler(_: Response) -> None:
+    console.print("[dim]Querying 100, 10k and 100k triggers, difflib at 100k takes about a minute...[/dim]\n")
+    console.print(ReportTableGenerator.generate_similarity_quality_header())
+    console.print(ReportTableGenerator.generate_similarity_quality_table(measure_similarity_quality()))
+
+
+@router.command(Command("script-throughput", description="Compare commands per second of scripts, execute_many and piped input"))
+def script_throughput_handler(_: Response) -> None:
+    console.print("[dim]Running scripts of 1k, 10k and 100k commands...[/dim]\n")
+    console.print(ReportTableGenerator.generate_script_throughput_header())
+    console.print(ReportTableGenerator.generate_script_throughput_table(measure_script_throughput()))
+
+
 @router.command(Command("release-generate", description="Generate release report"))
 def release_generate_handler(_: Response) -> None:
     lib_version = version("argenta")
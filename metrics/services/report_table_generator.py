@@ -3,6 +3,10 @@ from rich.table import Table
 from rich.text import Text
 
 from ..benchmarks.core.models import BenchmarkGroupResult
+from ..benchmarks.history_startup import HistoryStartupResult
+from ..benchmarks.memory_footprint import MemoryFootprintResult
+from ..benchmarks.script_throughput import ScriptThroughputResult
+from ..benchmarks.similarity_index import SimilarityQualityResult
 from metrics.services.system_info_reader import SystemInfo
 
 
@@ -41,6 +45,91 @@ class ReportTableGenerator:
                            style="bold magenta")
         return Panel(header_text, expand=False, border_style="magenta")
 
+    @staticmethod
+    def generate_memory_footprint_table(memory_footprint_results: list[MemoryFootprintResult]) -> Table:
+        table = Table(show_header=True, header_style="bold cyan", border_style="blue", show_lines=True)
+        table.add_column("Description", style="dim")
+        table.add_column("Bytes Per Unit", justify="right", style="bold yellow")
+        table.add_column("Total Bytes", justify="right", style="bold yellow")
+
+        for result in memory_footprint_results:
+            table.add_row(result.description, str(result.bytes_per_unit), str(result.total_bytes))
+        return table
+
+    @staticmethod
+    def generate_memory_footprint_header() -> Panel:
+        header_text = Text("MEMORY FOOTPRINT ; TRACEMALLOC ; RETAINED BYTES", style="bold magenta")
+        return Panel(header_text, expand=False, border_style="magenta")
+
+    @staticmethod
+    def generate_similarity_quality_table(similarity_quality_results: list[SimilarityQualityResult]) -> Table:
+        table = Table(show_header=True, header_style="bold cyan", border_style="blue", show_lines=True)
+        table.add_column("Triggers", style="dim")
+        table.add_column("Agreement With difflib", justify="right", style="bold yellow")
+        table.add_column("Original Found (index / difflib)", justify="right", style="bold yellow")
+        table.add_column("Avg Time Index", justify="right", style="bold yellow")
+        table.add_column("Avg Time difflib", justify="right", style="bold yellow")
+
+        for result in similarity_quality_results:
+            table.add_row(
+                str(result.triggers_count),
+                f"{result.agreement_rate}%",
+                f"{result.hits_of_original_trigger} / {result.difflib_hits_of_original_trigger}"
+                f" of {result.queries_count}",
+                str(result.index_avg_time),
+                str(result.difflib_avg_time),
+            )
+        return table
+
+    @staticmethod
+    def generate_similarity_quality_header() -> Panel:
+        header_text = Text("SIMILARITY INDEX QUALITY ; ONE-TYPO QUERIES ; ALL TIME IN MS", style="bold magenta")
+        return Panel(header_text, expand=False, border_style="magenta")
+
+    @staticmethod
+    def generate_history_startup_table(history_startup_results: list[HistoryStartupResult]) -> Table:
+        table = Table(show_header=True, header_style="bold cyan", border_style="blue", show_lines=True)
+        table.add_column("Description", style="dim")
+        table.add_column("File Size MB", justify="right", style="bold yellow")
+        table.add_column("Loaded Entries", justify="right", style="bold yellow")
+        table.add_column("Load Time", justify="right", style="bold yellow")
+
+        for result in history_startup_results:
+            table.add_row(
+                result.description,
+                str(round(result.file_size / 1024 ** 2, 1)),
+                str(result.loaded_entries),
+                str(result.load_time),
+            )
+        return table
+
+    @staticmethod
+    def generate_history_startup_header() -> Panel:
+        header_text = Text("HISTORY STARTUP ; LOAD OF HISTORY FILE ; ALL TIME IN MS", style="bold magenta")
+        return Panel(header_text, expand=False, border_style="magenta")
+
+    @staticmethod
+    def generate_script_throughput_table(script_throughput_results: list[ScriptThroughputResult]) -> Table:
+        table = Table(show_header=True, header_style="bold cyan", border_style="blue", show_lines=True)
+        table.add_column("Description", style="dim")
+        table.add_column("Script Lines", justify="right", style="bold yellow")
+        table.add_column("Total Time", justify="right", style="bold yellow")
+        table.add_column("Commands Per Second", justify="right", style="bold yellow")
+
+        for result in script_throughput_results:
+            table.add_row(
+                result.description,
+                str(result.commands_count),
+                str(result.total_time),
+                str(result.commands_per_second),
+            )
+        return table
+
+    @staticmethod
+    def generate_script_throughput_header() -> Panel:
+        header_text = Text("SCRIPT THROUGHPUT ; NO-OP HANDLERS ; ALL TIME IN MS", style="bold magenta")
+        return Panel(header_text, expand=False, border_style="magenta")
+
     def generate_system_info_table(self) -> Table:
         if self._cached_system_info_table is not None:
             return self._cached_system_info_table
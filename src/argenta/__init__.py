@@ -1,6 +1,31 @@
-from argenta.app.models import App as App
-from argenta.command.models import Command as Command
-from argenta.data_bridge.entity import DataBridge as DataBridge
-from argenta.orchestrator.entity import Orchestrator as Orchestrator
-from argenta.response.entity import Response as Response
-from argenta.router.entity import Router as Router
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from argenta.app.models import App as App
+    from argenta.command.models import Command as Command
+    from argenta.data_bridge.entity import DataBridge as DataBridge
+    from argenta.orchestrator.entity import Orchestrator as Orchestrator
+    from argenta.response.entity import Response as Response
+    from argenta.router.entity import Router as Router
+
+__all__ = ["App", "Command", "DataBridge", "Orchestrator", "Response", "Router"]
+
+LAZY_ATTRIBUTES: dict[str, str] = {
+    "App": "argenta.app.models",
+    "Command": "argenta.command.models",
+    "DataBridge": "argenta.data_bridge.entity",
+    "Orchestrator": "argenta.orchestrator.entity",
+    "Response": "argenta.response.entity",
+    "Router": "argenta.router.entity",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return globals().setdefault(name, getattr(import_module(LAZY_ATTRIBUTES[name]), name))
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
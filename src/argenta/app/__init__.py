@@ -2,4 +2,8 @@ from argenta.app.autocompleter.entity import AutoCompleter as AutoCompleter
 from argenta.app.defaults import PredefinedMessages as PredefinedMessages
 from argenta.app.dividing_line.models import DynamicDividingLine as DynamicDividingLine
 from argenta.app.dividing_line.models import StaticDividingLine as StaticDividingLine
+from argenta.app.exit_codes import ExitCode as ExitCode
 from argenta.app.models import App as App
+from argenta.app.similarity_index.entity import SimilarityIndex as SimilarityIndex
+from argenta.app.similarity_index.entity import TrigramIndex as TrigramIndex
+from argenta.app.startup_snapshot.entity import StartupSnapshot as StartupSnapshot
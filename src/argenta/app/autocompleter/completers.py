@@ -0,0 +1,135 @@
+__all__ = ["CommandLexer", "HistoryCompleter"]
+
+from heapq import merge
+from typing import Callable, Iterable, Iterator
+
+from prompt_toolkit.completion import CompleteEvent, Completer, Completion
+from prompt_toolkit.document import Document
+from prompt_toolkit.formatted_text import StyleAndTextTuples
+from prompt_toolkit.history import History
+from prompt_toolkit.lexers import Lexer
+
+from argenta.app.completion_schemas import CommandCompletionSchema, CompletionSchemas
+from argenta.app.history import IndexedHistory
+from argenta.app.prefix_tree import PrefixTree
+
+
+class CommandLexer(Lexer):
+    def __init__(self, valid_commands: set[str]) -> None:
+        self.valid_commands: set[str] = valid_commands
+        self._valid_first_words: set[str] = {command.split(" ", 1)[0] for command in valid_commands}
+
+    def lex_document(self, document: Document) -> Callable[[int], StyleAndTextTuples]:
+        def get_line_tokens(lineno: int) -> StyleAndTextTuples:
+            if lineno >= len(document.lines):
+                return []
+
+            line_text: str = document.lines[lineno]
+
+            if not line_text.strip():
+                return [("", line_text)]
+
+            first_word: str = line_text.split()[0] if line_text.split() else ""
+
+            if first_word in self._valid_first_words:
+                return [("class:valid", line_text)]
+            else:
+                return [("class:invalid", line_text)]
+
+        return get_line_tokens
+
+
+class HistoryCompleter(Completer):
+    def __init__(
+            self,
+            history_container: History,
+            static_commands: set[str],
+            static_commands_prefix_tree: PrefixTree | None = None,
+            completion_schemas: CompletionSchemas | None = None,
+    ) -> None:
+        self.history_container: History = history_container
+        self.static_commands: set[str] = static_commands
+        self.completion_schemas: CompletionSchemas | None = completion_schemas
+        self.static_commands_prefix_tree: PrefixTree = (
+            static_commands_prefix_tree if static_commands_prefix_tree is not None else PrefixTree(static_commands)
+        )
+        self._indexed_history: IndexedHistory | None = (
+            history_container if isinstance(history_container, IndexedHistory) else None
+        )
+
+    def get_completions(self, document: Document, complete_event: CompleteEvent) -> Iterable[Completion]:
+        text: str = document.text_before_cursor
+        if self.completion_schemas is not None:
+            yield from self._get_argument_completions(text, self.completion_schemas)
+
+        static_matches: list[str] = self.static_commands_prefix_tree.get_keys_with_prefix(text)
+
+        for match in _merge_unique(self._get_history_matches(text), static_matches):
+            yield Completion(
+                match,
+                start_position=-len(text),
+                display=match
+            )
+
+    @staticmethod
+    def _get_argument_completions(text: str, completion_schemas: CompletionSchemas) -> Iterator[Completion]:
+        words: list[str] = text.split()
+        is_word_finished: bool = text[-1:].isspace()
+        finished_words: list[str] = words if is_word_finished else words[:-1]
+        if not finished_words:
+            return
+
+        schema: CommandCompletionSchema | None
+        trigger_depth: int
+        schema, trigger_depth = completion_schemas.find_schema(finished_words)
+        if schema is None:
+            return
+
+        current_word: str = "" if is_word_finished else words[-1]
+        previous_words: list[str] = finished_words[trigger_depth:]
+        previous_word: str | None = previous_words[-1] if previous_words else None
+
+        matches: list[str]
+        if previous_word is not None and schema.has_values(previous_word) and not current_word.startswith("-"):
+            matches = schema.get_values_with_prefix(previous_word, current_word)
+        elif not current_word or current_word.startswith("-"):
+            entered_flags: set[str] = set(previous_words)
+            matches = [flag for flag in schema.get_flags_with_prefix(current_word) if flag not in entered_flags]
+        else:
+            return
+
+        for match in matches:
+            yield Completion(
+                match,
+                start_position=-len(current_word),
+                display=match
+            )
+
+    def _get_history_matches(self, text: str) -> list[str]:
+        if self._indexed_history is not None:
+            self._indexed_history.ensure_loaded()
+            history_matches: list[str] = self._indexed_history.index.get_with_prefix(text)
+            if not history_matches and self._indexed_history.load_older_history(text):
+                history_matches = self._indexed_history.index.get_with_prefix(text)
+            return history_matches
+        return sorted({item for item in self.history_container.load_history_strings() if item.startswith(text)})
+
+    @staticmethod
+    def _find_common_prefix(matches: list[str]) -> str:
+        if not matches:
+            return ""
+        common: str = matches[0]
+        for match in matches[1:]:
+            i: int = 0
+            while i < len(common) and i < len(match) and common[i] == match[i]:
+                i += 1
+            common = common[:i]
+        return common
+
+
+def _merge_unique(*sorted_matches: list[str]) -> Iterator[str]:
+    previous_match: str | None = None
+    for match in merge(*sorted_matches):
+        if match != previous_match:
+            yield match
+            previous_match = match
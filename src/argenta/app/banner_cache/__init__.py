@@ -0,0 +1 @@
+from argenta.app.banner_cache.entity import BannerCache as BannerCache
@@ -0,0 +1,106 @@
+__all__ = ["BannerCache"]
+
+import os
+from importlib.util import find_spec
+
+ART_DISTRIBUTION_PREFIX: str = "art-"
+ART_DISTRIBUTION_SUFFIX: str = ".dist-info"
+
+
+class BannerCache:
+    def __init__(self, directory: str | None = None) -> None:
+        """
+        Private. On-disk cache of the banners rendered by art, keyed on the text, the font and
+        the art version. art itself is imported only on a cache miss
+        :param directory: directory of the cached banners, the user cache directory by default
+        :return: None
+        """
+        self.directory: str = directory or self._get_default_directory()
+        self._rendered_banners: dict[tuple[str, str], str] = {}
+        self._art_version: str | None = None
+
+    def get_or_render(self, text: str, font: str) -> str:
+        """
+        Private. Returns the cached banner or renders it and stores it on disk
+        :param text: the text of the banner
+        :param font: the art font of the banner
+        :return: the rendered banner as str
+        """
+        if (text, font) in self._rendered_banners:
+            return self._rendered_banners[(text, font)]
+
+        banner_path: str = self._get_banner_path(text, font)
+        try:
+            with open(banner_path, encoding="utf-8") as banner_file:
+                banner: str = banner_file.read()
+        except OSError:
+            banner = self._render(text, font)
+            self._store(banner_path, banner)
+
+        self._rendered_banners[(text, font)] = banner
+        return banner
+
+    def _get_banner_path(self, text: str, font: str) -> str:
+        """
+        Private. Builds the path of the cached banner
+        :param text: the text of the banner
+        :param font: the art font of the banner
+        :return: path of the cached banner as str
+        """
+        from hashlib import sha256
+
+        key: bytes = "\0".join((self._get_art_version(), font, text)).encode("utf-8")
+        return os.path.join(self.directory, sha256(key).hexdigest() + ".txt")
+
+    def _get_art_version(self) -> str:
+        """
+        Private. Reads the art version from the name of its installed distribution,
+        which is much cheaper than importing art or importlib.metadata
+        :return: art version as str
+        """
+        if self._art_version is not None:
+            return self._art_version
+
+        spec = find_spec("art")
+        if spec is not None and spec.submodule_search_locations:
+            site_directory: str = os.path.dirname(list(spec.submodule_search_locations)[0])
+            with os.scandir(site_directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith(ART_DISTRIBUTION_PREFIX) and entry.name.endswith(ART_DISTRIBUTION_SUFFIX):
+                        self._art_version = entry.name[len(ART_DISTRIBUTION_PREFIX):-len(ART_DISTRIBUTION_SUFFIX)]
+                        return self._art_version
+
+        import art
+
+        self._art_version = str(art.__version__)
+        return self._art_version
+
+    def _store(self, banner_path: str, banner: str) -> None:
+        """
+        Private. Atomically writes the banner, an unwritable cache directory is ignored
+        :param banner_path: path of the cached banner
+        :param banner: the rendered banner
+        :return: None
+        """
+        from tempfile import NamedTemporaryFile
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with NamedTemporaryFile(
+                "w", encoding="utf-8", dir=self.directory, suffix=".tmp", delete=False
+            ) as temporary_file:
+                temporary_file.write(banner)
+            os.replace(temporary_file.name, banner_path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _render(text: str, font: str) -> str:
+        from art import text2art
+
+        return str(text2art(text, font=font))
+
+    @staticmethod
+    def _get_default_directory() -> str:
+        cache_home: str = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        return os.path.join(cache_home, "argenta", "banners")
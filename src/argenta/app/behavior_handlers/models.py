@@ -1,13 +1,22 @@
-from rich.markup import escape
-
 from argenta.app.presentation.renderers import Renderer
-from argenta.app.protocols import (DescriptionMessageGenerator, EmptyCommandHandler,
-                                   MostSimilarCommandGetter, NonStandardBehaviorHandler,
-                                   Printer)
+from argenta.app.protocols import (AmbiguousCommandHandler, DescriptionMessageGenerator,
+                                   EmptyCommandHandler, MostSimilarCommandGetter,
+                                   NonStandardBehaviorHandler, Printer)
 from argenta.command import InputCommand
 from argenta.response.entity import Response
 
 
+def escape(markup: str) -> str:
+    """
+    Private. Escapes the rich markup, rich is imported only when an incorrect input is handled
+    :param markup: escaped text
+    :return: escaped text as str
+    """
+    from rich.markup import escape as escape_markup
+
+    return escape_markup(markup)
+
+
 class BehaviorHandlersFabric:
     def __init__(
         self,
@@ -48,8 +57,18 @@ class BehaviorHandlersFabric:
             )
         return unknown_command_handler
 
-    def generate_exit_command_handler(self, farewell_message: str) -> NonStandardBehaviorHandler[Response]:
-        return lambda _: self._printer(farewell_message)
+    def generate_ambiguous_command_handler(self) -> AmbiguousCommandHandler:
+        return lambda command, candidates: self._printer(
+            self._renderer.render_text_for_ambiguous_command_handler(
+                command_trigger=escape(command.trigger),
+                candidate_triggers=[escape(candidate) for candidate in candidates]
+            )
+        )
+
+    def generate_exit_command_handler(self, farewell_message: str | None) -> NonStandardBehaviorHandler[Response]:
+        if farewell_message is None:
+            return lambda _: None
+        return lambda _: self._printer(self._renderer.render_farewell_message(farewell_message))
 
     def generate_description_message_generator(self) -> DescriptionMessageGenerator:
         return lambda command, description: self._renderer.render_text_for_description_message_generator(
@@ -66,7 +85,8 @@ class BehaviorHandlersSettersMixin:
         repeated_input_flags_handler: NonStandardBehaviorHandler[str],
         empty_input_command_handler: EmptyCommandHandler,
         unknown_command_handler: NonStandardBehaviorHandler[InputCommand],
-        exit_command_handler: NonStandardBehaviorHandler[Response]
+        exit_command_handler: NonStandardBehaviorHandler[Response],
+        ambiguous_command_handler: AmbiguousCommandHandler | None = None
     ):
         self._description_message_generator: DescriptionMessageGenerator = description_message_generator
         self._incorrect_input_syntax_handler: NonStandardBehaviorHandler[str] = incorrect_input_syntax_handler
@@ -74,6 +94,9 @@ class BehaviorHandlersSettersMixin:
         self._empty_input_command_handler: EmptyCommandHandler = empty_input_command_handler
         self._unknown_command_handler: NonStandardBehaviorHandler[InputCommand] = unknown_command_handler
         self._exit_command_handler: NonStandardBehaviorHandler[Response] = exit_command_handler
+        self._ambiguous_command_handler: AmbiguousCommandHandler = (
+            ambiguous_command_handler or (lambda command, _: unknown_command_handler(command))
+        )
 
     def set_description_message_pattern(self, _: DescriptionMessageGenerator, /) -> None:
         self._description_message_generator = _
@@ -87,6 +110,14 @@ class BehaviorHandlersSettersMixin:
     def set_unknown_command_handler(self, _: NonStandardBehaviorHandler[InputCommand], /) -> None:
         self._unknown_command_handler = _
 
+    def set_ambiguous_command_handler(self, _: AmbiguousCommandHandler, /) -> None:
+        """
+        Public. Sets the handler for abbreviated commands that match several triggers
+        :param _: handler for ambiguous commands, receives the input command and the matching triggers
+        :return: None
+        """
+        self._ambiguous_command_handler = _
+
     def set_empty_command_handler(self, _: EmptyCommandHandler, /) -> None:
         """
         Public. Sets the handler for empty commands when entering a command
@@ -0,0 +1,3 @@
+from argenta.app.completion_schemas.entity import \
+    CommandCompletionSchema as CommandCompletionSchema
+from argenta.app.completion_schemas.entity import CompletionSchemas as CompletionSchemas
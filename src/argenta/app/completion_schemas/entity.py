@@ -0,0 +1,125 @@
+__all__ = ["CommandCompletionSchema", "CompletionSchemas"]
+
+from bisect import bisect_left
+from shlex import quote
+from typing import Iterable, Mapping, Sequence
+
+from argenta.command.flag.models import Flag
+from argenta.command.models import Command
+from argenta.router import Router
+
+
+class CommandCompletionSchema:
+    __slots__ = ("flag_strings", "values_by_flag_string")
+
+    def __init__(self, command: Command) -> None:
+        """
+        Private. Precomputed completion table of the command: its sorted flags
+        and the sorted allowed values of the flags with a finite set of possible values
+        :param command: the registered command
+        :return: None
+        """
+        self.flag_strings: list[str] = sorted({flag.string_entity for flag in command.registered_flags})
+        self.values_by_flag_string: dict[str, list[str]] = {}
+        for flag in command.registered_flags:
+            if (values := _get_finite_values(flag)) is not None:
+                self.values_by_flag_string.setdefault(flag.string_entity, values)
+
+    def get_flags_with_prefix(self, prefix: str) -> list[str]:
+        """
+        Private. Returns the flags of the command starting with the prefix
+        :param prefix: the beginning of the flag, including the prefix of the flag
+        :return: sorted list of the flags
+        """
+        return _get_with_prefix(self.flag_strings, prefix)
+
+    def get_values_with_prefix(self, flag_string: str, prefix: str) -> list[str]:
+        """
+        Private. Returns the allowed values of the flag starting with the prefix
+        :param flag_string: the flag with its prefix, for example --host
+        :param prefix: the beginning of the value
+        :return: sorted list of the values, empty if the values of the flag are not enumerable
+        """
+        values: list[str] | None = self.values_by_flag_string.get(flag_string)
+        if values is None:
+            return []
+        return _get_with_prefix(values, prefix)
+
+    def has_values(self, flag_string: str) -> bool:
+        """
+        Private. Checks whether the flag has a finite set of allowed values
+        :param flag_string: the flag with its prefix
+        :return: is the values of the flag enumerable as bool
+        """
+        return flag_string in self.values_by_flag_string
+
+
+class CompletionSchemas:
+    def __init__(self, routers: Iterable[Router] = (), *, prefixes: Mapping[Router, str] | None = None) -> None:
+        """
+        Private. Completion tables of all registered commands, paired with their triggers and aliases
+        :param routers: the registered routers
+        :param prefixes: subcommand paths of the prefixed routers
+        :return: None
+        """
+        self._paired_trigger_schema: dict[str, CommandCompletionSchema] = {}
+        self._max_trigger_depth: int = 1
+        for router in routers:
+            prefix: str | None = prefixes.get(router) if prefixes else None
+            for command_handler in router.command_handlers:
+                self.add_command(command_handler.handled_command, prefix=prefix)
+
+    def add_command(self, command: Command, *, prefix: str | None = None) -> None:
+        """
+        Private. Builds the completion table of the command
+        :param command: the registered command
+        :param prefix: subcommand path of the command router
+        :return: None
+        """
+        schema = CommandCompletionSchema(command)
+        for trigger in (command.trigger, *command.aliases):
+            self._paired_trigger_schema[(f"{prefix} {trigger}" if prefix else trigger).lower()] = schema
+        if prefix:
+            self._max_trigger_depth = max(self._max_trigger_depth, prefix.count(" ") + 2)
+
+    def get_schema(self, trigger: str) -> CommandCompletionSchema | None:
+        """
+        Private. Returns the completion table of the command
+        :param trigger: trigger or alias of the command in any case
+        :return: the completion table or None if the command is unknown
+        """
+        return self._paired_trigger_schema.get(trigger.lower())
+
+    def find_schema(self, words: Sequence[str]) -> tuple[CommandCompletionSchema | None, int]:
+        """
+        Private. Finds the completion table of the longest trigger the words start with,
+        at most as many words as the deepest subcommand path are looked at
+        :param words: the entered words, the trigger followed by the flags
+        :return: the completion table or None and the number of words taken by the trigger
+        """
+        for depth in range(min(self._max_trigger_depth, len(words)), 0, -1):
+            schema: CommandCompletionSchema | None = self.get_schema(" ".join(words[:depth]))
+            if schema is not None:
+                return schema, depth
+        return None, 0
+
+
+def _get_finite_values(flag: Flag) -> list[str] | None:
+    """
+    Private. Enumerates the possible values of the flag if they are held in a finite container,
+    patterns, custom containers and PossibleValues cannot be enumerated
+    :param flag: the registered flag
+    :return: sorted quoted values or None
+    """
+    if not isinstance(flag.possible_values, (list, tuple, set, frozenset)):
+        return None
+    return sorted({quote(value) for value in flag.possible_values if isinstance(value, str)})
+
+
+def _get_with_prefix(sorted_strings: list[str], prefix: str) -> list[str]:
+    matches: list[str] = []
+    for i in range(bisect_left(sorted_strings, prefix), len(sorted_strings)):
+        if not sorted_strings[i].startswith(prefix):
+            break
+        matches.append(sorted_strings[i])
+    return matches
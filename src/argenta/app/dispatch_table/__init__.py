@@ -0,0 +1,2 @@
+from argenta.app.dispatch_table.entity import DispatchEntry as DispatchEntry
+from argenta.app.dispatch_table.entity import DispatchTable as DispatchTable
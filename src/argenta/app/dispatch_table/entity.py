@@ -0,0 +1,112 @@
+__all__ = ["DispatchEntry", "DispatchTable"]
+
+from types import MappingProxyType
+from typing import Iterable, Mapping, NamedTuple, Sequence
+
+from argenta.router import Router
+from argenta.router.command_handler.entity import CommandHandler
+
+
+class DispatchEntry(NamedTuple):
+    """
+    Private. Everything needed to dispatch an input command, resolved by a single lookup
+    """
+
+    router: Router
+    command_handler: CommandHandler
+    is_redirect_stdout_disabled: bool
+    is_exit_command: bool
+
+
+class DispatchTable:
+    __slots__ = ("_entries",)
+
+    def __init__(
+        self,
+        routers: Iterable[Router],
+        *,
+        system_router: Router | None = None,
+        prefixes: Mapping[Router, str] | None = None,
+    ) -> None:
+        """
+        Private. Immutable table compiled once before polling, which maps every lowercased
+        trigger and alias of the registered routers to its dispatch entry
+        :param routers: registered routers, including the system one
+        :param system_router: the router of the exit command
+        :param prefixes: subcommand paths of the prefixed routers
+        :return: None
+        """
+        entries: dict[str, DispatchEntry] = {}
+        for router in routers:
+            prefix: str | None = prefixes.get(router) if prefixes else None
+            for command_handler in router.command_handlers:
+                entry = DispatchEntry(
+                    router=router,
+                    command_handler=command_handler,
+                    is_redirect_stdout_disabled=router.is_redirect_stdout_disabled,
+                    is_exit_command=router is system_router,
+                )
+                handled_command = command_handler.handled_command
+                for trigger in (handled_command.trigger, *handled_command.aliases):
+                    entries.setdefault((f"{prefix} {trigger}" if prefix else trigger).lower(), entry)
+        self._entries: Mapping[str, DispatchEntry] = MappingProxyType(entries)
+
+    @classmethod
+    def from_positions(
+        cls,
+        routers: Sequence[Router],
+        positions: Mapping[str, tuple[int, int]],
+        *,
+        system_router: Router | None = None,
+    ) -> "DispatchTable":
+        """
+        Private. Binds the table compiled by an earlier launch to the handlers of the live routers
+        :param routers: registered routers in the order of registration, including the system one
+        :param positions: lowercased triggers paired with the positions of their router and handler, see get_positions
+        :param system_router: the router of the exit command
+        :return: the bound table
+        """
+        entries_by_position: dict[tuple[int, int], DispatchEntry] = {}
+        entries: dict[str, DispatchEntry] = {}
+        for trigger, position in positions.items():
+            entry: DispatchEntry | None = entries_by_position.get(position)
+            if entry is None:
+                router: Router = routers[position[0]]
+                entry = entries_by_position[position] = DispatchEntry(
+                    router=router,
+                    command_handler=router.command_handlers.command_handlers[position[1]],
+                    is_redirect_stdout_disabled=router.is_redirect_stdout_disabled,
+                    is_exit_command=router is system_router,
+                )
+            entries[trigger] = entry
+
+        table: DispatchTable = cls(())
+        table._entries = MappingProxyType(entries)
+        return table
+
+    def get_positions(self, routers: Sequence[Router]) -> dict[str, tuple[int, int]]:
+        """
+        Private. Replaces the handlers of the table with their positions, which outlive the launch
+        :param routers: registered routers in the order of registration, including the system one
+        :return: lowercased triggers paired with the positions of their router and handler
+        """
+        handler_positions: dict[int, tuple[int, int]] = {
+            id(command_handler): (router_position, handler_position)
+            for router_position, router in enumerate(routers)
+            for handler_position, command_handler in enumerate(router.command_handlers)
+        }
+        return {trigger: handler_positions[id(entry.command_handler)] for trigger, entry in self._entries.items()}
+
+    def get(self, trigger: str) -> DispatchEntry | None:
+        """
+        Private. Returns the dispatch entry of the trigger or alias
+        :param trigger: trigger of the input command, in any case
+        :return: dispatch entry or None if the trigger is unknown
+        """
+        return self._entries.get(trigger.lower())
+
+    def __contains__(self, trigger: object) -> bool:
+        return isinstance(trigger, str) and trigger.lower() in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
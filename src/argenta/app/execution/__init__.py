@@ -0,0 +1 @@
+from argenta.app.execution.entity import ExecutionResult as ExecutionResult
@@ -0,0 +1,17 @@
+__all__ = ["ExecutionResult"]
+
+from typing import NamedTuple
+
+from argenta.app.exit_codes import ExitCode
+
+
+class ExecutionResult(NamedTuple):
+    """
+    Public. Result of a command executed programmatically
+    """
+
+    raw_command: str
+    exit_code: ExitCode
+    output: str
+    duration: float  # in seconds
+    exception: Exception | None = None
@@ -0,0 +1,14 @@
+__all__ = ["ExitCode"]
+
+from enum import IntEnum
+
+
+class ExitCode(IntEnum):
+    """
+    Public. Process exit codes of a command run in one-shot or script mode
+    """
+
+    SUCCESS = 0
+    HANDLER_ERROR = 1
+    INCORRECT_INPUT = 2
+    UNKNOWN_COMMAND = 127
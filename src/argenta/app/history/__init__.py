@@ -0,0 +1,3 @@
+from argenta.app.history.entity import IndexedHistory as IndexedHistory
+from argenta.app.history.entity import PrefixIndex as PrefixIndex
+from argenta.app.history.entity import TailFileHistory as TailFileHistory
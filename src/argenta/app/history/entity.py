@@ -0,0 +1,431 @@
+__all__ = ["PrefixIndex", "IndexedHistory", "TailFileHistory"]
+
+import datetime
+import os
+import threading
+from bisect import bisect_left, insort
+from typing import BinaryIO, Iterable, Iterator, override
+
+from prompt_toolkit.history import History
+
+MAX_CHAR: str = chr(0x10FFFF)
+INSORT_PENDING_LIMIT: int = 32
+
+READ_BLOCK_SIZE: int = 64 * 1024
+OFFSET_SIZE: int = 8
+OFFSETS_FILE_SUFFIX: str = ".offsets"
+OLDER_HISTORY_CHUNK_SIZE: int = 1000
+OLDER_HISTORY_CHUNKS_LIMIT: int = 10
+
+
+class PrefixIndex:
+    def __init__(self, entries: Iterable[str] = ()) -> None:
+        """
+        Private. Sorted set of strings answering prefix queries by bisection,
+        new entries are added incrementally and may be added from another thread
+        :param entries: initial entries of the index
+        :return: None
+        """
+        self._members: set[str] = set()
+        self._sorted_entries: list[str] = []
+        self._pending_entries: list[str] = []
+        self._lock: threading.Lock = threading.Lock()
+        self.update(entries)
+
+    def add(self, entry: str) -> None:
+        """
+        Private. Adds the entry to the index, adding an existing entry does nothing
+        :param entry: added entry
+        :return: None
+        """
+        with self._lock:
+            if entry not in self._members:
+                self._members.add(entry)
+                self._pending_entries.append(entry)
+
+    def update(self, entries: Iterable[str]) -> None:
+        """
+        Private. Adds the entries to the index
+        :param entries: added entries
+        :return: None
+        """
+        for entry in entries:
+            self.add(entry)
+
+    def get_with_prefix(self, prefix: str) -> list[str]:
+        """
+        Private. Returns the entries starting with the prefix in lexicographic order
+        :param prefix: the beginning of the entries
+        :return: list of the entries
+        """
+        with self._lock:
+            self._merge_pending_entries()
+            start: int = bisect_left(self._sorted_entries, prefix)
+            upper_bound: str | None = _get_prefix_upper_bound(prefix)
+            if upper_bound is None:
+                return self._sorted_entries[start:]
+            return self._sorted_entries[start:bisect_left(self._sorted_entries, upper_bound, lo=start)]
+
+    def _merge_pending_entries(self) -> None:
+        """
+        Private. Moves the pending entries to the sorted ones, must be called under the lock.
+        A few entries are inserted by bisection, a batch is merged by one timsort pass
+        :return: None
+        """
+        if not self._pending_entries:
+            return
+        if len(self._pending_entries) <= INSORT_PENDING_LIMIT:
+            for entry in self._pending_entries:
+                insort(self._sorted_entries, entry)
+        else:
+            self._sorted_entries.extend(self._pending_entries)
+            self._sorted_entries.sort()
+        self._pending_entries = []
+
+    def __contains__(self, entry: object) -> bool:
+        return entry in self._members
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+
+class IndexedHistory(History):
+    def __init__(self, history: History) -> None:
+        """
+        Private. Wrapper around the history that keeps a prefix index of its entries,
+        the index is filled while the history is loaded and updated on every stored entry
+        :param history: wrapped history
+        :return: None
+        """
+        super().__init__()
+        self.history: History = history
+        self.index: PrefixIndex = PrefixIndex()
+        self._is_load_started: bool = False
+        self._is_older_history_exhausted: bool = False
+        self._seen_entries_count: int = 0
+        self._older_entries_count: int = 0
+
+    @override
+    def load_history_strings(self) -> Iterable[str]:
+        self._is_load_started = True
+        for history_string in self.history.load_history_strings():
+            self.index.add(history_string)
+            self._seen_entries_count += 1
+            yield history_string
+
+    @override
+    def store_string(self, string: str) -> None:
+        self.history.store_string(string)
+        self.index.add(string)
+        self._seen_entries_count += 1
+
+    def load_older_history(
+        self,
+        prefix: str = "",
+        *,
+        chunk_size: int = OLDER_HISTORY_CHUNK_SIZE,
+        chunks_limit: int = OLDER_HISTORY_CHUNKS_LIMIT,
+    ) -> bool:
+        """
+        Private. Indexes the entries older than the loaded ones, if the wrapped history loads only
+        the most recent entries (see TailFileHistory). The older entries are paged from the newest
+        in chunks until a chunk has an entry starting with the prefix, so a single call reads
+        at most chunk_size * chunks_limit entries, the next call continues where this one stopped
+        :param prefix: the beginning of the searched entries
+        :param chunk_size: how many older entries are read at once
+        :param chunks_limit: how many chunks a single call reads at most
+        :return: whether any older entries were indexed by this call
+        """
+        if self._is_older_history_exhausted or not isinstance(self.history, TailFileHistory):
+            return False
+        self.ensure_loaded()
+        is_indexed: bool = False
+        for _ in range(chunks_limit):
+            older_strings: list[str] = list(self.history.load_older_history_strings(
+                skip=self._seen_entries_count + self._older_entries_count, limit=chunk_size
+            ))
+            self._older_entries_count += len(older_strings)
+            self._is_older_history_exhausted = len(older_strings) < chunk_size
+            if older_strings:
+                self.index.update(older_strings)
+                is_indexed = True
+            if self._is_older_history_exhausted or any(string.startswith(prefix) for string in older_strings):
+                break
+        return is_indexed
+
+    def ensure_loaded(self) -> None:
+        """
+        Private. Loads the wrapped history into the index if nobody has started loading it yet
+        :return: None
+        """
+        if not self._is_load_started:
+            for _ in self.load_history_strings():
+                pass
+
+    @override
+    def __repr__(self) -> str:
+        return f"IndexedHistory({self.history!r})"
+
+
+class TailFileHistory(History):
+    def __init__(
+        self,
+        filename: str,
+        *,
+        loaded_entries_limit: int,
+        max_file_size: int | None = None,
+    ) -> None:
+        """
+        Private. File history in the format of prompt_toolkit FileHistory, which loads only
+        the most recent entries by reading the file backwards, so the startup does not depend on the file size.
+        Older entries are reached through an on-disk index of the entry offsets next to the file.
+        Once the file exceeds the size limit, it is deduplicated and cut in half in a background thread
+        :param filename: path to the history file
+        :param loaded_entries_limit: how many most recent entries are loaded at startup
+        :param max_file_size: size of the file in bytes that triggers the compaction, None disables it
+        :return: None
+        """
+        if loaded_entries_limit < 1:
+            raise ValueError(f"loaded_entries_limit must be at least 1, got {loaded_entries_limit}")
+        if max_file_size is not None and max_file_size < 1:
+            raise ValueError(f"max_file_size must be at least 1, got {max_file_size}")
+
+        super().__init__()
+        self.filename: str = filename
+        self.offsets_filename: str = filename + OFFSETS_FILE_SUFFIX
+        self.loaded_entries_limit: int = loaded_entries_limit
+        self.max_file_size: int | None = max_file_size
+
+        self._file_lock: threading.Lock = threading.Lock()
+        self._compaction_thread: threading.Thread | None = None
+
+    @override
+    def load_history_strings(self) -> Iterable[str]:
+        if not os.path.exists(self.filename):
+            return
+        with open(self.filename, "rb") as history_file:
+            for loaded_entries_count, (_, history_string) in enumerate(_iter_entry_blocks_backwards(history_file)):
+                if loaded_entries_count >= self.loaded_entries_limit:
+                    return
+                yield history_string
+
+    @override
+    def store_string(self, string: str) -> None:
+        with self._file_lock:
+            with open(self.filename, "ab") as history_file:
+                history_file.write(f"\n# {datetime.datetime.now()}\n".encode("utf-8") + _encode_entry(string))
+                file_size: int = history_file.tell()
+
+        if self.max_file_size is not None and file_size > self.max_file_size:
+            self._start_compaction()
+
+    def load_older_history_strings(self, skip: int = 0, limit: int | None = None) -> Iterator[str]:
+        """
+        Private. Yields the entries from the newest to the oldest through the offset index,
+        the index is created or caught up with the file on the first call
+        :param skip: how many most recent entries to skip, for example the already loaded ones
+        :param limit: how many entries to yield at most, all the remaining ones by default
+        :return: iterator over the history strings
+        """
+        with self._file_lock:
+            entries_count: int = self._update_offsets_index()
+            stop: int = max(entries_count - skip, 0)
+            start: int = 0 if limit is None else max(stop - limit, 0)
+            offsets: list[int] = self._read_offsets(start, stop) if start < stop else []
+        if not offsets:
+            return
+        with open(self.filename, "rb") as history_file:
+            for offset in reversed(offsets):
+                history_file.seek(offset)
+                yield _read_entry(history_file)
+
+    def compact(self) -> None:
+        """
+        Private. Removes the duplicates from the file and keeps the newest entries
+        that fit into a half of the size limit, entries stored meanwhile are preserved
+        :return: None
+        """
+        with self._file_lock:
+            if not os.path.exists(self.filename):
+                return
+            snapshot_size: int = os.path.getsize(self.filename)
+
+        kept_size_limit: int = (self.max_file_size or snapshot_size) // 2
+        kept_blocks: list[bytes] = []
+        kept_size: int = 0
+        seen_strings: set[str] = set()
+        with open(self.filename, "rb") as history_file:
+            for block, history_string in _iter_entry_blocks_backwards(history_file, snapshot_size):
+                if history_string in seen_strings:
+                    continue
+                if kept_size + len(block) > kept_size_limit and kept_blocks:
+                    break
+                seen_strings.add(history_string)
+                kept_blocks.append(block)
+                kept_size += len(block)
+
+        temporary_filename: str = self.filename + ".compacting"
+        with open(temporary_filename, "wb") as temporary_file:
+            temporary_file.writelines(reversed(kept_blocks))
+
+        with self._file_lock:
+            with open(self.filename, "rb") as history_file, open(temporary_filename, "ab") as temporary_file:
+                history_file.seek(snapshot_size)
+                temporary_file.write(history_file.read())
+            os.replace(temporary_filename, self.filename)
+            if os.path.exists(self.offsets_filename):
+                os.remove(self.offsets_filename)
+                self._update_offsets_index()
+
+    def _start_compaction(self) -> None:
+        if self._compaction_thread is not None and self._compaction_thread.is_alive():
+            return
+        self._compaction_thread = threading.Thread(target=self.compact, daemon=True)
+        self._compaction_thread.start()
+
+    def _update_offsets_index(self) -> int:
+        """
+        Private. Appends the offsets of the entries written after the last indexed one to the offset index,
+        rebuilds the index if it does not match the file. Only the last offset of the index is read.
+        Must be called under the file lock
+        :return: how many entries the index holds
+        """
+        if not os.path.exists(self.filename):
+            return 0
+
+        indexed_entries_count: int = 0
+        if os.path.exists(self.offsets_filename):
+            offsets_size: int = os.path.getsize(self.offsets_filename)
+            if offsets_size % OFFSET_SIZE == 0:
+                indexed_entries_count = offsets_size // OFFSET_SIZE
+
+        with open(self.filename, "rb") as history_file:
+            scan_offset: int = 0
+            if indexed_entries_count:
+                last_offset: int = self._read_offsets(indexed_entries_count - 1, indexed_entries_count)[0]
+                history_file.seek(last_offset)
+                if history_file.read(1) == b"+":
+                    history_file.seek(last_offset)
+                    _read_entry(history_file)
+                    scan_offset = history_file.tell()
+                else:
+                    indexed_entries_count = 0
+            new_offsets: list[int] = list(_iter_entry_offsets(history_file, scan_offset))
+
+        with open(self.offsets_filename, "ab" if indexed_entries_count else "wb") as offsets_file:
+            offsets_file.write(b"".join(offset.to_bytes(OFFSET_SIZE, "big") for offset in new_offsets))
+        return indexed_entries_count + len(new_offsets)
+
+    def _read_offsets(self, start: int, stop: int) -> list[int]:
+        """
+        Private. Reads a slice of the offset index. Must be called under the file lock
+        :param start: position of the first read entry, from the oldest
+        :param stop: position after the last read entry
+        :return: offsets of the entries from the oldest to the newest
+        """
+        with open(self.offsets_filename, "rb") as offsets_file:
+            offsets_file.seek(start * OFFSET_SIZE)
+            raw_offsets: bytes = offsets_file.read((stop - start) * OFFSET_SIZE)
+        return [int.from_bytes(raw_offsets[i:i + OFFSET_SIZE], "big") for i in range(0, len(raw_offsets), OFFSET_SIZE)]
+
+
+def _encode_entry(string: str) -> bytes:
+    return "".join(f"+{line}\n" for line in string.split("\n")).encode("utf-8")
+
+
+def _decode_entry(lines: list[bytes]) -> str:
+    """
+    Private. Joins the lines of the entry the same way as prompt_toolkit FileHistory
+    :param lines: raw lines of the entry in the file order, with their line breaks
+    :return: the history string
+    """
+    return "".join(line.decode("utf-8", errors="replace")[1:] for line in lines)[:-1]
+
+
+def _read_entry(history_file: BinaryIO) -> str:
+    lines: list[bytes] = []
+    for line in history_file:
+        if not line.startswith(b"+"):
+            break
+        lines.append(line)
+    return _decode_entry(lines)
+
+
+def _iter_entry_offsets(history_file: BinaryIO, offset: int) -> Iterator[int]:
+    history_file.seek(offset)
+    is_inside_entry: bool = False
+    for line in history_file:
+        is_entry_line: bool = line.startswith(b"+")
+        if is_entry_line and not is_inside_entry:
+            yield offset
+        is_inside_entry = is_entry_line
+        offset += len(line)
+
+
+def _iter_lines_backwards(history_file: BinaryIO, end: int | None = None) -> Iterator[bytes]:
+    """
+    Private. Yields the lines of the file from the last to the first, each with its line break
+    :param history_file: file opened in binary mode
+    :param end: position where the reading starts, the end of the file by default
+    :return: iterator over the lines
+    """
+    position: int = history_file.seek(0, os.SEEK_END) if end is None else end
+    leftover: bytes = b""
+    is_last_line: bool = True
+    while position > 0:
+        block_size: int = min(READ_BLOCK_SIZE, position)
+        position -= block_size
+        history_file.seek(position)
+        pieces: list[bytes] = (history_file.read(block_size) + leftover).split(b"\n")
+        leftover = pieces[0]
+        for piece in reversed(pieces[1:]):
+            if is_last_line:
+                is_last_line = False
+                if piece:
+                    yield piece
+                continue
+            yield piece + b"\n"
+    if is_last_line:
+        if leftover:
+            yield leftover
+    else:
+        yield leftover + b"\n"
+
+
+def _iter_entry_blocks_backwards(history_file: BinaryIO, end: int | None = None) -> Iterator[tuple[bytes, str]]:
+    """
+    Private. Yields the entries of the file from the newest to the oldest,
+    each with its raw block: the lines preceding the entry and the lines of the entry itself
+    :param history_file: file opened in binary mode
+    :param end: position where the reading starts, the end of the file by default
+    :return: iterator over the pairs of the raw block and the history string
+    """
+    entry_lines: list[bytes] = []
+    header_lines: list[bytes] = []
+    for line in _iter_lines_backwards(history_file, end):
+        if line.startswith(b"+"):
+            if entry_lines and header_lines:
+                yield _join_entry_block(header_lines, entry_lines)
+                entry_lines, header_lines = [], []
+            entry_lines.append(line)
+        elif entry_lines:
+            header_lines.append(line)
+    if entry_lines:
+        yield _join_entry_block(header_lines, entry_lines)
+
+
+def _join_entry_block(reversed_header_lines: list[bytes], reversed_entry_lines: list[bytes]) -> tuple[bytes, str]:
+    entry_lines: list[bytes] = reversed_entry_lines[::-1]
+    return b"".join(reversed_header_lines[::-1] + entry_lines), _decode_entry(entry_lines)
+
+
+def _get_prefix_upper_bound(prefix: str) -> str | None:
+    """
+    Private. Returns the smallest string greater than all strings starting with the prefix
+    :param prefix: the beginning of the strings
+    :return: the bound or None if the strings with the prefix run to the end of the order
+    """
+    stripped_prefix: str = prefix.rstrip(MAX_CHAR)
+    if not stripped_prefix:
+        return None
+    return stripped_prefix[:-1] + chr(ord(stripped_prefix[-1]) + 1)
@@ -0,0 +1,2 @@
+from argenta.app.lazy_console.entity import DEFAULT_CONSOLE as DEFAULT_CONSOLE
+from argenta.app.lazy_console.entity import LazyConsole as LazyConsole
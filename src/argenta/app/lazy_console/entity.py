@@ -0,0 +1,43 @@
+__all__ = ["LazyConsole", "DEFAULT_CONSOLE"]
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+class LazyConsole:
+    __slots__ = ("_console_kwargs", "_console")
+
+    def __init__(self, **console_kwargs: Any) -> None:
+        """
+        Private. Proxy of the rich console, which imports rich and creates the console on the first print
+        :param console_kwargs: arguments passed to the rich console
+        :return: None
+        """
+        self._console_kwargs: dict[str, Any] = console_kwargs
+        self._console: Console | None = None
+
+    @property
+    def console(self) -> "Console":
+        """
+        Private. Returns the proxied console, creating it on the first access
+        :return: rich console as Console
+        """
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console(**self._console_kwargs)
+        return self._console
+
+    def print(self, *objects: Any, **kwargs: Any) -> None:
+        """
+        Private. Prints the objects with the proxied console
+        :param objects: printed objects
+        :param kwargs: arguments passed to Console.print
+        :return: None
+        """
+        self.console.print(*objects, **kwargs)
+
+
+DEFAULT_CONSOLE: LazyConsole = LazyConsole()
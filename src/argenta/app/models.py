@@ -1,28 +1,45 @@
 __all__ = ["App"]
 
-import difflib
-from typing import Never, TypeAlias
-
-from rich.console import Console
+from contextlib import redirect_stdout
+from io import StringIO
+from shlex import join
+from time import perf_counter
+from traceback import print_exc
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Sequence
 
 from argenta.app.autocompleter import AutoCompleter
 from argenta.app.behavior_handlers.models import (BehaviorHandlersFabric,
                                                   BehaviorHandlersSettersMixin)
+from argenta.app.completion_schemas import CompletionSchemas
+from argenta.app.dispatch_table import DispatchEntry, DispatchTable
 from argenta.app.dividing_line.models import DynamicDividingLine, StaticDividingLine
+from argenta.app.execution import ExecutionResult
+from argenta.app.exit_codes import ExitCode
+from argenta.app.lazy_console import DEFAULT_CONSOLE
+from argenta.app.parse_cache import ParseCache, ParseCacheInfo
+from argenta.app.prefix_tree import PrefixTree
 from argenta.app.presentation.renderers import PlainRenderer, Renderer, RichRenderer
 from argenta.app.presentation.viewers import Viewer
-from argenta.app.protocols import Printer
+from argenta.app.protocols import DescriptionMessageGenerator, Middleware, Printer
 from argenta.app.registered_routers.entity import RegisteredRouters
+from argenta.app.script import ScriptCommandResult, ScriptSource, ScriptSummary
+from argenta.app.script.entity import iter_script_commands
+from argenta.app.similarity_index import SimilarityIndex, TrigramIndex
+from argenta.app.startup_snapshot import CompiledStartupState, StartupSnapshot
+from argenta.app.trigger_tree import TriggerTree
 from argenta.command.exceptions import (InputCommandException,
                                         RepeatedInputFlagsException,
                                         UnprocessedInputFlagException)
 from argenta.command.models import Command, InputCommand
+from argenta.command.tokenizer import tokenize
 from argenta.response import Response
-from argenta.router import Router
-from argenta.router.exceptions import (RepeatedAliasNameException,
-                                       RepeatedTriggerNameException)
+from argenta.router import LazyRouter, Router
+
+if TYPE_CHECKING:
+    from argenta.app.plugin_manifest import PluginManifestCache
+    from argenta.codegen import CompiledRoutes
 
-Matches: TypeAlias = list[str] | list[Never]
+AMBIGUOUS_CANDIDATES_LIMIT: int = 10
 
 
 class BaseApp(BehaviorHandlersSettersMixin):
@@ -39,6 +56,11 @@ class BaseApp(BehaviorHandlersSettersMixin):
         override_system_messages: bool,
         autocompleter: AutoCompleter,
         printer: Printer,
+        parse_cache_size: int | None,
+        allow_trigger_abbreviations: bool,
+        similarity_index: SimilarityIndex,
+        disable_banners: bool,
+        startup_snapshot: StartupSnapshot | None,
     ) -> None:
         self._prompt: str = prompt
         self._printer: Printer = printer
@@ -48,6 +70,22 @@ class BaseApp(BehaviorHandlersSettersMixin):
         self._override_system_messages: bool = override_system_messages
         self._autocompleter: AutoCompleter = autocompleter
         self._system_router: Router = Router(title=system_router_title)
+        self._parse_cache: ParseCache | None = (
+            ParseCache(parse_cache_size, parser=self._parse_raw_command) if parse_cache_size is not None else None
+        )
+        self._allow_trigger_abbreviations: bool = allow_trigger_abbreviations
+        self._triggers_prefix_tree: PrefixTree | None = None
+        self._trigger_tree: TriggerTree = TriggerTree()
+        self._similarity_index: SimilarityIndex = similarity_index
+        self._is_similarity_index_built: bool = False
+        self._disable_banners: bool = disable_banners
+        self._is_dispatch_state_set_up: bool = False
+        self._dispatch_table: DispatchTable = DispatchTable(())
+        self._startup_snapshot: StartupSnapshot | None = startup_snapshot
+        self._startup_snapshot_key: str | None = None
+        self._compiled_startup_state: CompiledStartupState | None = None
+        self._compiled_routes: CompiledRoutes | None = None
+        self._middlewares: list[Middleware] = []
 
         self.registered_routers: RegisteredRouters = RegisteredRouters()
         self._messages_on_startup: list[str] = []
@@ -66,27 +104,73 @@ class BaseApp(BehaviorHandlersSettersMixin):
             most_similar_command_getter=self._most_similar_command
         )
 
-        self._initial_message: str = self._renderer.render_initial_message(initial_message)
-        self._farewell_message: str = self._renderer.render_farewell_message(farewell_message)
+        self._initial_message: str = initial_message
+        self._farewell_message: str = farewell_message
+
+        self._default_description_message_generator: DescriptionMessageGenerator = (
+            self._handlers_fabric.generate_description_message_generator()
+        )
 
         super().__init__(
-            description_message_generator = self._handlers_fabric.generate_description_message_generator(),
+            description_message_generator = self._default_description_message_generator,
             incorrect_input_syntax_handler = self._handlers_fabric.generate_incorrect_input_syntax_handler(),
             repeated_input_flags_handler = self._handlers_fabric.generate_repeated_input_flags_handler(),
             empty_input_command_handler = self._handlers_fabric.generate_empty_input_command_handler(),
             unknown_command_handler = self._handlers_fabric.generate_unknown_command_handler(),
-            exit_command_handler = self._handlers_fabric.generate_exit_command_handler(self._farewell_message)
+            exit_command_handler = self._handlers_fabric.generate_exit_command_handler(
+                None if self._disable_banners else self._farewell_message
+            ),
+            ambiguous_command_handler = self._handlers_fabric.generate_ambiguous_command_handler()
         )
 
-    def _is_exit_command(self, command: InputCommand) -> bool:
-        if not self._system_router.command_handlers.get_command_handler_by_trigger(command.trigger.lower()):
-            return False
-        return True
-
-    def _is_unknown_command(self, input_command: InputCommand) -> bool:
-        if not self.registered_routers.get_router_by_trigger(input_command.trigger.lower()):
-            return True
-        return False
+    def _expand_abbreviated_trigger(self, input_command: InputCommand) -> InputCommand:
+        if (
+            not self._allow_trigger_abbreviations
+            or self._triggers_prefix_tree is None
+            or input_command.trigger in self._dispatch_table
+        ):
+            return input_command
+
+        full_trigger: str | None = self._triggers_prefix_tree.resolve_unique_prefix(input_command.trigger.lower())
+        if full_trigger is None:
+            return input_command
+        return InputCommand(full_trigger, input_flags=input_command.input_flags)
+
+    def _resolve_dispatch_entry(self, input_command: InputCommand) -> tuple[InputCommand, DispatchEntry | None]:
+        dispatch_entry: DispatchEntry | None = self._dispatch_table.get(input_command.trigger)
+        if dispatch_entry is None and self._allow_trigger_abbreviations:
+            input_command = self._expand_abbreviated_trigger(input_command)
+            dispatch_entry = self._dispatch_table.get(input_command.trigger)
+        return input_command, dispatch_entry
+
+    def _get_ambiguous_triggers(self, input_command: InputCommand) -> list[str]:
+        if not self._allow_trigger_abbreviations or self._triggers_prefix_tree is None:
+            return []
+
+        trigger_prefix: str = input_command.trigger.lower()
+        if self._triggers_prefix_tree.count_keys_with_prefix(trigger_prefix) < 2:
+            return []
+        return self._triggers_prefix_tree.get_keys_with_prefix(trigger_prefix, limit=AMBIGUOUS_CANDIDATES_LIMIT)
+
+    def _parse_input_command(self, raw_command: str) -> InputCommand:
+        if self._parse_cache is not None:
+            return self._parse_cache.parse(raw_command)
+        return self._parse_raw_command(raw_command)
+
+    def _parse_raw_command(self, raw_command: str) -> InputCommand:
+        if not self._trigger_tree:
+            return InputCommand.parse(raw_command)
+        return InputCommand.from_tokens(self._trigger_tree.join_trigger_path(tokenize(raw_command)))
+
+    def _parse_args(self, args: Sequence[str]) -> InputCommand:
+        if not self._trigger_tree:
+            return InputCommand.from_tokens(args)
+        return InputCommand.from_tokens(self._trigger_tree.join_trigger_path(args))
+
+    def _get_group_routers(self, input_command: InputCommand) -> RegisteredRouters | None:
+        if not self._trigger_tree or not self._trigger_tree.is_group(input_command.trigger):
+            return None
+        return self.registered_routers.get_group(input_command.trigger)
 
     def _error_handler(self, error: InputCommandException, raw_command: str) -> None:
         if isinstance(error, UnprocessedInputFlagException):
@@ -97,22 +181,17 @@ class BaseApp(BehaviorHandlersSettersMixin):
             self._empty_input_command_handler()
 
     def _validate_routers_for_collisions(self) -> None:
-        seen_names: set[str] = set()
-
-        for router_entity in self.registered_routers:
-            if not seen_names.isdisjoint(router_entity.triggers):
-                raise RepeatedTriggerNameException()
-
-            alias_collisions = seen_names.intersection(router_entity.aliases)
-            if alias_collisions:
-                raise RepeatedAliasNameException(alias_collisions)
+        self.registered_routers.sync()
+        self.registered_routers.raise_collision()
 
-            seen_names.update(router_entity.triggers)
-            seen_names.update(router_entity.aliases)
+    def _build_similarity_index(self, all_triggers: set[str]) -> None:
+        self._similarity_index.build(all_triggers)
+        self._is_similarity_index_built = True
 
     def _most_similar_command(self, unknown_command: str) -> str | None:
-        all_commands = self.registered_routers.get_triggers()
-        matches = difflib.get_close_matches(unknown_command, all_commands, n=1)
+        if not self._is_similarity_index_built:
+            self._build_similarity_index(self.registered_routers.get_triggers())
+        matches = self._similarity_index.get_most_similar(unknown_command, limit=1)
         return matches[0] if matches else None
 
     def _setup_system_router(self) -> None:
@@ -122,30 +201,173 @@ class BaseApp(BehaviorHandlersSettersMixin):
 
         self.registered_routers.add_registered_router(self._system_router)
 
-    def _pre_cycle_setup(self) -> None:
+    def _compile_middlewares(self) -> None:
+        """
+        Private. Compiles the middleware chains of the handlers once before dispatching,
+        the system router is not wrapped, so the exit command is always handled
+        :return: None
+        """
+        for router in self.registered_routers:
+            if router is not self._system_router:
+                router.compile_middlewares(self._middlewares)
+
+    def _setup_dispatch_state(self) -> None:
+        if self._is_dispatch_state_set_up:
+            return
+
         self._setup_system_router()
         self._validate_routers_for_collisions()
-        self._autocompleter.initial_setup(self.registered_routers.get_triggers())
+        self._compile_middlewares()
+        if self._startup_snapshot is not None and self._load_startup_snapshot(self._startup_snapshot):
+            self._is_dispatch_state_set_up = True
+            return
+
+        all_triggers: set[str] = self.registered_routers.get_triggers()
+        self._triggers_prefix_tree = PrefixTree(all_triggers)
+        if self.registered_routers.prefixes:
+            self._trigger_tree = TriggerTree(all_triggers)
+        if self._compiled_routes is not None and self._is_compiled_routes_only(self._compiled_routes):
+            self._dispatch_table = DispatchTable.from_positions(
+                self.registered_routers.registered_routers,
+                self._get_compiled_dispatch_positions(self._compiled_routes),
+                system_router=self._system_router,
+            )
+        else:
+            self._dispatch_table = DispatchTable(
+                self.registered_routers,
+                system_router=self._system_router,
+                prefixes=self.registered_routers.prefixes,
+            )
+        self._is_dispatch_state_set_up = True
+
+    def _is_compiled_routes_only(self, compiled_routes: "CompiledRoutes") -> bool:
+        """
+        Private. Checks that the compiled routes are the only routers included besides the system one,
+        otherwise the generated dispatch table and help do not cover all routers
+        :param compiled_routes: the included compiled routes
+        :return: whether the generated tables can be used as bool
+        """
+        return self.registered_routers.registered_routers == [*compiled_routes.routers, self._system_router]
+
+    def _get_compiled_dispatch_positions(self, compiled_routes: "CompiledRoutes") -> dict[str, tuple[int, int]]:
+        """
+        Private. Completes the generated dispatch table with the commands of the system router
+        :param compiled_routes: the included compiled routes
+        :return: lowercased triggers paired with the positions of their router and handler
+        """
+        positions: dict[str, tuple[int, int]] = dict(compiled_routes.dispatch_table)
+        system_router_position: int = len(compiled_routes.routers)
+        for handler_position, command_handler in enumerate(self._system_router.command_handlers):
+            handled_command: Command = command_handler.handled_command
+            for trigger in (handled_command.trigger, *handled_command.aliases):
+                positions.setdefault(trigger.lower(), (system_router_position, handler_position))
+        return positions
+
+    def _render_command_groups_description(self) -> str:
+        """
+        Private. Renders the help, the help of the compiled routes is taken as generated when it was rendered
+        the same way, only the system router is rendered then
+        :return: the rendered help
+        """
+        compiled_routes: CompiledRoutes | None = self._compiled_routes
+        if (
+            compiled_routes is not None
+            and compiled_routes.command_groups_description is not None
+            and compiled_routes.renderer == type(self._renderer).__name__
+            and self._description_message_generator is self._default_description_message_generator
+            and self._is_compiled_routes_only(compiled_routes)
+        ):
+            system_routers: RegisteredRouters = RegisteredRouters()
+            system_routers.add_registered_router(self._system_router)
+            return compiled_routes.command_groups_description + self._renderer.render_command_groups_description(
+                self._description_message_generator, system_routers
+            )
+        return self._renderer.render_command_groups_description(
+            self._description_message_generator, self.registered_routers
+        )
+
+    def _load_startup_snapshot(self, startup_snapshot: StartupSnapshot) -> bool:
+        """
+        Private. Restores the compiled state stored by an earlier launch with the same routers and settings
+        :param startup_snapshot: the on-disk snapshot
+        :return: whether the state was restored as bool
+        """
+        self._startup_snapshot_key = startup_snapshot.get_key(
+            self.registered_routers,
+            settings=(type(self._renderer), type(self._similarity_index), self._description_message_generator),
+        )
+        compiled_state: CompiledStartupState | None = startup_snapshot.load(self._startup_snapshot_key)
+        if compiled_state is None:
+            return False
+
+        self._compiled_startup_state = compiled_state
+        self._triggers_prefix_tree = compiled_state.prefix_tree
+        self._trigger_tree = compiled_state.trigger_tree
+        self._dispatch_table = DispatchTable.from_positions(
+            self.registered_routers.registered_routers,
+            compiled_state.dispatch_positions,
+            system_router=self._system_router,
+        )
+        if compiled_state.similarity_state is not None and isinstance(self._similarity_index, TrigramIndex):
+            self._similarity_index.restore_state(compiled_state.similarity_state)
+            self._is_similarity_index_built = True
+        return True
+
+    def _compile_startup_state(self) -> CompiledStartupState:
+        """
+        Private. Compiles the state left after the dispatch state, stores it if the snapshot is enabled
+        :return: the compiled state
+        """
+        all_triggers: set[str] = self.registered_routers.get_triggers()
+        self._build_similarity_index(all_triggers)
+        compiled_state = CompiledStartupState(
+            dispatch_positions={},
+            triggers=all_triggers,
+            prefix_tree=self._triggers_prefix_tree,
+            trigger_tree=self._trigger_tree,
+            similarity_state=(
+                self._similarity_index.export_state() if isinstance(self._similarity_index, TrigramIndex) else None
+            ),
+            completion_schemas=CompletionSchemas(self.registered_routers, prefixes=self.registered_routers.prefixes),
+            command_groups_description=self._render_command_groups_description(),
+        )
+
+        if self._startup_snapshot is not None and self._startup_snapshot_key is not None:
+            self._startup_snapshot.store(
+                self._startup_snapshot_key,
+                compiled_state._replace(
+                    dispatch_positions=self._dispatch_table.get_positions(self.registered_routers.registered_routers)
+                ),
+            )
+        return compiled_state
+
+    def _pre_cycle_setup(self) -> None:
+        self._setup_dispatch_state()
+
+        compiled_state: CompiledStartupState = self._compiled_startup_state or self._compile_startup_state()
+        self._autocompleter.initial_setup(
+            compiled_state.triggers,
+            triggers_prefix_tree=compiled_state.prefix_tree,
+            completion_schemas=compiled_state.completion_schemas,
+        )
 
         if self._messages_on_startup:
             self._viewer.view_messages_on_startup(self._messages_on_startup)
 
         if not self._repeat_command_groups_printing:
-            self._viewer.view_command_groups_description(self._description_message_generator, self.registered_routers)
-
-    def _process_exist_and_valid_command(self, input_command: InputCommand) -> None:
-        processing_router = self.registered_routers.get_router_by_trigger(input_command.trigger.lower())
-
-        if not processing_router:
-            raise RuntimeError(f"Router for '{input_command.trigger}' not found. Panic!")
+            self._viewer.view_rendered_command_groups_description(compiled_state.command_groups_description)
 
+    def _process_exist_and_valid_command(self, input_command: InputCommand, dispatch_entry: DispatchEntry) -> None:
         self._viewer.view_framed_text_from_generator(
-            output_text_generator=lambda: processing_router.finds_appropriate_handler(input_command),
-            is_stdout_redirected_by_router=processing_router.is_redirect_stdout_disabled
+            output_text_generator=lambda: dispatch_entry.router.process_input_command(
+                input_command.input_flags, dispatch_entry.command_handler
+            ),
+            is_stdout_redirected_by_router=dispatch_entry.is_redirect_stdout_disabled
         )
 
     def _run_polling(self) -> None:
-        self._viewer.view_initial_message(self._initial_message)
+        if not self._disable_banners:
+            self._viewer.view_initial_message(self._renderer.render_initial_message(self._initial_message))
         self._pre_cycle_setup()
         while True:
             if self._repeat_command_groups_printing:
@@ -156,24 +378,130 @@ class BaseApp(BehaviorHandlersSettersMixin):
             print()  # post-prompt gap
 
             try:
-                input_command: InputCommand = InputCommand.parse(raw_command=raw_command)
+                input_command: InputCommand = self._parse_input_command(raw_command)
             except InputCommandException as error:  # noqa F841
                 self._viewer.view_framed_text_from_generator(
                     output_text_generator=lambda: self._error_handler(error, raw_command) # noqa
                 )
                 continue
 
-            if self._is_unknown_command(input_command):
-                self._viewer.view_framed_text_from_generator(
-                    output_text_generator=lambda: self._unknown_command_handler(input_command)
+            if self._dispatch_input_command(input_command, is_interactive=True) is None:
+                return
+
+    def _run_once(self, args: Sequence[str]) -> ExitCode:
+        self._setup_dispatch_state()
+
+        try:
+            input_command: InputCommand = self._parse_args(args)
+        except InputCommandException as error:
+            self._error_handler(error, join(args))
+            return ExitCode.INCORRECT_INPUT
+
+        try:
+            return self._dispatch_input_command(input_command) or ExitCode.SUCCESS
+        except Exception:  # noqa: BLE001 the traceback of any handler error is printed
+            print_exc()
+            return ExitCode.HANDLER_ERROR
+
+    def _run_script(self, source: ScriptSource, *, stop_on_error: bool) -> ScriptSummary:
+        self._setup_dispatch_state()
+        results: list[ScriptCommandResult] = []
+
+        with iter_script_commands(source) as commands:
+            for line_number, raw_command in commands:
+                try:
+                    exit_code: ExitCode | None = self._run_raw_command(raw_command)
+                except Exception as error:  # noqa: BLE001 the error keeps its traceback in the result
+                    if not stop_on_error:
+                        print_exc()
+                    result = ScriptCommandResult(line_number, raw_command, ExitCode.HANDLER_ERROR, error)
+                else:
+                    if exit_code is None:
+                        break
+                    result = ScriptCommandResult(line_number, raw_command, exit_code)
+
+                results.append(result)
+                if stop_on_error and result.exit_code != ExitCode.SUCCESS:
+                    return ScriptSummary(results, is_stopped_on_error=True)
+
+        return ScriptSummary(results, is_stopped_on_error=False)
+
+    def _execute(self, raw_command: str) -> ExecutionResult:
+        output_buffer: StringIO = StringIO()
+        exception: Exception | None = None
+        start: float = perf_counter()
+        with redirect_stdout(output_buffer):
+            try:
+                exit_code: ExitCode = self._run_raw_command(raw_command) or ExitCode.SUCCESS
+            except Exception as error:  # noqa: BLE001 the error keeps its traceback in the result
+                exit_code, exception = ExitCode.HANDLER_ERROR, error
+        duration: float = perf_counter() - start
+        return ExecutionResult(raw_command, exit_code, output_buffer.getvalue(), duration, exception)
+
+    def _run_raw_command(self, raw_command: str) -> ExitCode | None:
+        """
+        Private. Parses and dispatches the raw command without any framing
+        :param raw_command: raw input command
+        :return: exit code of the command or None if the exit command was entered
+        """
+        try:
+            input_command: InputCommand = self._parse_input_command(raw_command)
+        except InputCommandException as error:
+            self._error_handler(error, raw_command)
+            return ExitCode.INCORRECT_INPUT
+
+        return self._dispatch_input_command(input_command)
+
+    def _dispatch_input_command(
+        self, input_command: InputCommand, *, is_interactive: bool = False
+    ) -> ExitCode | None:
+        """
+        Private. Dispatches the parsed command with a single lookup in the dispatch table
+        :param input_command: parsed input command
+        :param is_interactive: whether the command was entered at the prompt,
+               then the output is framed and the exit command runs its handler
+        :return: exit code of the command or None if the exit command was entered
+        """
+        input_command, dispatch_entry = self._resolve_dispatch_entry(input_command)
+
+        if dispatch_entry is None:
+            group_routers: RegisteredRouters | None = self._get_group_routers(input_command)
+            if group_routers is not None:
+                self._viewer.view_command_groups_description(self._description_message_generator, group_routers)
+                return ExitCode.SUCCESS
+
+            ambiguous_triggers: list[str] = self._get_ambiguous_triggers(input_command)
+            if ambiguous_triggers:
+                self._view_output(
+                    lambda: self._ambiguous_command_handler(input_command, ambiguous_triggers),
+                    is_framed=is_interactive
                 )
-                continue
+                return ExitCode.INCORRECT_INPUT
+            self._view_output(lambda: self._unknown_command_handler(input_command), is_framed=is_interactive)
+            return ExitCode.UNKNOWN_COMMAND
 
-            if self._is_exit_command(input_command):
-                self._system_router.finds_appropriate_handler(input_command)
-                return
+        if dispatch_entry.is_exit_command:
+            if is_interactive:
+                dispatch_entry.router.process_input_command(input_command.input_flags, dispatch_entry.command_handler)
+            return None
 
-            self._process_exist_and_valid_command(input_command)
+        if is_interactive:
+            self._process_exist_and_valid_command(input_command, dispatch_entry)
+        else:
+            dispatch_entry.router.process_input_command(input_command.input_flags, dispatch_entry.command_handler)
+        return ExitCode.SUCCESS
+
+    def _view_output(self, output_text_generator: Callable[[], None], *, is_framed: bool) -> None:
+        """
+        Private. Runs the generator of the output, in a frame if requested
+        :param output_text_generator: function printing the output
+        :param is_framed: whether the output is framed
+        :return: None
+        """
+        if is_framed:
+            self._viewer.view_framed_text_from_generator(output_text_generator=output_text_generator)
+        else:
+            output_text_generator()
 
 
 class App(BaseApp):
@@ -189,7 +517,12 @@ class App(BaseApp):
         repeat_command_groups_printing: bool = False,
         override_system_messages: bool = False,
         autocompleter: AutoCompleter | None = None,
-        printer: Printer = Console().print,
+        printer: Printer = DEFAULT_CONSOLE.print,
+        parse_cache_size: int | None = None,
+        allow_trigger_abbreviations: bool = False,
+        similarity_index: SimilarityIndex | None = None,
+        disable_banners: bool = False,
+        startup_snapshot: StartupSnapshot | None = None,
     ) -> None:
         """
         Public. The essence of the application itself.
@@ -204,6 +537,12 @@ class App(BaseApp):
         :param override_system_messages: whether to redefine the default formatting of system messages
         :param autocompleter: the entity of the autocompleter
         :param printer: system messages text output function
+        :param parse_cache_size: if set, the parsed input commands are kept in an LRU cache of this size
+        :param allow_trigger_abbreviations: whether to accept any unambiguous prefix of a trigger instead of the full trigger
+        :param similarity_index: index suggesting the most similar trigger for an unknown command, TrigramIndex by default
+        :param disable_banners: whether to skip the initial and farewell messages, e.g. in headless mode
+        :param startup_snapshot: if set, the state compiled before polling is stored on disk and loaded
+               by the next launches with the same routers instead of being compiled again
         :return: None
         """
         super().__init__(
@@ -217,15 +556,94 @@ class App(BaseApp):
             override_system_messages=override_system_messages,
             autocompleter=autocompleter or AutoCompleter(),
             printer=printer,
+            parse_cache_size=parse_cache_size,
+            allow_trigger_abbreviations=allow_trigger_abbreviations,
+            similarity_index=similarity_index or TrigramIndex(),
+            disable_banners=disable_banners,
+            startup_snapshot=startup_snapshot,
         )
 
-    def include_router(self, router: Router) -> None:
+    @property
+    def parse_cache_info(self) -> ParseCacheInfo | None:
+        """
+        Public. Returns the hit, miss and eviction counters of the parse cache
+        :return: counters of the parse cache as ParseCacheInfo or None if the cache is disabled
+        """
+        if self._parse_cache is None:
+            return None
+        return self._parse_cache.get_info()
+
+    def include_router(self, router: Router, *, prefix: str | None = None) -> None:
         """
         Public. Registers the router in the application
         :param router: registered router
+        :param prefix: subcommand path of the router, e.g. "db" or "remote origin",
+               the commands of the router are entered after it: db migrate --force
+        :return: None
+        """
+        if prefix is not None:
+            prefix_tokens: list[str] = prefix.split()
+            if not prefix_tokens or any(token.startswith("-") for token in prefix_tokens):
+                raise ValueError(f"Invalid router prefix: {prefix!r}")
+            prefix = " ".join(prefix_tokens)
+        self.registered_routers.add_registered_router(router, prefix=prefix)
+
+    def include_lazy_router(
+        self,
+        import_path: str,
+        *,
+        triggers: Iterable[Command | str],
+        title: str = "Default title",
+        prefix: str | None = None,
+        disable_redirect_stdout: bool = False,
+    ) -> None:
+        """
+        Public. Registers the router of a module without importing it, the module is imported
+        on the first dispatch to one of the declared commands, see LazyRouter
+        :param import_path: path of the router as "package.module:attribute"
+        :param triggers: declared commands of the router, as triggers or Command with description, aliases and flags
+        :param title: the title of the router, displayed when displaying the available commands
+        :param prefix: subcommand path of the router, see App.include_router
+        :param disable_redirect_stdout: see Router
         :return: None
         """
-        self.registered_routers.add_registered_router(router)
+        self.include_router(
+            LazyRouter(import_path, commands=triggers, title=title, disable_redirect_stdout=disable_redirect_stdout),
+            prefix=prefix,
+        )
+
+    def include_entry_point_routers(
+        self,
+        group: str | None = None,
+        *,
+        manifest_cache: "PluginManifestCache | None" = None,
+    ) -> None:
+        """
+        Public. Registers the routers of the installed plugins, discovered through the entry points.
+        The commands are kept in an on-disk manifest, so later startups import no plugin until
+        one of its commands is dispatched, the manifest is rebuilt when an installed distribution changes
+        :param group: the entry point group, "argenta.routers" by default
+        :param manifest_cache: the manifest cache, stored in the user cache directory by default
+        :return: None
+        """
+        from argenta.app.plugin_manifest import (DEFAULT_ENTRY_POINT_GROUP,
+                                                 PluginManifestCache)
+
+        manifest_cache = manifest_cache or PluginManifestCache()
+        for router in manifest_cache.discover_routers(group or DEFAULT_ENTRY_POINT_GROUP):
+            self.include_router(router)
+
+    def include_compiled_routes(self, compiled_routes: "CompiledRoutes") -> None:
+        """
+        Public. Registers the routers of the module generated by python -m argenta.codegen "package.module:app"
+        in place of the original routers, importing the module does none of the work of the decorators,
+        and the modules of the handlers are imported on the first dispatch to them
+        :param compiled_routes: the ROUTES of the generated module
+        :return: None
+        """
+        for router, prefix in zip(compiled_routes.routers, compiled_routes.prefixes):
+            self.include_router(router, prefix=prefix)
+        self._compiled_routes = compiled_routes
 
     def include_routers(self, *routers: Router) -> None:
         """
@@ -236,6 +654,49 @@ class App(BaseApp):
         for router in routers:
             self.include_router(router)
 
+    def run_script(self, source: ScriptSource, *, stop_on_error: bool = False) -> ScriptSummary:
+        """
+        Public. Runs the commands of a script without the prompt, banners and frames.
+        The lines are read lazily, empty lines and lines starting with # are skipped,
+        the exit command ends the script. The error of a handler keeps its traceback in the result,
+        the traceback is also printed to stderr unless the script stops on the error
+        :param source: path of the script, file object or iterable of lines
+        :param stop_on_error: whether to stop on the first failed command instead of continuing
+        :return: per-command summary of the script as ScriptSummary
+        """
+        return self._run_script(source, stop_on_error=stop_on_error)
+
+    def execute(self, raw_command: str) -> ExecutionResult:
+        """
+        Public. Executes a single command without touching the terminal, stdout of the handler
+        and the system messages are captured into the result, the raised exception is not propagated
+        and keeps its traceback in the result. The exit command does not run the exit handler,
+        it gives ExitCode.SUCCESS with empty output
+        :param raw_command: raw input command
+        :return: result of the command as ExecutionResult
+        """
+        self._setup_dispatch_state()
+        return self._execute(raw_command)
+
+    def execute_many(self, raw_commands: Iterable[str]) -> Iterator[ExecutionResult]:
+        """
+        Public. Lazily executes the commands one by one, see App.execute
+        :param raw_commands: raw input commands
+        :return: iterator over the results of the commands
+        """
+        self._setup_dispatch_state()
+        return map(self._execute, raw_commands)
+
+    def add_middleware(self, middleware: Middleware) -> None:
+        """
+        Public. Adds a middleware wrapping the handlers of all routers, outside the middlewares of the routers,
+        see Router.add_middleware. The chains are compiled once before the first dispatch, so the middlewares
+        must be added before the application is started
+        :param middleware: the middleware being added
+        :return: None
+        """
+        self._middlewares.append(middleware)
+
     def add_message_on_startup(self, message: str) -> None:
         """
         Public. Adds a message that will be displayed when the application is launched
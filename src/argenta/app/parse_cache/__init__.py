@@ -0,0 +1,2 @@
+from argenta.app.parse_cache.entity import ParseCache as ParseCache
+from argenta.app.parse_cache.entity import ParseCacheInfo as ParseCacheInfo
@@ -0,0 +1,102 @@
+__all__ = ["ParseCache", "ParseCacheInfo"]
+
+from collections import OrderedDict
+from typing import Callable, NamedTuple
+
+from argenta.command import InputCommand, InputFlag, InputFlags
+from argenta.command.flag.models import PREFIX_TYPE
+
+FrozenInputFlag = tuple[str, PREFIX_TYPE, str]
+FrozenInputCommand = tuple[str, tuple[FrozenInputFlag, ...]]
+
+
+class ParseCacheInfo(NamedTuple):
+    """
+    Public. Snapshot of the parse cache counters
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+
+class ParseCache:
+    def __init__(self, max_size: int, *, parser: Callable[[str], InputCommand] = InputCommand.parse) -> None:
+        """
+        Private. Size-bounded LRU cache of parsed input commands, keyed on the raw command.
+        Entries are stored in an immutable form and every hit returns freshly built flags,
+        so changes made to the returned command (e.g. flag statuses) never leak into the cache
+        :param max_size: maximum number of cached raw commands
+        :param parser: parses the raw command on a cache miss
+        :return: None
+        """
+        if max_size < 1:
+            raise ValueError("Parse cache size must be a positive integer")
+
+        self.max_size: int = max_size
+        self._parser: Callable[[str], InputCommand] = parser
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._entries: OrderedDict[str, FrozenInputCommand] = OrderedDict()
+
+    def parse(self, raw_command: str) -> InputCommand:
+        """
+        Private. Parses the raw input command, reusing the cached result if there is one.
+        Commands that fail to parse are not cached, the error is raised every time
+        :param raw_command: raw input command
+        :return: model of the input command, after parsing as InputCommand
+        """
+        frozen_command = self._entries.get(raw_command)
+        if frozen_command is not None:
+            self.hits += 1
+            self._entries.move_to_end(raw_command)
+            return self._thaw(frozen_command)
+
+        self.misses += 1
+        input_command: InputCommand = self._parser(raw_command)
+        self._entries[raw_command] = self._freeze(input_command)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return input_command
+
+    def get_info(self) -> ParseCacheInfo:
+        """
+        Private. Returns the current counters of the cache
+        :return: counters of the cache as ParseCacheInfo
+        """
+        return ParseCacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            size=len(self._entries),
+            max_size=self.max_size,
+        )
+
+    def clear(self) -> None:
+        """
+        Private. Drops all cached entries and resets the counters
+        :return: None
+        """
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    @staticmethod
+    def _freeze(input_command: InputCommand) -> FrozenInputCommand:
+        return input_command.trigger, tuple(
+            (flag.name, flag.prefix, flag.input_value) for flag in input_command.input_flags
+        )
+
+    @staticmethod
+    def _thaw(frozen_command: FrozenInputCommand) -> InputCommand:
+        trigger, frozen_flags = frozen_command
+        return InputCommand(
+            trigger,
+            input_flags=InputFlags([
+                InputFlag(name, prefix=prefix, input_value=input_value)
+                for name, prefix, input_value in frozen_flags
+            ]),
+        )
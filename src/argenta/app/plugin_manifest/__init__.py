@@ -0,0 +1,3 @@
+from argenta.app.plugin_manifest.entity import \
+    DEFAULT_ENTRY_POINT_GROUP as DEFAULT_ENTRY_POINT_GROUP
+from argenta.app.plugin_manifest.entity import PluginManifestCache as PluginManifestCache
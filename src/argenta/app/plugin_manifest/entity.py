@@ -0,0 +1,315 @@
+__all__ = ["DEFAULT_ENTRY_POINT_GROUP", "PluginManifestCache"]
+
+import json
+import os
+import re
+import sys
+from typing import TYPE_CHECKING, Any, Iterable, TypeAlias
+
+from argenta.command import Command, Flag, Flags
+from argenta.command.flag.models import PossibleValues
+from argenta.router import LazyRouter, Router
+
+if TYPE_CHECKING:
+    from importlib.metadata import EntryPoint, EntryPoints
+
+DEFAULT_ENTRY_POINT_GROUP: str = "argenta.routers"
+MANIFEST_FORMAT_VERSION: int = 2
+
+JsonObject: TypeAlias = dict[str, Any]
+Fingerprint: TypeAlias = list[list[str | float]]
+
+
+class PluginManifestCache:
+    def __init__(self, directory: str | None = None) -> None:
+        """
+        Public. On-disk manifest of the routers discovered through the entry points: the commands
+        with their aliases, descriptions and flags, the import path of every router, the version
+        and modification time of the distributions and the modification time of the router modules.
+        While the installed distributions and the router modules stay the same, the routers are built
+        from the manifest as LazyRouter without importing any plugin.
+        While the import path directories are not modified, not even importlib.metadata is imported
+        :param directory: directory of the manifests, the user cache directory by default
+        :return: None
+        """
+        self.directory: str = directory or self._get_default_directory()
+
+    def discover_routers(self, group: str = DEFAULT_ENTRY_POINT_GROUP) -> list[Router]:
+        """
+        Private. Discovers the routers of the entry point group, from the manifest if it is up to date,
+        otherwise by importing the plugins and rewriting the manifest
+        :param group: the entry point group, each entry point refers to a Router as "package.module:attribute"
+        :return: the discovered routers, lazy ones if they were built from the manifest
+        """
+        manifest: JsonObject | None = self._load(group)
+        if manifest is not None and not _is_modules_fingerprint_unchanged(manifest):
+            manifest = None
+        paths_fingerprint: Fingerprint = _get_paths_fingerprint()
+        if manifest is not None and manifest.get("paths_fingerprint") == paths_fingerprint:
+            return [_build_lazy_router(router_record) for router_record in manifest["routers"]]
+
+        from importlib.metadata import entry_points
+
+        group_entry_points: EntryPoints = entry_points(group=group)
+        fingerprint: Fingerprint = _get_fingerprint(group_entry_points)
+        if manifest is not None and manifest.get("fingerprint") == fingerprint:
+            self._store(group, {**manifest, "paths_fingerprint": paths_fingerprint})
+            return [_build_lazy_router(router_record) for router_record in manifest["routers"]]
+
+        routers: list[Router] = []
+        router_records: list[JsonObject] = []
+        module_paths: list[str] = []
+        for entry_point in sorted(group_entry_points, key=lambda x: x.name):
+            router = entry_point.load()
+            if not isinstance(router, Router):
+                raise TypeError(f"Entry point '{entry_point.name}' refers to {type(router).__name__}, not Router")
+            routers.append(router)
+            router_records.append(_describe_router(f"{entry_point.module}:{entry_point.attr}", router))
+            if (module_path := _get_module_path(entry_point.module)) is not None:
+                module_paths.append(module_path)
+
+        self._store(group, {
+            "fingerprint": fingerprint,
+            "paths_fingerprint": paths_fingerprint,
+            "modules_fingerprint": _get_modules_fingerprint(module_paths),
+            "routers": router_records,
+        })
+        return routers
+
+    def _get_manifest_path(self, group: str) -> str:
+        from hashlib import sha256
+
+        return os.path.join(self.directory, sha256(group.encode("utf-8")).hexdigest() + ".json")
+
+    def _load(self, group: str) -> JsonObject | None:
+        """
+        Private. Reads the manifest of the group, a missing or damaged manifest is treated as outdated,
+        as well as a manifest of an unexpected shape
+        :param group: the entry point group
+        :return: the manifest or None
+        """
+        try:
+            with open(self._get_manifest_path(group), encoding="utf-8") as manifest_file:
+                manifest = json.load(manifest_file)
+        except (OSError, ValueError):
+            return None
+        return manifest if _is_valid_manifest(manifest) else None
+
+    def _store(self, group: str, manifest: JsonObject) -> None:
+        """
+        Private. Atomically writes the manifest, an unwritable cache directory is ignored
+        :param group: the entry point group
+        :param manifest: the manifest of the group
+        :return: None
+        """
+        from tempfile import NamedTemporaryFile
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with NamedTemporaryFile(
+                "w", encoding="utf-8", dir=self.directory, suffix=".tmp", delete=False
+            ) as temporary_file:
+                json.dump(manifest, temporary_file)
+            os.replace(temporary_file.name, self._get_manifest_path(group))
+        except OSError:
+            pass
+
+    @staticmethod
+    def _get_default_directory() -> str:
+        cache_home: str = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        return os.path.join(cache_home, "argenta", "manifests")
+
+
+def _is_valid_manifest(manifest: object) -> bool:
+    """
+    Private. Checks the shape of the manifest read from the disk, the lazy routers are built from it without checks
+    :param manifest: the parsed JSON of the manifest
+    :return: whether the manifest has the shape written by PluginManifestCache as bool
+    """
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("routers"), list):
+        return False
+    return all(
+        _has_fields(router_record, import_path=str, title=str, disable_redirect_stdout=bool, commands=list)
+        and all(
+            _has_fields(command_record, trigger=str, description=str, aliases=list, flags=list)
+            and all(isinstance(alias, str) for alias in command_record["aliases"])
+            and all(
+                _has_fields(flag_record, name=str, prefix=str, possible_values=dict)
+                for flag_record in command_record["flags"]
+            )
+            for command_record in router_record["commands"]
+        )
+        for router_record in manifest["routers"]
+    )
+
+
+def _has_fields(record: object, **field_types: type) -> bool:
+    return isinstance(record, dict) and all(
+        isinstance(record.get(field_name), field_type) for field_name, field_type in field_types.items()
+    )
+
+
+def _get_paths_fingerprint() -> Fingerprint:
+    """
+    Private. Modification times of the import path directories, installing, upgrading or removing
+    a distribution modifies its directory, so an unchanged fingerprint means unchanged plugins.
+    The working directory is left out, any file written there, e.g. a log, would modify it
+    :return: the fingerprint, comparable with the one read from the manifest
+    """
+    fingerprint: Fingerprint = [[MANIFEST_FORMAT_VERSION]]
+    working_directory: str = os.getcwd()
+    for path_entry in sys.path:
+        if not path_entry or os.path.abspath(path_entry) == working_directory:
+            continue
+        try:
+            fingerprint.append([path_entry, os.stat(path_entry).st_mtime])
+        except OSError:
+            continue
+    return fingerprint
+
+
+def _get_module_path(module_name: str) -> str | None:
+    """
+    Private. Finds the file of the imported router module
+    :param module_name: name of the module the entry point refers to
+    :return: path of the module file or None if the module is not loaded from a file
+    """
+    from importlib.util import find_spec
+
+    try:
+        spec = find_spec(module_name)
+    except (ImportError, ValueError):
+        return None
+    return spec.origin if spec is not None and spec.has_location else None
+
+
+def _get_modules_fingerprint(module_paths: Iterable[str]) -> Fingerprint:
+    """
+    Private. Modification times of the router modules, editing a module of an editable install
+    modifies neither the import path directories nor the distribution metadata.
+    Only the modules the entry points refer to are covered, not the modules they import
+    :param module_paths: paths of the module files
+    :return: the fingerprint, comparable with the one read from the manifest
+    """
+    fingerprint: Fingerprint = []
+    for module_path in module_paths:
+        try:
+            modification_time: float = os.stat(module_path).st_mtime
+        except OSError:
+            modification_time = 0.0
+        fingerprint.append([module_path, modification_time])
+    return fingerprint
+
+
+def _is_modules_fingerprint_unchanged(manifest: JsonObject) -> bool:
+    """
+    Private. Compares the modification times of the router modules recorded in the manifest with the current ones
+    :param manifest: the manifest of the group
+    :return: whether none of the router modules was modified as bool
+    """
+    modules_fingerprint: Any = manifest.get("modules_fingerprint")
+    if not isinstance(modules_fingerprint, list):
+        return False
+    try:
+        return modules_fingerprint == _get_modules_fingerprint(module_path for module_path, _ in modules_fingerprint)
+    except (TypeError, ValueError):
+        return False
+
+
+def _get_fingerprint(group_entry_points: "EntryPoints") -> Fingerprint:
+    """
+    Private. Identifies the installed state of the plugins: the entry points, the versions
+    of their distributions and the modification time of the distribution metadata
+    :param group_entry_points: the entry points of the group
+    :return: the fingerprint, comparable with the one read from the manifest
+    """
+    fingerprint: Fingerprint = [[MANIFEST_FORMAT_VERSION]]
+    for entry_point in sorted(group_entry_points, key=lambda x: x.name):
+        fingerprint.append([entry_point.name, entry_point.value, *_describe_distribution(entry_point)])
+    return fingerprint
+
+
+def _describe_distribution(entry_point: "EntryPoint") -> list[str | float]:
+    """
+    Private. Describes the distribution of the entry point by its metadata directory, named after
+    the name and the version of the distribution, which spares parsing the metadata
+    :param entry_point: the entry point
+    :return: name of the metadata directory and its modification time
+    """
+    distribution = entry_point.dist
+    metadata_path = getattr(distribution, "_path", None)
+    if metadata_path is None:
+        return [f"{distribution.name}-{distribution.version}" if distribution is not None else "", 0.0]
+    try:
+        modification_time: float = os.stat(metadata_path).st_mtime
+    except OSError:
+        modification_time = 0.0
+    return [os.path.basename(metadata_path), modification_time]
+
+
+def _describe_router(import_path: str, router: Router) -> JsonObject:
+    return {
+        "import_path": import_path,
+        "title": router.title,
+        "disable_redirect_stdout": router.is_redirect_stdout_disabled,
+        "commands": [
+            {
+                "trigger": command.trigger,
+                "description": command.description,
+                "aliases": sorted(command.aliases),
+                "flags": [
+                    {"name": flag.name, "prefix": flag.prefix, "possible_values": _describe_possible_values(flag)}
+                    for flag in command.registered_flags
+                ],
+            }
+            for command in (command_handler.handled_command for command_handler in router.command_handlers)
+        ],
+    }
+
+
+def _describe_possible_values(flag: Flag) -> JsonObject:
+    """
+    Private. Serializes the possible values of the flag, values that cannot be serialized are recorded
+    as any value, the flags are validated by the imported router anyway
+    :param flag: the registered flag
+    :return: the possible values as JSON object
+    """
+    if isinstance(flag.possible_values, PossibleValues):
+        return {"constant": flag.possible_values.value}
+    if isinstance(flag.possible_values, re.Pattern):
+        return {"pattern": flag.possible_values.pattern, "flags": flag.possible_values.flags}
+    if isinstance(flag.possible_values, (list, tuple, set, frozenset)):
+        return {"values": sorted(value for value in flag.possible_values if isinstance(value, str))}
+    return {"constant": PossibleValues.ALL.value}
+
+
+def _build_lazy_router(router_record: JsonObject) -> LazyRouter:
+    return LazyRouter(
+        router_record["import_path"],
+        commands=[
+            Command(
+                command_record["trigger"],
+                description=command_record["description"],
+                aliases=command_record["aliases"],
+                flags=Flags([
+                    Flag(
+                        flag_record["name"],
+                        prefix=flag_record["prefix"],
+                        possible_values=_build_possible_values(flag_record["possible_values"]),
+                    )
+                    for flag_record in command_record["flags"]
+                ]),
+            )
+            for command_record in router_record["commands"]
+        ],
+        title=router_record["title"],
+        disable_redirect_stdout=router_record["disable_redirect_stdout"],
+    )
+
+
+def _build_possible_values(possible_values_record: JsonObject) -> list[str] | re.Pattern[str] | PossibleValues:
+    if "values" in possible_values_record:
+        return list(possible_values_record["values"])
+    if "pattern" in possible_values_record:
+        return re.compile(possible_values_record["pattern"], possible_values_record["flags"])
+    return PossibleValues(possible_values_record["constant"])
@@ -0,0 +1 @@
+from argenta.app.prefix_tree.entity import PrefixTree as PrefixTree
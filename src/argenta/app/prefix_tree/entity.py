@@ -0,0 +1,153 @@
+__all__ = ["PrefixTree"]
+
+from typing import Iterable, Iterator
+
+
+class PrefixTreeNode:
+    __slots__ = ("edges", "terminal_key", "keys_count")
+
+    def __init__(self) -> None:
+        """
+        Private. Node of the compressed prefix tree
+        :return: None
+        """
+        self.edges: dict[str, tuple[str, PrefixTreeNode]] = {}
+        self.terminal_key: str | None = None
+        self.keys_count: int = 0
+
+
+class PrefixTree:
+    def __init__(self, keys: Iterable[str] = ()) -> None:
+        """
+        Private. Compressed prefix tree (radix tree) over string keys,
+        resolves the keys by their prefixes in time proportional to the length of the prefix
+        :param keys: initial keys of the tree
+        :return: None
+        """
+        self._root: PrefixTreeNode = PrefixTreeNode()
+        for key in keys:
+            self.add(key)
+
+    def add(self, key: str) -> None:
+        """
+        Private. Adds the key to the tree, adding an existing key does nothing
+        :param key: added key
+        :return: None
+        """
+        node: PrefixTreeNode = self._root
+        path: list[PrefixTreeNode] = [node]
+        rest: str = key
+
+        while rest:
+            edge = node.edges.get(rest[0])
+            if edge is None:
+                leaf = PrefixTreeNode()
+                leaf.terminal_key = key
+                leaf.keys_count = 1
+                node.edges[rest[0]] = (rest, leaf)
+                break
+
+            label, child = edge
+            if rest.startswith(label):
+                node = child
+                rest = rest[len(label):]
+            else:
+                common_length: int = _common_prefix_length(label, rest)
+                middle = PrefixTreeNode()
+                middle.keys_count = child.keys_count
+                middle.edges[label[common_length]] = (label[common_length:], child)
+                node.edges[rest[0]] = (label[:common_length], middle)
+                node = middle
+                rest = rest[common_length:]
+            path.append(node)
+        else:
+            if node.terminal_key is not None:
+                return
+            node.terminal_key = key
+
+        for visited_node in path:
+            visited_node.keys_count += 1
+
+    def resolve_unique_prefix(self, prefix: str) -> str | None:
+        """
+        Private. Returns the only key starting with the prefix
+        :param prefix: the beginning of the key
+        :return: the key or None if there are no keys or more than one key with this prefix
+        """
+        node: PrefixTreeNode | None = self._find_node(prefix)
+        if node is None or node.keys_count != 1:
+            return None
+        while node.terminal_key is None:
+            _, node = next(iter(node.edges.values()))
+        return node.terminal_key
+
+    def count_keys_with_prefix(self, prefix: str) -> int:
+        """
+        Private. Counts the keys starting with the prefix without enumerating them
+        :param prefix: the beginning of the keys
+        :return: number of the keys as int
+        """
+        node: PrefixTreeNode | None = self._find_node(prefix)
+        return node.keys_count if node is not None else 0
+
+    def get_keys_with_prefix(self, prefix: str, limit: int | None = None) -> list[str]:
+        """
+        Private. Returns the keys starting with the prefix in lexicographic order
+        :param prefix: the beginning of the keys
+        :param limit: maximum number of the returned keys
+        :return: list of the keys
+        """
+        node: PrefixTreeNode | None = self._find_node(prefix)
+        if node is None:
+            return []
+
+        keys: list[str] = []
+        for key in self._iter_keys(node):
+            if limit is not None and len(keys) >= limit:
+                break
+            keys.append(key)
+        return keys
+
+    def _find_node(self, prefix: str) -> PrefixTreeNode | None:
+        """
+        Private. Finds the topmost node, all keys under which start with the prefix
+        :param prefix: the beginning of the keys
+        :return: the node or None if no key starts with the prefix
+        """
+        node: PrefixTreeNode = self._root
+        position: int = 0
+
+        while position < len(prefix):
+            edge = node.edges.get(prefix[position])
+            if edge is None:
+                return None
+            label, child = edge
+            if not prefix.startswith(label[:len(prefix) - position], position):
+                return None
+            position += len(label)
+            node = child
+
+        return node
+
+    def _iter_keys(self, node: PrefixTreeNode) -> Iterator[str]:
+        if node.terminal_key is not None:
+            yield node.terminal_key
+        for first_char in sorted(node.edges):
+            yield from self._iter_keys(node.edges[first_char][1])
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        node: PrefixTreeNode | None = self._find_node(key)
+        return node is not None and node.terminal_key == key
+
+    def __len__(self) -> int:
+        return self._root.keys_count
+
+
+def _common_prefix_length(first: str, second: str) -> int:
+    length: int = min(len(first), len(second))
+    for i in range(length):
+        if first[i] != second[i]:
+            return i
+    return length
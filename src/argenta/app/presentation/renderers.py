@@ -1,7 +1,6 @@
 from typing import Iterable, Protocol
 
-from art import text2art
-
+from argenta.app.banner_cache import BannerCache
 from argenta.app.protocols import DescriptionMessageGenerator
 from argenta.app.registered_routers.entity import RegisteredRouters
 
@@ -48,6 +47,14 @@ class Renderer(Protocol):
             command_trigger: str,
             most_similar_command_trigger: str | None
     ) -> str: ...
+    @staticmethod
+    def render_text_for_ambiguous_command_handler(
+            command_trigger: str,
+            candidate_triggers: Iterable[str]
+    ) -> str: ...
+
+
+BANNER_CACHE: BannerCache = BannerCache()
 
 
 class RichRenderer(Renderer):
@@ -57,13 +64,13 @@ class RichRenderer(Renderer):
 
     @staticmethod
     def render_initial_message(text: str) -> str:
-        return f"[bold red]{text2art(text, font='tarty1')}[/bold red]"
+        return f"[bold red]{BANNER_CACHE.get_or_render(text, font='tarty1')}[/bold red]"
 
     @staticmethod
     def render_farewell_message(text: str) -> str:
         return (
             "[bold red]"
-            + str(text2art(text, font="chanky"))
+            + BANNER_CACHE.get_or_render(text, font="chanky")
             + "[/bold red]\n"
             + "[red i]https://github.com/koloideal/Argenta[/red i] | [red bold i]made by kolo[/red bold i]"
         )
@@ -91,7 +98,7 @@ class RichRenderer(Renderer):
             for command_handler in registered_router.command_handlers:
                 handled_command = command_handler.handled_command
                 command_groups_description += '\n' + description_message_generator(
-                    handled_command.trigger,
+                    registered_routers.get_full_trigger(registered_router, handled_command.trigger),
                     handled_command.description,
                 )
         return command_groups_description
@@ -119,6 +126,16 @@ class RichRenderer(Renderer):
             if most_similar_command_trigger else "")
         )
 
+    @staticmethod
+    def render_text_for_ambiguous_command_handler(
+        command_trigger: str,
+        candidate_triggers: Iterable[str]
+    ) -> str:
+        return (
+            f"[red]Ambiguous command:[/red] [blue]{command_trigger}[/blue]"
+            f"[red], candidates:[/red] [blue]{', '.join(candidate_triggers)}[/blue]"
+        )
+
 
 class PlainRenderer(Renderer):
     @staticmethod
@@ -152,7 +169,7 @@ class PlainRenderer(Renderer):
             for command_handler in registered_router.command_handlers:
                 handled_command = command_handler.handled_command
                 command_groups_description += "\n" + description_message_generator(
-                    handled_command.trigger,
+                    registered_routers.get_full_trigger(registered_router, handled_command.trigger),
                     handled_command.description,
                 )
         return command_groups_description
@@ -180,3 +197,9 @@ class PlainRenderer(Renderer):
             if most_similar_command_trigger else "")
         )
 
+    @staticmethod
+    def render_text_for_ambiguous_command_handler(
+        command_trigger: str,
+        candidate_triggers: Iterable[str]
+    ) -> str:
+        return f"Ambiguous command: {command_trigger}, candidates: {', '.join(candidate_triggers)}"
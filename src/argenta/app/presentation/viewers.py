@@ -5,8 +5,6 @@ from contextlib import redirect_stdout
 from io import StringIO
 from typing import Callable, Iterable, TypeAlias
 
-from rich.text import Text
-
 from argenta.app import DynamicDividingLine, StaticDividingLine
 from argenta.app.presentation.renderers import Renderer
 from argenta.app.protocols import DescriptionMessageGenerator, Printer
@@ -53,6 +51,9 @@ class Viewer:
             )
         )
 
+    def view_rendered_command_groups_description(self, command_groups_description: str) -> None:
+        self._printer(command_groups_description)
+
     def view_initial_message(self, initial_message: str) -> None:
         self._printer(initial_message)
 
@@ -80,6 +81,8 @@ class Viewer:
                 dynamic_dividing_line_as_str: str = self._dividing_line.get_full_dynamic_line(
                     length=max_length_line, is_override=self._override_system_messages
                 )
+                from rich.text import Text
+
                 self._printer(dynamic_dividing_line_as_str + "\n")
                 self._printer(Text.from_ansi(stdout_result.strip("\n")).markup)
                 self._printer('\n' + dynamic_dividing_line_as_str)
@@ -1,14 +1,17 @@
 __all__ = [
     "NonStandardBehaviorHandler",
     "EmptyCommandHandler",
+    "AmbiguousCommandHandler",
     "MostSimilarCommandGetter",
     "Printer",
     "DescriptionMessageGenerator",
     "HandlerFunc",
+    "Middleware",
 ]
 
-from typing import Any, Protocol, TypeVar
+from typing import Any, Callable, Protocol, TypeVar
 
+from argenta.command import InputCommand
 from argenta.response import Response
 
 T = TypeVar("T", contravariant=True)
@@ -24,6 +27,11 @@ class EmptyCommandHandler(Protocol):
         raise NotImplementedError
 
 
+class AmbiguousCommandHandler(Protocol):
+    def __call__(self, _command: InputCommand, _candidates: list[str], /) -> None:
+        raise NotImplementedError
+
+
 class Printer(Protocol):
     def __call__(self, _text: str, /) -> None:
         raise NotImplementedError
@@ -42,3 +50,8 @@ class DescriptionMessageGenerator(Protocol):
 class HandlerFunc(Protocol):
     def __call__(self, response: Response, /, *args: Any, **kwargs: Any) -> None:
         raise NotImplementedError
+
+
+class Middleware(Protocol):
+    def __call__(self, response: Response, call_next: Callable[[Response], None], /) -> None:
+        raise NotImplementedError
@@ -1,8 +1,11 @@
 __all__ = ["RegisteredRouters"]
 
-from typing import Iterator
+from types import MappingProxyType
+from typing import Iterator, Mapping
 
 from argenta.router import Router
+from argenta.router.exceptions import (RepeatedAliasNameException,
+                                       RepeatedTriggerNameException)
 
 
 class RegisteredRouters:
@@ -14,22 +17,117 @@ class RegisteredRouters:
         """
         self.registered_routers: list[Router] = []
         self._paired_trigger_router: dict[str, Router] = {}
+        self._prefix_by_router: dict[Router, str] = {}
+        self._routers_by_group: dict[str, list[Router]] = {}
+        self._indexed_handlers_count: dict[Router, int] = {}
+        self._collision: RepeatedTriggerNameException | RepeatedAliasNameException | None = None
 
-    def add_registered_router(self, router: Router, /) -> None:
+    def add_registered_router(self, router: Router, /, prefix: str | None = None) -> None:
         """
         Private. Adds a new registered router
         :param router: registered router
+        :param prefix: subcommand path of the router commands, tokens separated by spaces
         :return: None
         """
         self.registered_routers.append(router)
-        for trigger in (router.aliases | router.triggers):
+        if prefix:
+            self._prefix_by_router[router] = prefix
+            group_tokens: list[str] = prefix.lower().split(" ")
+            for depth in range(1, len(group_tokens) + 1):
+                self._routers_by_group.setdefault(" ".join(group_tokens[:depth]), []).append(router)
+
+        self._index_routing_keys(router, self.get_prefixed_triggers(router), self.get_prefixed_aliases(router))
+        self._indexed_handlers_count[router] = len(router.command_handlers.command_handlers)
+
+    def sync(self) -> None:
+        """
+        Private. Indexes the handlers registered in the routers after their inclusion,
+        only the handlers added since the previous indexing are visited
+        :return: None
+        """
+        for router, indexed_count in self._indexed_handlers_count.items():
+            command_handlers = router.command_handlers.command_handlers
+            if len(command_handlers) == indexed_count:
+                continue
+            new_triggers: set[str] = set()
+            new_aliases: set[str] = set()
+            for command_handler in command_handlers[indexed_count:]:
+                new_triggers.add(self.get_full_trigger(router, command_handler.handled_command.trigger).lower())
+                new_aliases.update(
+                    self.get_full_trigger(router, alias).lower() for alias in command_handler.handled_command.aliases
+                )
+            self._index_routing_keys(router, new_triggers, new_aliases)
+            self._indexed_handlers_count[router] = len(command_handlers)
+
+    def raise_collision(self) -> None:
+        """
+        Private. Raises the first collision of the triggers and aliases between the registered routers
+        :return: None if there are no collisions else raise exception
+        """
+        if self._collision is not None:
+            raise self._collision
+
+    def _index_routing_keys(self, router: Router, triggers: set[str], aliases: set[str]) -> None:
+        """
+        Private. Adds the routing keys of the router to the index, the first collision is kept to be raised later
+        :param router: router owning the keys
+        :param triggers: prefixed triggers in lower case
+        :param aliases: prefixed aliases in lower case
+        :return: None
+        """
+        if self._collision is None:
+            if not triggers.isdisjoint(self._paired_trigger_router):
+                self._collision = RepeatedTriggerNameException()
+            elif alias_collisions := {alias for alias in aliases if alias in self._paired_trigger_router}:
+                self._collision = RepeatedAliasNameException(alias_collisions)
+
+        for trigger in triggers | aliases:
             self._paired_trigger_router[trigger] = router
-            
+
     def get_router_by_trigger(self, trigger: str) -> Router | None:
         return self._paired_trigger_router.get(trigger)
-        
+
     def get_triggers(self) -> set[str]:
         return set(self._paired_trigger_router.keys())
-        
+
+    @property
+    def prefixes(self) -> Mapping[Router, str]:
+        return MappingProxyType(self._prefix_by_router)
+
+    def get_full_trigger(self, router: Router, trigger: str) -> str:
+        """
+        Private. Prepends the prefix of the router to the trigger of its command
+        :param router: registered router
+        :param trigger: trigger or alias of the router command
+        :return: trigger as it is entered by the user
+        """
+        prefix: str | None = self._prefix_by_router.get(router)
+        return f"{prefix} {trigger}" if prefix else trigger
+
+    def get_prefixed_triggers(self, router: Router) -> set[str]:
+        if router not in self._prefix_by_router:
+            return router.triggers
+        return {self.get_full_trigger(router, trigger).lower() for trigger in router.triggers}
+
+    def get_prefixed_aliases(self, router: Router) -> set[str]:
+        if router not in self._prefix_by_router:
+            return router.aliases
+        return {self.get_full_trigger(router, alias).lower() for alias in router.aliases}
+
+    def get_group(self, group: str) -> "RegisteredRouters | None":
+        """
+        Private. Collects the routers included under the subcommand path, only the routers of the subtree are touched
+        :param group: subcommand path in any case, tokens separated by a single space
+        :return: the routers of the group as RegisteredRouters or None if there is no such group
+        """
+        group_routers: list[Router] | None = self._routers_by_group.get(group.lower())
+        if group_routers is None:
+            return None
+
+        registered_group: RegisteredRouters = RegisteredRouters()
+        for router in group_routers:
+            registered_group.add_registered_router(router, prefix=self._prefix_by_router[router])
+        return registered_group
+
     def __iter__(self) -> Iterator[Router]:
         return iter(self.registered_routers)
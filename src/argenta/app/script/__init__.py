@@ -0,0 +1,3 @@
+from argenta.app.script.entity import ScriptCommandResult as ScriptCommandResult
+from argenta.app.script.entity import ScriptSource as ScriptSource
+from argenta.app.script.entity import ScriptSummary as ScriptSummary
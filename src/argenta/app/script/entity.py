@@ -0,0 +1,83 @@
+__all__ = ["ScriptSource", "ScriptCommandResult", "ScriptSummary", "iter_script_commands"]
+
+import os
+from contextlib import contextmanager
+from typing import IO, Iterable, Iterator, NamedTuple, TypeAlias
+
+from argenta.app.exit_codes import ExitCode
+
+ScriptSource: TypeAlias = str | os.PathLike[str] | IO[str] | Iterable[str]
+
+COMMENT_PREFIX: str = "#"
+
+
+class ScriptCommandResult(NamedTuple):
+    """
+    Public. Result of a single command of the script
+    """
+
+    line_number: int
+    raw_command: str
+    exit_code: ExitCode
+    exception: Exception | None = None
+
+
+class ScriptSummary:
+    __slots__ = ("results", "is_stopped_on_error")
+
+    def __init__(self, results: list[ScriptCommandResult], *, is_stopped_on_error: bool) -> None:
+        """
+        Public. Per-command summary of the executed script
+        :param results: results of the executed commands in the order of execution
+        :param is_stopped_on_error: whether the script was stopped by a failed command
+        :return: None
+        """
+        self.results: list[ScriptCommandResult] = results
+        self.is_stopped_on_error: bool = is_stopped_on_error
+
+    @property
+    def failed_results(self) -> list[ScriptCommandResult]:
+        """
+        Public. Returns the results of the failed commands
+        :return: failed results as list[ScriptCommandResult]
+        """
+        return [result for result in self.results if result.exit_code != ExitCode.SUCCESS]
+
+    @property
+    def exit_code(self) -> ExitCode:
+        """
+        Public. Returns the exit code of the first failed command or success
+        :return: exit code of the script as ExitCode
+        """
+        return next(
+            (result.exit_code for result in self.results if result.exit_code != ExitCode.SUCCESS),
+            ExitCode.SUCCESS,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"ScriptSummary<executed={len(self.results)}, failed={len(self.failed_results)}, "
+            f"is_stopped_on_error={self.is_stopped_on_error}>"
+        )
+
+
+@contextmanager
+def iter_script_commands(source: ScriptSource) -> Iterator[Iterator[tuple[int, str]]]:
+    """
+    Private. Lazily reads the commands of the script with their line numbers,
+    empty lines and comments are skipped. A path is opened and closed here, other sources stay open
+    :param source: path of the script, file object or iterable of lines
+    :return: context manager of the iterator over the numbered commands
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding="utf-8") as script_file:
+            yield _iter_commands(script_file)
+    else:
+        yield _iter_commands(source)
+
+
+def _iter_commands(lines: Iterable[str]) -> Iterator[tuple[int, str]]:
+    for line_number, line in enumerate(lines, start=1):
+        raw_command: str = line.strip()
+        if raw_command and not raw_command.startswith(COMMENT_PREFIX):
+            yield line_number, raw_command
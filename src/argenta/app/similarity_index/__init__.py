@@ -0,0 +1,2 @@
+from argenta.app.similarity_index.entity import SimilarityIndex as SimilarityIndex
+from argenta.app.similarity_index.entity import TrigramIndex as TrigramIndex
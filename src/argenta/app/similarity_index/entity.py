@@ -0,0 +1,160 @@
+__all__ = ["SimilarityIndex", "TrigramIndex", "TrigramIndexState"]
+
+import heapq
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Iterable, Protocol, TypeAlias
+
+TrigramIndexState: TypeAlias = tuple[list[str], list[int], dict[str, list[int]]]
+
+
+class SimilarityIndex(Protocol):
+    def build(self, triggers: Iterable[str], /) -> None: ...
+    def get_most_similar(self, unknown_trigger: str, /, limit: int = 1) -> list[str]: ...
+
+
+class TrigramIndex(SimilarityIndex):
+    def __init__(
+        self,
+        cutoff: float = 0.6,
+        candidates_limit: int = 64,
+        fallback_limit: int = 10_000,
+    ) -> None:
+        """
+        Public. Similarity index over the triggers: an inverted index of the trigrams selects
+        the candidates with the highest trigram overlap with the unknown trigger,
+        then the candidates are reranked with the same ratio as difflib.get_close_matches.
+        A similar trigger may share no trigrams with the unknown one or fall outside the candidates,
+        so when the candidates give fewer matches than requested or the trigram overlap is tied
+        at the cut of the candidates, all triggers of a length able to pass the cutoff are reranked instead,
+        unless there are more of them than fallback_limit
+        :param cutoff: minimum similarity ratio of the suggested trigger, in range [0, 1]
+        :param candidates_limit: how many candidates are reranked per query
+        :param fallback_limit: maximum number of triggers reranked when the candidates give too few matches,
+               0 disables the fallback
+        :return: None
+        """
+        if not 0.0 <= cutoff <= 1.0:
+            raise ValueError(f"cutoff must be in range [0, 1], got {cutoff}")
+        if candidates_limit < 1:
+            raise ValueError(f"candidates_limit must be at least 1, got {candidates_limit}")
+        if fallback_limit < 0:
+            raise ValueError(f"fallback_limit must not be negative, got {fallback_limit}")
+
+        self._cutoff: float = cutoff
+        self._candidates_limit: int = candidates_limit
+        self._fallback_limit: int = fallback_limit
+        self._triggers: list[str] = []
+        self._trigrams_counts: list[int] = []
+        self._postings: dict[str, list[int]] = {}
+
+    def build(self, triggers: Iterable[str], /) -> None:
+        """
+        Public. Rebuilds the index over the given triggers
+        :param triggers: all triggers and aliases of the application
+        :return: None
+        """
+        self._triggers = sorted(set(triggers), key=lambda trigger: (len(trigger), trigger))
+        self._trigrams_counts = []
+        self._postings = {}
+        for trigger_id, trigger in enumerate(self._triggers):
+            trigrams: set[str] = _get_trigrams(trigger)
+            self._trigrams_counts.append(len(trigrams))
+            for trigram in trigrams:
+                self._postings.setdefault(trigram, []).append(trigger_id)
+
+    def export_state(self) -> TrigramIndexState:
+        """
+        Private. Returns the built index, to be restored by a later launch, see StartupSnapshot
+        :return: the sorted triggers, their trigram counts and the postings of the trigrams
+        """
+        return self._triggers, self._trigrams_counts, self._postings
+
+    def restore_state(self, state: TrigramIndexState) -> None:
+        """
+        Private. Restores the index exported by export_state instead of building it
+        :param state: the exported index
+        :return: None
+        """
+        self._triggers, self._trigrams_counts, self._postings = state
+
+    def get_most_similar(self, unknown_trigger: str, /, limit: int = 1) -> list[str]:
+        """
+        Public. Returns the triggers most similar to the unknown one, the best match goes first
+        :param unknown_trigger: the trigger that was not found
+        :param limit: maximum number of the returned triggers
+        :return: list of the similar triggers, empty if none of them passes the cutoff
+        """
+        unknown_trigrams: set[str] = _get_trigrams(unknown_trigger)
+        shared_trigrams_counts: Counter[int] = Counter()
+        for trigram in unknown_trigrams:
+            posting: list[int] | None = self._postings.get(trigram)
+            if posting is not None:
+                shared_trigrams_counts.update(posting)
+
+        def candidate_rank(trigger_id: int) -> tuple[float, int]:
+            shared: int = shared_trigrams_counts[trigger_id]
+            union: int = len(unknown_trigrams) + self._trigrams_counts[trigger_id] - shared
+            return -shared / union, trigger_id
+
+        candidate_ids: list[int] = heapq.nsmallest(
+            self._candidates_limit + 1, shared_trigrams_counts, key=candidate_rank
+        )
+        is_tied_at_cut: bool = False
+        if len(candidate_ids) > self._candidates_limit:
+            last_overlap, _ = candidate_rank(candidate_ids[-2])
+            next_overlap, _ = candidate_rank(candidate_ids[-1])
+            is_tied_at_cut = last_overlap == next_overlap
+            del candidate_ids[-1]
+
+        matcher = SequenceMatcher()
+        matcher.set_seq2(unknown_trigger)
+        scored_triggers: list[tuple[float, str]] = self._score(
+            matcher, (self._triggers[trigger_id] for trigger_id in candidate_ids)
+        )
+        if (len(scored_triggers) < limit or is_tied_at_cut) and len(candidate_ids) < len(self._triggers):
+            fallback_triggers: list[str] | None = self._get_fallback_triggers(len(unknown_trigger))
+            if fallback_triggers is not None:
+                scored_triggers = self._score(matcher, fallback_triggers)
+
+        return [trigger for _, trigger in heapq.nlargest(limit, scored_triggers)]
+
+    def _get_fallback_triggers(self, unknown_length: int) -> list[str] | None:
+        """
+        Private. Selects the triggers whose length lets their ratio with the unknown trigger pass the cutoff,
+        the ratio never exceeds 2 * min(a, b) / (a + b) for the lengths a and b, and the triggers are sorted by length
+        :param unknown_length: length of the unknown trigger
+        :return: the triggers to rerank or None if there are more of them than fallback_limit
+        """
+        if self._cutoff > 0.0:
+            start: int = bisect_left(self._triggers, int(unknown_length * self._cutoff / (2 - self._cutoff)), key=len)
+            end: int = bisect_right(self._triggers, int(unknown_length * (2 - self._cutoff) / self._cutoff) + 1, key=len)
+        else:
+            start, end = 0, len(self._triggers)
+        if end - start > self._fallback_limit:
+            return None
+        return self._triggers[start:end]
+
+    def _score(self, matcher: SequenceMatcher[str], triggers: Iterable[str]) -> list[tuple[float, str]]:
+        """
+        Private. Scores the triggers with the difflib ratio, the same way difflib.get_close_matches does
+        :param matcher: matcher with the unknown trigger set as the second sequence
+        :param triggers: the scored triggers
+        :return: the triggers passing the cutoff paired with their ratio
+        """
+        scored_triggers: list[tuple[float, str]] = []
+        for trigger in triggers:
+            matcher.set_seq1(trigger)
+            if (
+                matcher.real_quick_ratio() >= self._cutoff
+                and matcher.quick_ratio() >= self._cutoff
+                and (ratio := matcher.ratio()) >= self._cutoff
+            ):
+                scored_triggers.append((ratio, trigger))
+        return scored_triggers
+
+
+def _get_trigrams(word: str) -> set[str]:
+    padded_word: str = f"  {word.lower()} "
+    return {padded_word[i:i + 3] for i in range(len(padded_word) - 2)}
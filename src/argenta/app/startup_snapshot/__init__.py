@@ -0,0 +1,3 @@
+from argenta.app.startup_snapshot.entity import \
+    CompiledStartupState as CompiledStartupState
+from argenta.app.startup_snapshot.entity import StartupSnapshot as StartupSnapshot
@@ -0,0 +1,209 @@
+__all__ = ["CompiledStartupState", "StartupSnapshot"]
+
+import os
+import sys
+from functools import partial
+from re import Pattern
+from types import CodeType
+from typing import IO, Iterable, NamedTuple
+
+import argenta
+from argenta.app.completion_schemas.entity import CompletionSchemas
+from argenta.app.prefix_tree.entity import PrefixTree
+from argenta.app.registered_routers.entity import RegisteredRouters
+from argenta.app.similarity_index.entity import TrigramIndexState
+from argenta.app.trigger_tree.entity import TriggerTree
+from argenta.command.flag.models import Flag, PossibleValues
+
+SNAPSHOT_FORMAT_VERSION: int = 1
+
+
+class CompiledStartupState(NamedTuple):
+    """
+    Private. Everything the application compiles from its routers before polling
+    """
+
+    dispatch_positions: dict[str, tuple[int, int]]
+    triggers: set[str]
+    prefix_tree: PrefixTree | None
+    trigger_tree: TriggerTree
+    similarity_state: TrigramIndexState | None
+    completion_schemas: CompletionSchemas
+    command_groups_description: str
+
+
+class StartupSnapshot:
+    def __init__(self, directory: str | None = None, *, name: str | None = None) -> None:
+        """
+        Public. On-disk snapshot of the compiled state of the application: the dispatch table, the prefix trees,
+        the similarity index, the completion tables and the rendered help. The snapshot is keyed on the definitions
+        of the routers, the settings affecting the compiled state, the Python version and the argenta modules,
+        so the next launch of the same build loads it instead of compiling, while any change recompiles it.
+        Only the compiled tables are snapshotted: the routers are still registered and validated for collisions
+        on every launch, the flag validators and converters are built with the commands as before,
+        and the handlers are bound back by the positions of their routers and of the handlers in them.
+        A snapshot is unpickled only if it and its directory are owned by the current user and
+        are not writable by the group or others
+        :param directory: directory of the snapshots, the user cache directory by default
+        :param name: name of the application, the path of the launched script by default
+        :return: None
+        """
+        self.directory: str = directory or self._get_default_directory()
+        self.name: str = name or (os.path.abspath(sys.argv[0]) if sys.argv and sys.argv[0] else "interactive")
+
+    def get_key(self, registered_routers: RegisteredRouters, *, settings: Iterable[object] = ()) -> str:
+        """
+        Private. Hashes the definitions of the routers: titles, prefixes, commands with their aliases,
+        descriptions and flags, and the qualified names of the handlers
+        :param registered_routers: the registered routers, including the system one
+        :param settings: settings of the application affecting the compiled state, callables are described by their code
+        :return: the key of the snapshot as str
+        """
+        from hashlib import sha256
+
+        digest = sha256()
+        for part in (SNAPSHOT_FORMAT_VERSION, sys.version, *_get_package_fingerprint(), *settings):
+            digest.update(f"{_describe_setting(part)}\0".encode("utf-8"))
+
+        for router in registered_routers:
+            digest.update(repr((
+                type(router).__qualname__,
+                router.title,
+                registered_routers.prefixes.get(router),
+                router.is_redirect_stdout_disabled,
+                getattr(router, "import_path", None),
+            )).encode("utf-8"))
+            for command_handler in router.command_handlers:
+                handled_command = command_handler.handled_command
+                digest.update(repr((
+                    _get_qualified_name(command_handler.handler_as_func),
+                    handled_command.trigger,
+                    sorted(handled_command.aliases),
+                    handled_command.description,
+                    [(flag.string_entity, _describe_possible_values(flag)) for flag in handled_command.registered_flags],
+                )).encode("utf-8"))
+        return digest.hexdigest()
+
+    def load(self, key: str) -> CompiledStartupState | None:
+        """
+        Private. Reads the snapshot stored under the key, the garbage collector is paused while the objects
+        of the snapshot are created, which makes the load several times faster. Since unpickling can run
+        arbitrary code, a snapshot that someone else could have written is ignored
+        :param key: the key of the snapshot, see get_key
+        :return: the compiled state or None if the snapshot is missing, outdated or damaged
+        """
+        import gc
+        import pickle
+
+        is_gc_enabled: bool = gc.isenabled()
+        gc.disable()
+        try:
+            if not _is_private_to_current_user(os.stat(self.directory)):
+                return None
+            with open(self._get_snapshot_path(), "rb") as snapshot_file:
+                if not _is_private_to_current_user(os.fstat(snapshot_file.fileno())):
+                    return None
+                if snapshot_file.readline().rstrip(b"\n") != key.encode("ascii"):
+                    return None
+                compiled_state = pickle.load(snapshot_file)
+        except (OSError, EOFError, ValueError, TypeError, AttributeError, ImportError, pickle.UnpicklingError):
+            return None
+        finally:
+            if is_gc_enabled:
+                gc.enable()
+        return compiled_state if isinstance(compiled_state, CompiledStartupState) else None
+
+    def store(self, key: str, compiled_state: CompiledStartupState) -> None:
+        """
+        Private. Atomically writes the snapshot, an unwritable cache directory is ignored
+        :param key: the key of the snapshot, see get_key
+        :param compiled_state: the compiled state of the application
+        :return: None
+        """
+        import pickle
+        from tempfile import NamedTemporaryFile
+
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            with NamedTemporaryFile(dir=self.directory, suffix=".tmp", delete=False) as temporary_file:
+                self._write(temporary_file, key, compiled_state)
+            os.replace(temporary_file.name, self._get_snapshot_path())
+        except (OSError, pickle.PicklingError):
+            pass
+
+    def _get_snapshot_path(self) -> str:
+        from hashlib import sha256
+
+        return os.path.join(self.directory, sha256(self.name.encode("utf-8")).hexdigest() + ".pickle")
+
+    @staticmethod
+    def _write(snapshot_file: IO[bytes], key: str, compiled_state: CompiledStartupState) -> None:
+        import pickle
+
+        snapshot_file.write(key.encode("ascii") + b"\n")
+        pickle.dump(compiled_state, snapshot_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _get_default_directory() -> str:
+        cache_home: str = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        return os.path.join(cache_home, "argenta", "snapshots")
+
+
+def _is_private_to_current_user(status: os.stat_result) -> bool:
+    """
+    Private. Checks that the file is owned by the current user and is not writable by the group or others,
+    platforms without user ids are not checked
+    :param status: status of the file
+    :return: whether only the current user could have written the file as bool
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    return status.st_uid == os.getuid() and not status.st_mode & 0o022
+
+
+def _get_package_fingerprint() -> list[str]:
+    """
+    Private. Modification times of the argenta modules, which change with every installed version
+    and with every edit of an editable install
+    :return: the fingerprint as list of str
+    """
+    fingerprint: list[str] = []
+    for package_directory in argenta.__path__:
+        for directory, _, file_names in sorted(os.walk(package_directory)):
+            for file_name in sorted(file_names):
+                if file_name.endswith(".py"):
+                    file_path: str = os.path.join(directory, file_name)
+                    fingerprint.append(f"{file_path}:{os.stat(file_path).st_mtime_ns}")
+    return fingerprint
+
+
+def _get_qualified_name(func: object) -> str:
+    while isinstance(func, partial):
+        func = func.func
+    return f"{getattr(func, '__module__', None)}.{getattr(func, '__qualname__', type(func).__qualname__)}"
+
+
+def _describe_setting(setting: object) -> str:
+    """
+    Private. Describes the setting of the application, a function is described by its bytecode
+    and constants, so editing a lambda passed as a setting changes the key
+    :param setting: the setting
+    :return: the description as str
+    """
+    if not callable(setting):
+        return str(setting)
+    code = getattr(setting, "__code__", None)
+    if code is None:
+        return _get_qualified_name(setting)
+    constants: list[object] = [constant for constant in code.co_consts if not isinstance(constant, CodeType)]
+    return f"{_get_qualified_name(setting)}:{code.co_code.hex()}:{code.co_names}:{constants!r}"
+
+
+def _describe_possible_values(flag: Flag) -> str:
+    if isinstance(flag.possible_values, PossibleValues):
+        return str(flag.possible_values.value)
+    if isinstance(flag.possible_values, Pattern):
+        return f"{flag.possible_values.pattern}:{flag.possible_values.flags}"
+    if isinstance(flag.possible_values, (set, frozenset)):
+        return repr(sorted(flag.possible_values))
+    return repr(flag.possible_values)
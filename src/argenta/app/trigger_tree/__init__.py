@@ -0,0 +1 @@
+from argenta.app.trigger_tree.entity import TriggerTree as TriggerTree
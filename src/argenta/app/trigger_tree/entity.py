@@ -0,0 +1,100 @@
+__all__ = ["TriggerTree"]
+
+from typing import Iterable, Iterator
+
+
+class TriggerTreeNode:
+    __slots__ = ("children", "is_command")
+
+    def __init__(self) -> None:
+        """
+        Private. Node of the trigger tree, one token of the subcommand path
+        :return: None
+        """
+        self.children: dict[str, TriggerTreeNode] = {}
+        self.is_command: bool = False
+
+
+class TriggerTree:
+    def __init__(self, triggers: Iterable[str] = ()) -> None:
+        """
+        Private. Tree of the tokens of the subcommand triggers such as "db migrate up",
+        walked token by token, so the subcommand path is split off the input in time proportional to its depth.
+        Only the triggers of several tokens are stored as paths, single-token triggers just mark existing nodes
+        :param triggers: full triggers of the registered commands, tokens separated by a single space
+        :return: None
+        """
+        self._root: dict[str, TriggerTreeNode] = {}
+        single_token_triggers: list[str] = []
+        for trigger in triggers:
+            tokens: list[str] = trigger.lower().split(" ")
+            if len(tokens) == 1:
+                single_token_triggers.append(tokens[0])
+                continue
+            self._add(tokens)
+
+        for trigger in single_token_triggers:
+            if node := self._root.get(trigger):
+                node.is_command = True
+
+    def _add(self, tokens: list[str]) -> None:
+        children: dict[str, TriggerTreeNode] = self._root
+        node: TriggerTreeNode | None = None
+        for token in tokens:
+            node = children.setdefault(token, TriggerTreeNode())
+            children = node.children
+        if node is not None:
+            node.is_command = True
+
+    def __bool__(self) -> bool:
+        return bool(self._root)
+
+    def is_group(self, trigger: str) -> bool:
+        """
+        Private. Checks whether the trigger is a prefix of the subcommands
+        :param trigger: full trigger, tokens separated by a single space
+        :return: is the trigger a group of the subcommands as bool
+        """
+        children: dict[str, TriggerTreeNode] = self._root
+        node: TriggerTreeNode | None = None
+        for token in trigger.lower().split(" "):
+            node = children.get(token)
+            if node is None:
+                return False
+            children = node.children
+        return bool(children)
+
+    def join_trigger_path(self, tokens: Iterable[str]) -> Iterator[str]:
+        """
+        Private. Joins the leading tokens forming the subcommand path into a single trigger token,
+        the rest of the tokens is passed through untouched. An unknown token after a group
+        that is not a command itself is joined as well, so that it is reported as an unknown subcommand
+        :param tokens: tokens of the input command
+        :return: iterator over the joined trigger followed by the remaining tokens
+        """
+        token_iterator: Iterator[str] = iter(tokens)
+        first_token: str | None = next(token_iterator, None)
+        if first_token is None:
+            return
+
+        trigger_path: list[str] = [first_token]
+        pending_token: str | None = None
+        node: TriggerTreeNode | None = self._root.get(first_token.lower())
+        while node is not None and node.children:
+            token: str | None = next(token_iterator, None)
+            if token is None:
+                break
+            child: TriggerTreeNode | None = node.children.get(token.lower())
+            if child is None:
+                if node.is_command or token.startswith("-"):
+                    pending_token = token
+                else:
+                    trigger_path.append(token)
+                break
+            trigger_path.append(token)
+            node = child
+
+        yield " ".join(trigger_path)
+        if pending_token is not None:
+            yield pending_token
+        yield from token_iterator
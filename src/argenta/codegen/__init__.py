@@ -0,0 +1,3 @@
+from argenta.codegen.entity import CompiledRouter as CompiledRouter
+from argenta.codegen.entity import CompiledRoutes as CompiledRoutes
+from argenta.codegen.generator import generate_dispatch_module as generate_dispatch_module
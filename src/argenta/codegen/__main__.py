@@ -0,0 +1,40 @@
+import sys
+from argparse import ArgumentParser, Namespace
+from importlib import import_module
+
+from argenta.app.models import App
+from argenta.codegen.generator import generate_dispatch_module
+
+
+def main() -> None:
+    parser = ArgumentParser(
+        prog="python -m argenta.codegen",
+        description="Generates the dispatch module of the application, see App.include_compiled_routes",
+    )
+    parser.add_argument("app", help='path of the application as "package.module:attribute"')
+    parser.add_argument("-o", "--output", help="path of the generated module, stdout by default")
+    args: Namespace = parser.parse_args()
+
+    module_name, separator, attribute_name = args.app.partition(":")
+    if not separator or not module_name or not attribute_name:
+        parser.error(f"invalid application path: {args.app!r}, expected 'package.module:attribute'")
+
+    sys.path.insert(0, "")
+    app = getattr(import_module(module_name), attribute_name, None)
+    if not isinstance(app, App):
+        parser.error(f"'{args.app}' is {type(app).__name__}, not App")
+
+    try:
+        module_source: str = generate_dispatch_module(app, source=args.app)
+    except ValueError as error:
+        parser.error(str(error))
+
+    if args.output is None:
+        sys.stdout.write(module_source)
+        return
+    with open(args.output, "w", encoding="utf-8") as output_file:
+        output_file.write(module_source)
+
+
+if __name__ == "__main__":
+    main()
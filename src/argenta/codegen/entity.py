@@ -0,0 +1,139 @@
+__all__ = ["CompiledRouter", "CompiledRoutes", "import_object"]
+
+from functools import partial
+from importlib import import_module
+from re import Pattern
+from typing import Callable, Container, Iterable, Mapping, Sequence, TypeAlias
+
+from argenta.command import Command, Flag, Flags
+from argenta.command.flag.models import (PREFIX_TYPE, FlagValueConverter,
+                                         FlagValueValidator, PossibleValues)
+from argenta.response import Response
+from argenta.router import Router
+from argenta.router.command_handler.entity import CommandHandler
+
+FlagRecord: TypeAlias = tuple[
+    str, PREFIX_TYPE, Container[str] | Pattern[str] | PossibleValues, FlagValueValidator, FlagValueConverter | None
+]
+CommandRecord: TypeAlias = tuple[str, str, tuple[str, ...], tuple[FlagRecord, ...], str]
+
+
+class CompiledRouter(Router):
+    def __init__(
+        self,
+        title: str = "Default title",
+        *,
+        commands: Iterable[CommandRecord],
+        disable_redirect_stdout: bool = False,
+    ) -> None:
+        """
+        Private. Router restored from the module generated by argenta.codegen. The commands were validated
+        when the module was generated, so they are registered without validation, and the module of a handler
+        is imported on the first dispatch to it, the handler is bound in place of the stub afterwards
+        :param title: the title of the router, displayed when displaying the available commands
+        :param commands: records of the commands: trigger, description, aliases, flags with their precompiled
+               validators and converters, and the handler as "package.module:qualified.name"
+        :param disable_redirect_stdout: see Router
+        :return: None
+        """
+        super().__init__(title, disable_redirect_stdout=disable_redirect_stdout)
+        self._bound_command_handlers: list[CommandHandler] = []
+        self._bind_callbacks: list[Callable[[CommandHandler], None]] = []
+
+        for trigger, description, aliases, flag_records, handler_path in commands:
+            command = Command.from_compiled(
+                trigger,
+                description=description,
+                flags=Flags([
+                    Flag(name, prefix=prefix, possible_values=possible_values, type=converter)
+                    for name, prefix, possible_values, _, converter in flag_records
+                ]),
+                aliases=aliases,
+                flag_validators={prefix + name: validator for name, prefix, _, validator, _ in flag_records},
+                flag_converters={
+                    prefix + name: converter
+                    for name, prefix, _, _, converter in flag_records
+                    if converter is not None
+                },
+            )
+            self.triggers.add(trigger.lower())
+            self.aliases.update(alias.lower() for alias in aliases)
+            self.command_handlers.add_handler(
+                CommandHandler(partial(self._handle_compiled_command, trigger.lower(), handler_path), command)
+            )
+
+    def add_bind_callback(self, callback: Callable[[CommandHandler], None]) -> None:
+        """
+        Private. Registers the callback called with the command handler once its handler is imported and bound,
+        right away for the handlers already bound
+        :param callback: the callback, e.g. wrapping the bound handler
+        :return: None
+        """
+        for command_handler in self._bound_command_handlers:
+            callback(command_handler)
+        self._bind_callbacks.append(callback)
+
+    def _handle_compiled_command(self, trigger: str, handler_path: str, response: Response) -> None:
+        """
+        Private. Imports the handler of the command, binds it to the command and calls it as bound,
+        so the bind callbacks take effect on the first call as well
+        :param trigger: the trigger of the command in lower case
+        :param handler_path: path of the handler as "package.module:qualified.name"
+        :param response: the response passed to the handler
+        :return: None
+        """
+        handler: object = import_object(handler_path)
+        if not callable(handler):
+            raise TypeError(f"'{handler_path}' is {type(handler).__name__}, not a handler")
+
+        command_handler: CommandHandler | None = self.command_handlers.get_command_handler_by_trigger(trigger)
+        if command_handler is None:
+            handler(response)
+            return
+
+        command_handler.handler_as_func = handler
+        self._bound_command_handlers.append(command_handler)
+        for callback in self._bind_callbacks:
+            callback(command_handler)
+        command_handler.handler_as_func(response)
+
+
+def import_object(path: str) -> object:
+    """
+    Private. Imports the object referenced by the generated module, e.g. a handler or a flag converter
+    :param path: path of the object as "package.module:qualified.name"
+    :return: the imported object
+    """
+    module_name, _, qualified_name = path.partition(":")
+    imported_object: object = import_module(module_name)
+    for attribute_name in qualified_name.split("."):
+        imported_object = getattr(imported_object, attribute_name)
+    return imported_object
+
+
+class CompiledRoutes:
+    def __init__(
+        self,
+        routers: Sequence[CompiledRouter],
+        *,
+        prefixes: Sequence[str | None],
+        dispatch_table: Mapping[str, tuple[int, int]],
+        command_groups_description: str | None,
+        renderer: str,
+    ) -> None:
+        """
+        Public. The routers of an application compiled by python -m argenta.codegen "package.module:app",
+        registered in place of the original routers with App.include_compiled_routes
+        :param routers: the compiled routers in the order of registration
+        :param prefixes: subcommand paths of the routers
+        :param dispatch_table: lowercased triggers paired with the positions of their router and handler
+        :param command_groups_description: the help rendered from the routers, None if it was rendered
+               by a custom description message pattern, which cannot be checked to be the same
+        :param renderer: name of the renderer the help was rendered with
+        :return: None
+        """
+        self.routers: Sequence[CompiledRouter] = routers
+        self.prefixes: Sequence[str | None] = prefixes
+        self.dispatch_table: Mapping[str, tuple[int, int]] = dispatch_table
+        self.command_groups_description: str | None = command_groups_description
+        self.renderer: str = renderer
@@ -0,0 +1,223 @@
+__all__ = ["generate_dispatch_module"]
+
+import builtins
+from importlib import import_module
+from re import Pattern
+from typing import TYPE_CHECKING
+
+from argenta.app.dispatch_table import DispatchTable
+from argenta.app.registered_routers.entity import RegisteredRouters
+from argenta.command import Command, Flag
+from argenta.command.flag.models import PossibleValues
+from argenta.router import LazyRouter, Router
+from argenta.router.command_handler.entity import CommandHandler
+
+if TYPE_CHECKING:
+    from argenta.app.models import App
+
+LITERAL_TYPES: tuple[type, ...] = (str, int, float, bool, type(None))
+
+MODULE_TEMPLATE: str = '''"""
+Dispatch module of {source} generated by python -m argenta.codegen, do not edit it by hand,
+regenerate it after changing the routers of the application
+"""
+import re
+
+from argenta.codegen import CompiledRouter, CompiledRoutes
+from argenta.codegen.entity import import_object
+from argenta.command.flag.models import PossibleValues
+
+_PATTERNS = ({patterns})
+
+ROUTES = CompiledRoutes(
+    [{routers}
+    ],
+    prefixes={prefixes!r},
+    dispatch_table={{{dispatch_table}
+    }},
+    command_groups_description={command_groups_description!r},
+    renderer={renderer!r},
+)
+'''
+ROUTER_TEMPLATE: str = """
+        CompiledRouter(
+            {title!r},
+            disable_redirect_stdout={disable_redirect_stdout!r},
+            commands=({commands}
+            ),
+        ),"""
+
+
+def generate_dispatch_module(app: "App", *, source: str) -> str:
+    """
+    Public. Generates the source of a module holding the routers of the application as literals: the commands,
+    the flags with their precompiled validators, the dispatch table and the rendered help. The handlers are
+    referenced by their qualified names, so they must be defined at the module level
+    :param app: the application with all routers included
+    :param source: path of the application as "package.module:attribute", written to the docstring of the module
+    :return: the source of the module as str
+    """
+    app._validate_routers_for_collisions()
+    routers: list[Router] = [router for router in app.registered_routers if router is not app._system_router]
+    prefixes: list[str | None] = [app.registered_routers.prefixes.get(router) for router in routers]
+
+    compiled_routers: RegisteredRouters = RegisteredRouters()
+    for router, prefix in zip(routers, prefixes):
+        compiled_routers.add_registered_router(router, prefix=prefix)
+
+    patterns: list[str] = []
+    router_sources: list[str] = []
+    for router in routers:
+        command_sources: list[str] = []
+        for command_handler in router.command_handlers:
+            handled_command, handler = _resolve_command_handler(router, command_handler)
+            flag_sources: list[str] = [_get_flag_source(flag, patterns) for flag in handled_command.registered_flags]
+            command_sources.append(
+                f"\n                ({command_handler.handled_command.trigger!r}, "
+                f"{command_handler.handled_command.description!r}, "
+                f"{tuple(sorted(command_handler.handled_command.aliases))!r}, "
+                f"({', '.join(flag_sources)}{',' if len(flag_sources) == 1 else ''}), "
+                f"{_get_handler_path(handler, command_handler.handled_command)!r}),"
+            )
+        router_sources.append(ROUTER_TEMPLATE.format(
+            title=router.title,
+            disable_redirect_stdout=router.is_redirect_stdout_disabled,
+            commands="".join(command_sources),
+        ))
+
+    is_default_help: bool = app._description_message_generator is app._default_description_message_generator
+    return MODULE_TEMPLATE.format(
+        source=source,
+        patterns="".join(f"\n    {pattern}," for pattern in patterns) + ("\n" if patterns else ""),
+        routers="".join(router_sources),
+        prefixes=prefixes,
+        dispatch_table="".join(
+            f"\n        {trigger!r}: {position!r},"
+            for trigger, position in sorted(
+                DispatchTable(routers, prefixes=compiled_routers.prefixes).get_positions(routers).items(),
+                key=lambda item: (item[1], item[0]),
+            )
+        ),
+        command_groups_description=(
+            app._renderer.render_command_groups_description(app._description_message_generator, compiled_routers)
+            if is_default_help else None
+        ),
+        renderer=type(app._renderer).__name__,
+    )
+
+
+def _resolve_command_handler(router: Router, command_handler: CommandHandler) -> tuple[Command, object]:
+    """
+    Private. Finds the command whose flags are validated and the handler called on dispatch,
+    for a lazy router they belong to the imported router
+    :param router: the router of the command
+    :param command_handler: the registered command handler
+    :return: the command and the handler
+    """
+    if not isinstance(router, LazyRouter):
+        return command_handler.handled_command, command_handler.handler_as_func
+
+    loaded_handler: CommandHandler | None = router.load().command_handlers.get_command_handler_by_trigger(
+        command_handler.handled_command.trigger.lower()
+    )
+    if loaded_handler is None:
+        raise ValueError(f"Command '{command_handler.handled_command.trigger}' is not found in '{router.import_path}'")
+    return loaded_handler.handled_command, loaded_handler.handler_as_func
+
+
+def _get_handler_path(handler: object, command: Command) -> str:
+    """
+    Private. Builds the path the handler is imported by
+    :param handler: the handler of the command
+    :param command: the command, for the error message
+    :return: path of the handler as "package.module:qualified.name"
+    """
+    handler_path: str | None = _get_import_path(handler)
+    if handler_path is None:
+        raise ValueError(
+            f"The handler of the command '{command.trigger}' cannot be imported by its qualified name, "
+            "define it at the module level"
+        )
+    return handler_path
+
+
+def _get_import_path(imported_object: object) -> str | None:
+    """
+    Private. Builds the path the object is imported by and checks that it leads to the same object
+    :param imported_object: the object, e.g. a handler or a flag converter
+    :return: path of the object as "package.module:qualified.name" or None if it cannot be imported by it
+    """
+    module_name: str | None = getattr(imported_object, "__module__", None)
+    qualified_name: str | None = getattr(imported_object, "__qualname__", None)
+    resolved_object: object = None
+    if module_name and qualified_name and "<" not in qualified_name:
+        try:
+            resolved_object = import_module(module_name)
+            for attribute_name in qualified_name.split("."):
+                resolved_object = getattr(resolved_object, attribute_name)
+        except (ImportError, AttributeError):
+            resolved_object = None
+    return f"{module_name}:{qualified_name}" if resolved_object is imported_object else None
+
+
+def _get_converter_source(flag: Flag) -> str:
+    """
+    Private. Builds the source of the converter of the flag, the same converter as Flag.compile_value_converter returns
+    :param flag: the registered flag
+    :return: the source of the converter as str
+    """
+    converter: object = flag.compile_value_converter()
+    if converter is None:
+        return "None"
+    converter_name: object = getattr(converter, "__name__", None)
+    if isinstance(converter_name, str) and getattr(builtins, converter_name, None) is converter:
+        return converter_name
+
+    converter_path: str | None = _get_import_path(converter)
+    if converter_path is None:
+        raise ValueError(
+            f"The converter of the flag '{flag.string_entity}' cannot be imported by its qualified name, "
+            "define it at the module level"
+        )
+    return f"import_object({converter_path!r})"
+
+
+def _get_flag_source(flag: Flag, patterns: list[str]) -> str:
+    """
+    Private. Builds the record of the flag with the literal of its possible values, its validator,
+    the same validator as Flag.compile_value_validator returns, and its converter
+    :param flag: the registered flag
+    :param patterns: sources of the compiled patterns of the module, a pattern of the flag is appended
+    :return: the source of the record as str
+    """
+    possible_values: object = flag.possible_values
+    values_source: str
+    validator_source: str
+    if isinstance(possible_values, PossibleValues):
+        values_source = f"PossibleValues.{possible_values.name}"
+        validator_source = '"".__eq__' if possible_values == PossibleValues.NEITHER else "bool"
+    elif isinstance(possible_values, Pattern):
+        patterns.append(f"re.compile({possible_values.pattern!r}, {possible_values.flags})")
+        values_source = f"_PATTERNS[{len(patterns) - 1}]"
+        validator_source = f"{values_source}.match"
+    elif isinstance(possible_values, (list, tuple, set, frozenset)) and all(
+        isinstance(value, LITERAL_TYPES) for value in possible_values
+    ):
+        values: list[object] = (
+            list(possible_values) if isinstance(possible_values, (list, tuple)) else sorted(possible_values, key=repr)
+        )
+        if isinstance(possible_values, list):
+            values_source = repr(values)
+        elif isinstance(possible_values, tuple):
+            values_source = repr(tuple(values))
+        elif isinstance(possible_values, frozenset):
+            values_source = f"frozenset({values!r})"
+        else:
+            values_source = f"{{{', '.join(map(repr, values))}}}" if values else "set()"
+        validator_source = f"frozenset({values!r}).__contains__"
+    else:
+        raise ValueError(
+            f"The possible values of the flag '{flag.string_entity}' are {type(possible_values).__name__}, "
+            "only PossibleValues, patterns, lists, tuples and sets of literals can be generated"
+        )
+    return f"({flag.name!r}, {flag.prefix!r}, {values_source}, {validator_source}, {_get_converter_source(flag)})"
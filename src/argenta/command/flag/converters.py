@@ -0,0 +1,62 @@
+__all__ = ["to_bool", "to_duration", "to_json", "PRECOMPILED_CONVERTERS"]
+
+import re
+from datetime import timedelta
+from json import loads
+from typing import Any, Callable
+
+TRUE_VALUES: frozenset[str] = frozenset({"", "1", "true", "yes", "y", "on"})
+FALSE_VALUES: frozenset[str] = frozenset({"0", "false", "no", "n", "off"})
+
+DURATION_PART_PATTERN: re.Pattern[str] = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h|d|w)")
+DURATION_PATTERN: re.Pattern[str] = re.compile(r"(?:\d+(?:\.\d+)?(?:ms|s|m|h|d|w))+")
+DURATION_UNIT_SECONDS: dict[str, float] = {
+    "ms": 0.001,
+    "s": 1,
+    "m": 60,
+    "h": 3600,
+    "d": 86400,
+    "w": 604800,
+}
+
+
+def to_bool(value: str) -> bool:
+    """
+    Public. Converts the flag value to bool, the flag entered without a value is True
+    :param value: the input value of the flag, one of 1/0, true/false, yes/no, y/n, on/off in any case
+    :return: the converted value as bool
+    """
+    lowered_value: str = value.lower()
+    if lowered_value in TRUE_VALUES:
+        return True
+    if lowered_value in FALSE_VALUES:
+        return False
+    raise ValueError(f"Invalid boolean value: {value!r}")
+
+
+def to_duration(value: str) -> timedelta:
+    """
+    Public. Converts the flag value to timedelta
+    :param value: the input value of the flag as number of seconds or units joined together, e.g. "90", "1h30m", "250ms"
+    :return: the converted value as timedelta
+    """
+    if DURATION_PATTERN.fullmatch(value) is None:
+        return timedelta(seconds=float(value))
+    return timedelta(seconds=sum(
+        float(amount) * DURATION_UNIT_SECONDS[unit] for amount, unit in DURATION_PART_PATTERN.findall(value)
+    ))
+
+
+def to_json(value: str) -> Any:
+    """
+    Public. Parses the flag value as JSON
+    :param value: the input value of the flag
+    :return: the parsed value
+    """
+    return loads(value)
+
+
+PRECOMPILED_CONVERTERS: dict[object, Callable[[str], Any]] = {
+    bool: to_bool,
+    timedelta: to_duration,
+}
@@ -25,5 +25,5 @@ class PredefinedFlags:
         possible_values=re.compile(r"^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$"),
     )
 
-    PORT = Flag(name="port", possible_values=re.compile(r"^\d{1,5}$"))
-    SHORT_PORT = Flag(name="P", prefix=DEFAULT_PREFIX, possible_values=re.compile(r"^\d{1,5}$"))
+    PORT = Flag(name="port", possible_values=re.compile(r"^\d{1,5}$"), type=int)
+    SHORT_PORT = Flag(name="P", prefix=DEFAULT_PREFIX, possible_values=re.compile(r"^\d{1,5}$"), type=int)
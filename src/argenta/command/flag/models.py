@@ -2,9 +2,14 @@ __all__ = ["PossibleValues", "ValidationStatus", "Flag", "InputFlag", "InputFlag
 
 from enum import Enum
 from re import Pattern
-from typing import Any, Container, Generic, Iterator, Literal, TypeVar, override
+from typing import (Any, Callable, Container, Generic, Iterator, Literal, TypeVar, cast,
+                    override)
 
 PREFIX_TYPE = Literal["-", "--", "---"]
+FlagValueValidator = Callable[[str], object]
+FlagValueConverter = Callable[[str], Any]
+
+CONVERSION_ERRORS: tuple[type[Exception], ...] = (ValueError, TypeError, ArithmeticError)
 
 
 class PossibleValues(Enum):
@@ -19,23 +24,29 @@ class ValidationStatus(Enum):
 
 
 class Flag:
+    __slots__ = ("name", "prefix", "possible_values", "type")
+
     def __init__(
         self,
         name: str,
         *,
         prefix: PREFIX_TYPE = "--",
         possible_values: Container[str] | Pattern[str] | PossibleValues = PossibleValues.ALL,
+        type: FlagValueConverter | None = None,
     ) -> None:
         """
         Public. The entity of the flag being registered for subsequent processing
         :param name: The name of the flag
         :param prefix: The prefix of the flag
         :param possible_values: The possible values of the flag, if False then the flag cannot have a value
+        :param type: the type or converter of the flag value, e.g. int, float, pathlib.Path or to_json,
+               the value is converted once before the handler is called, a failed conversion makes the flag invalid
         :return: None
         """
         self.name: str = name
         self.prefix: PREFIX_TYPE = prefix
         self.possible_values: Container[str] | Pattern[str] | PossibleValues = possible_values
+        self.type: FlagValueConverter | None = type
 
     def validate_input_flag_value(self, input_flag_value: str) -> bool:
         """
@@ -53,6 +64,41 @@ class Flag:
 
         return input_flag_value in self.possible_values
 
+    def compile_value_validator(self) -> FlagValueValidator:
+        """
+        Private. Resolves the kind of possible values once and returns a single callable,
+        whose truthy result means that the value is valid
+        :return: validator of the input flag value
+        """
+        if isinstance(self.possible_values, PossibleValues):
+            if self.possible_values == PossibleValues.NEITHER:
+                return "".__eq__
+            return bool
+
+        if isinstance(self.possible_values, Pattern):
+            return self.possible_values.match
+
+        if isinstance(self.possible_values, (list, tuple, set, frozenset)):
+            try:
+                return frozenset(self.possible_values).__contains__
+            except TypeError:
+                pass
+
+        return self.possible_values.__contains__
+
+    def compile_value_converter(self) -> FlagValueConverter | None:
+        """
+        Private. Resolves the converter of the flag value, the types with a precompiled converter
+        (bool, timedelta) are replaced by it, any other type or callable converts the value itself
+        :return: converter of the input flag value or None if the flag is not typed
+        """
+        if self.type is None:
+            return None
+
+        from argenta.command.flag.converters import PRECOMPILED_CONVERTERS
+
+        return PRECOMPILED_CONVERTERS.get(self.type, self.type)
+
     @property
     def string_entity(self) -> str:
         """
@@ -79,6 +125,8 @@ class Flag:
 
 
 class InputFlag:
+    __slots__ = ("name", "prefix", "input_value", "status", "value", "_coerced_values")
+
     def __init__(
         self,
         name: str,
@@ -98,6 +146,8 @@ class InputFlag:
         self.prefix: PREFIX_TYPE = prefix
         self.input_value: str = input_value
         self.status: ValidationStatus | None = status
+        self.value: Any = input_value
+        self._coerced_values: dict[Callable[[str], Any], Any] | None = None
 
     @property
     def string_entity(self) -> str:
@@ -124,10 +174,13 @@ class InputFlag:
             raise NotImplementedError
 
 
-FlagType = TypeVar("FlagType")
+FlagType = TypeVar("FlagType", bound=Flag | InputFlag)
+ValueType = TypeVar("ValueType")
 
 
 class BaseFlags(Generic[FlagType]):
+    __slots__ = ("flags", "_paired_name_flag", "_has_same_named_flags")
+
     def __init__(self, flags: list[FlagType] | None = None) -> None:
         """
         Public. A model that combines the registered flags
@@ -135,6 +188,10 @@ class BaseFlags(Generic[FlagType]):
         :return: None
         """
         self.flags: list[FlagType] = flags if flags else []
+        self._paired_name_flag: dict[str, FlagType] = {}
+        self._has_same_named_flags: bool = False
+        for flag in self.flags:
+            self._index_flag(flag)
 
     def add_flag(self, flag: FlagType) -> None:
         """
@@ -143,6 +200,7 @@ class BaseFlags(Generic[FlagType]):
         :return: None
         """
         self.flags.append(flag)
+        self._index_flag(flag)
 
     def add_flags(self, flags: list[FlagType]) -> None:
         """
@@ -151,6 +209,19 @@ class BaseFlags(Generic[FlagType]):
         :return: None
         """
         self.flags.extend(flags)
+        for flag in flags:
+            self._index_flag(flag)
+
+    def _index_flag(self, flag: FlagType) -> None:
+        """
+        Private. Adds the flag to the name index, the first flag with the given name wins
+        :param flag: indexed flag
+        :return: None
+        """
+        if flag.name in self._paired_name_flag:
+            self._has_same_named_flags = True
+        else:
+            self._paired_name_flag[flag.name] = flag
 
     def __len__(self) -> int:
         return len(self.flags)
@@ -166,13 +237,29 @@ class BaseFlags(Generic[FlagType]):
 
 
 class Flags(BaseFlags[Flag]):
+    __slots__ = ("_paired_string_entity_flag",)
+
+    def __init__(self, flags: list[Flag] | None = None) -> None:
+        """
+        Public. A model that combines the registered flags
+        :param flags: the flags that will be registered
+        :return: None
+        """
+        self._paired_string_entity_flag: dict[str, Flag] = {}
+        super().__init__(flags)
+
+    @override
+    def _index_flag(self, flag: Flag) -> None:
+        super()._index_flag(flag)
+        self._paired_string_entity_flag.setdefault(flag.string_entity, flag)
+
     def get_flag_by_name(self, name: str) -> Flag | None:
         """
         Public. Returns the flag entity by its name or None if not found
         :param name: the name of the flag to get
         :return: entity of the flag or None
         """
-        return next((flag for flag in self.flags if flag.name == name), None)
+        return self._paired_name_flag.get(name)
 
     @override
     def __eq__(self, other: object) -> bool:
@@ -187,20 +274,19 @@ class Flags(BaseFlags[Flag]):
 
     def __contains__(self, flag_to_check: object) -> bool:
         if isinstance(flag_to_check, Flag):
-            for flag in self.flags:
-                if flag == flag_to_check:
-                    return True
-            return False
+            return flag_to_check.string_entity in self._paired_string_entity_flag
         else:
             raise TypeError
 
 
 class InputFlags(BaseFlags[InputFlag]):
+    __slots__ = ()
+
     def get_flag_by_name(
             self,
             name: str,
             with_status: ValidationStatus | None = None,
-            default: Any = None
+            default: InputFlag | None = None
     ) -> InputFlag | None:
         """
         Public. Returns the flag entity by its name or None if not found
@@ -209,10 +295,91 @@ class InputFlags(BaseFlags[InputFlag]):
         :param name: the name of the flag to get
         :return: entity of the flag or None
         """
-        if with_status is None:
-            return next((flag for flag in self.flags if flag.name == name), default)
-        else:
-            return next((flag for flag in self.flags if flag.name == name and flag.status == with_status), default)
+        flag = self._paired_name_flag.get(name)
+        if flag is None:
+            return default
+        if with_status is None or flag.status == with_status:
+            return flag
+        if self._has_same_named_flags:
+            return next(
+                (flag for flag in self.flags if flag.name == name and flag.status == with_status),
+                default,
+            )
+        return default
+
+    def get_value(self, name: str, default: Any = None) -> Any:
+        """
+        Public. Returns the value of the valid flag, converted if the flag is typed
+        :param name: the name of the flag
+        :param default: returned if there is no valid flag with this name
+        :return: the value of the flag or the default
+        """
+        flag = self.get_flag_by_name(name, with_status=ValidationStatus.VALID)
+        return default if flag is None else flag.value
+
+    def get_int(self, name: str, default: int | None = None) -> int | None:
+        """
+        Public. Returns the value of the valid flag as int, see InputFlags._get_coerced_value
+        :param name: the name of the flag
+        :param default: returned if there is no valid flag with this name or its value is not an int
+        :return: the value of the flag as int or the default
+        """
+        return self._get_coerced_value(name, int, int, default)
+
+    def get_float(self, name: str, default: float | None = None) -> float | None:
+        """
+        Public. Returns the value of the valid flag as float, see InputFlags._get_coerced_value
+        :param name: the name of the flag
+        :param default: returned if there is no valid flag with this name or its value is not a float
+        :return: the value of the flag as float or the default
+        """
+        return self._get_coerced_value(name, float, float, default)
+
+    def get_bool(self, name: str, default: bool | None = None) -> bool | None:
+        """
+        Public. Returns the value of the valid flag as bool, the flag entered without a value is True,
+        see InputFlags._get_coerced_value
+        :param name: the name of the flag
+        :param default: returned if there is no valid flag with this name or its value is not a bool
+        :return: the value of the flag as bool or the default
+        """
+        from argenta.command.flag.converters import to_bool
+
+        return self._get_coerced_value(name, bool, to_bool, default)
+
+    def _get_coerced_value(
+        self,
+        name: str,
+        value_type: type[ValueType],
+        converter: Callable[[str], ValueType],
+        default: ValueType | None,
+    ) -> ValueType | None:
+        """
+        Private. Returns the value of the valid flag converted to the type. The conversion of the input value
+        is cached on the flag per converter, so the handler and the helpers it passes the response to parse it once,
+        while the value of the flag stays as converted by its type
+        :param name: the name of the flag
+        :param value_type: the expected type of the value
+        :param converter: converts the input value to the type
+        :param default: returned if there is no valid flag with this name or its value cannot be converted
+        :return: the converted value or the default
+        """
+        flag = self.get_flag_by_name(name, with_status=ValidationStatus.VALID)
+        if flag is None:
+            return default
+        if type(flag.value) is value_type:
+            return flag.value
+        coerced_values = flag._coerced_values  # pyright: ignore[reportPrivateUsage]
+        if coerced_values is None:
+            coerced_values = flag._coerced_values = {}  # pyright: ignore[reportPrivateUsage]
+        elif converter in coerced_values:
+            return cast(ValueType, coerced_values[converter])
+        try:
+            value: ValueType = converter(flag.input_value)
+        except CONVERSION_ERRORS:
+            return default
+        coerced_values[converter] = value
+        return value
 
     @override
     def __eq__(self, other: object) -> bool:
@@ -228,9 +395,6 @@ class InputFlags(BaseFlags[InputFlag]):
 
     def __contains__(self, ingressable_item: object) -> bool:
         if isinstance(ingressable_item, InputFlag):
-            for flag in self.flags:
-                if flag == ingressable_item:
-                    return True
-            return False
+            return ingressable_item.name in self._paired_name_flag
         else:
             raise TypeError
@@ -1,13 +1,14 @@
 __all__ = ["Command", "InputCommand"]
 
-import shlex
-from typing import Iterable, Literal, Never, Self, cast
+from typing import Iterable, Iterator, Literal, Never, Self, cast
 
 from argenta.command import Flags, InputFlags
 from argenta.command.exceptions import (EmptyInputCommandException,
                                         RepeatedInputFlagsException,
                                         UnprocessedInputFlagException)
-from argenta.command.flag.models import Flag, InputFlag, ValidationStatus
+from argenta.command.flag.models import (CONVERSION_ERRORS, Flag, FlagValueConverter,
+                                         FlagValueValidator, InputFlag, ValidationStatus)
+from argenta.command.tokenizer import tokenize
 
 ParseFlagsResult = tuple[InputFlags, str | None, str | None]
 ParseResult = tuple[str, InputFlags]
@@ -17,6 +18,15 @@ PREFIX_TYPE = Literal["-", "--", "---"]
 
 
 class Command:
+    __slots__ = (
+        "registered_flags",
+        "trigger",
+        "description",
+        "aliases",
+        "flag_validators",
+        "flag_converters",
+    )
+
     def __init__(
         self,
         trigger: str,
@@ -41,28 +51,73 @@ class Command:
         self.registered_flags: Flags = pretty_flags
         self.trigger: str = trigger
         self.description: str = description
-        self.aliases: Iterable[str] | Iterable[Never] = aliases or set()
+        self.aliases: Iterable[str] | Iterable[Never] = aliases or frozenset()
 
-        self._paired_string_entity_flag: dict[str, Flag] = {
-            flag.string_entity: flag for flag in pretty_flags
+        self.flag_validators: dict[str, FlagValueValidator] = {
+            flag.string_entity: flag.compile_value_validator() for flag in pretty_flags
+        }
+        self.flag_converters: dict[str, FlagValueConverter] = {
+            flag.string_entity: converter
+            for flag in pretty_flags
+            if (converter := flag.compile_value_converter()) is not None
         }
 
+    @classmethod
+    def from_compiled(
+        cls,
+        trigger: str,
+        *,
+        description: str,
+        flags: Flags,
+        aliases: Iterable[str],
+        flag_validators: dict[str, FlagValueValidator],
+        flag_converters: dict[str, FlagValueConverter] | None = None,
+    ) -> Self:
+        """
+        Private. Builds the command from the module generated by argenta.codegen, the flag validators
+        come precompiled instead of being compiled from the possible values of the flags
+        :param trigger: the trigger of the command
+        :param description: the description of the command
+        :param flags: the registered flags
+        :param aliases: string synonyms for the main trigger
+        :param flag_validators: validators of the flags paired with the flags with their prefixes
+        :param flag_converters: converters of the typed flags paired with the flags with their prefixes
+        :return: the command
+        """
+        command = cls.__new__(cls)
+        command.registered_flags = flags
+        command.trigger = trigger
+        command.description = description
+        command.aliases = aliases
+        command.flag_validators = flag_validators
+        command.flag_converters = flag_converters or {}
+        return command
+
     def validate_input_flag(self, flag: InputFlag) -> ValidationStatus:
         """
-        Private. Validates the input flag
+        Private. Validates the input flag, the value of the valid typed flag is converted
+        and stored on the flag, a failed conversion makes the flag invalid
         :param flag: input flag for validation
-        :return: is input flag valid as bool
+        :return: the validation status of the input flag as ValidationStatus
         """
-        if registered_flag := self._paired_string_entity_flag.get(flag.string_entity):
-            is_valid = registered_flag.validate_input_flag_value(flag.input_value)
-            if is_valid:
-                return ValidationStatus.VALID
-            else:
+        string_entity: str = flag.string_entity
+        validator: FlagValueValidator | None = self.flag_validators.get(string_entity)
+        if validator is None:
+            return ValidationStatus.UNDEFINED
+        if not validator(flag.input_value):
+            return ValidationStatus.INVALID
+        converter: FlagValueConverter | None = self.flag_converters.get(string_entity)
+        if converter is not None:
+            try:
+                flag.value = converter(flag.input_value)
+            except CONVERSION_ERRORS:
                 return ValidationStatus.INVALID
-        return ValidationStatus.UNDEFINED
+        return ValidationStatus.VALID
 
 
 class InputCommand:
+    __slots__ = ("trigger", "input_flags")
+
     def __init__(
         self,
         trigger: str,
@@ -91,54 +146,76 @@ class InputCommand:
         :param raw_command: raw input command
         :return: model of the input command, after parsing as InputCommand
         """
-        lexer = shlex.shlex(raw_command, posix=True)
-        lexer.whitespace_split = True
-        lexer.commenters = ""
+        return cls.from_tokens(tokenize(raw_command))
+
+    @classmethod
+    def from_tokens(cls, tokens: Iterable[str]) -> Self:
+        """
+        Private. Builds the input command from already split tokens, e.g. from the command line arguments
+        :param tokens: the trigger followed by the flag tokens
+        :return: model of the input command, after parsing as InputCommand
+        """
+        token_iterator: Iterator[str] = iter(tokens)
 
         try:
-            tokens = list(lexer)
+            command: str | None = next(token_iterator, None)
+            if command is None:
+                raise EmptyInputCommandException
+            flags: InputFlags = _parse_flags(token_iterator)
         except ValueError as e:
             raise UnprocessedInputFlagException from e
 
-        if not tokens:
-            raise EmptyInputCommandException
-
-        command = tokens[0]
-        flags: InputFlags = InputFlags()
-
-        i = 1
-        while i < len(tokens):
-            token = tokens[i]
-
-            if token.startswith("---"):
-                prefix = "---"
-                name = token[3:]
-            elif token.startswith("--"):
-                prefix = "--"
-                name = token[2:]
-            elif token.startswith("-"):
-                prefix = "-"
-                name = token[1:]
-            else:
-                raise UnprocessedInputFlagException
-
-            if i + 1 < len(tokens) and not tokens[i + 1].startswith("-"):
-                input_value = tokens[i + 1]
-                i += 2
-            else:
-                input_value = ""
-                i += 1
-
-            input_flag = InputFlag(
-                name=name,
-                prefix=cast(PREFIX_TYPE, prefix),  # pyright: ignore[reportUnnecessaryCast]
-                input_value=input_value,
-                status=None,
-            )
-
-            if input_flag in flags:
-                raise RepeatedInputFlagsException(input_flag)
-
-            flags.add_flag(input_flag)
-
         return cls(command, input_flags=flags)
+
+
+def _parse_flags(tokens: Iterator[str]) -> InputFlags:
+    """
+    Private. Pairs the flag tokens with their values while the tokens are being scanned
+    :param tokens: iterator over the tokens following the trigger
+    :return: the parsed input flags
+    """
+    flags: InputFlags = InputFlags()
+    token: str | None = next(tokens, None)
+
+    while token is not None:
+        if token.startswith("---"):
+            prefix, name = "---", token[3:]
+        elif token.startswith("--"):
+            prefix, name = "--", token[2:]
+        elif token.startswith("-"):
+            prefix, name = "-", token[1:]
+        else:
+            _drain(tokens)
+            raise UnprocessedInputFlagException
+
+        input_value: str = ""
+        token = next(tokens, None)
+        if token is not None and not token.startswith("-"):
+            input_value = token
+            token = next(tokens, None)
+
+        input_flag = InputFlag(
+            name=name,
+            prefix=cast(PREFIX_TYPE, prefix),  # pyright: ignore[reportUnnecessaryCast]
+            input_value=input_value,
+            status=None,
+        )
+
+        if input_flag in flags:
+            _drain(tokens)
+            raise RepeatedInputFlagsException(input_flag)
+
+        flags.add_flag(input_flag)
+
+    return flags
+
+
+def _drain(tokens: Iterator[str]) -> None:
+    """
+    Private. Scans the rest of the input, so that a syntax error located further
+    in the line takes precedence over the error found by the caller, as before
+    :param tokens: iterator over the remaining tokens
+    :return: None
+    """
+    for _ in tokens:
+        pass
@@ -0,0 +1,87 @@
+__all__ = ["tokenize"]
+
+import re
+from typing import Iterator
+
+WHITESPACE: str = " \t\r\n"
+
+_PLAIN_TOKEN_RE: re.Pattern[str] = re.compile(r"[^ \t\r\n]+")
+_PLAIN_RUN_END_RE: re.Pattern[str] = re.compile(r"[ \t\r\n'\"\\]")
+_DOUBLE_QUOTED_RUN_RE: re.Pattern[str] = re.compile(r'[^"\\]+')
+_SPECIAL_CHARS_RE: re.Pattern[str] = re.compile(r"['\"\\]")
+
+
+def tokenize(raw_command: str) -> Iterator[str]:
+    """
+    Private. Splits the raw input command into tokens in a single pass,
+    token-for-token compatible with posix shlex in whitespace split mode without commenters
+    :param raw_command: raw input command
+    :return: iterator over the tokens of the command
+    :raises ValueError: if a quotation is not closed or an escape character has nothing to escape
+    """
+    if _SPECIAL_CHARS_RE.search(raw_command) is None:
+        yield from _PLAIN_TOKEN_RE.findall(raw_command)
+        return
+
+    length: int = len(raw_command)
+    position: int = 0
+
+    while True:
+        while position < length and raw_command[position] in WHITESPACE:
+            position += 1
+        if position >= length:
+            return
+
+        parts: list[str] = []
+        while position < length:
+            char: str = raw_command[position]
+            if char in WHITESPACE:
+                break
+            if char == "'":
+                closing_position: int = raw_command.find("'", position + 1)
+                if closing_position == -1:
+                    raise ValueError("No closing quotation")
+                parts.append(raw_command[position + 1:closing_position])
+                position = closing_position + 1
+            elif char == '"':
+                position = _read_double_quoted(raw_command, position + 1, parts)
+            elif char == "\\":
+                if position + 1 >= length:
+                    raise ValueError("No escaped character")
+                parts.append(raw_command[position + 1])
+                position += 2
+            else:
+                plain_run_end = _PLAIN_RUN_END_RE.search(raw_command, position)
+                end_position: int = plain_run_end.start() if plain_run_end else length
+                parts.append(raw_command[position:end_position])
+                position = end_position
+
+        yield "".join(parts)
+
+
+def _read_double_quoted(raw_command: str, position: int, parts: list[str]) -> int:
+    """
+    Private. Reads the body of a double-quoted section, where only the quote itself
+    and the escape character may be escaped
+    :param raw_command: raw input command
+    :param position: position right after the opening quote
+    :param parts: accumulator of the current token parts
+    :return: position right after the closing quote
+    """
+    length: int = len(raw_command)
+    while True:
+        quoted_run = _DOUBLE_QUOTED_RUN_RE.match(raw_command, position)
+        if quoted_run is not None:
+            parts.append(quoted_run.group())
+            position = quoted_run.end()
+
+        if position >= length:
+            raise ValueError("No closing quotation")
+        if raw_command[position] == '"':
+            return position + 1
+
+        if position + 1 >= length:
+            raise ValueError("No escaped character")
+        escaped_char: str = raw_command[position + 1]
+        parts.append(escaped_char if escaped_char in '"\\' else "\\" + escaped_char)
+        position += 2
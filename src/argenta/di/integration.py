@@ -6,7 +6,10 @@ from dishka import Container, FromDishka
 from dishka.integrations.base import is_dishka_injected, wrap_injection
 
 from argenta.app.models import App
+from argenta.codegen.entity import CompiledRouter
 from argenta.response.entity import Response
+from argenta.router import LazyRouter, Router
+from argenta.router.command_handler.entity import CommandHandler
 
 T = TypeVar("T")
 
@@ -36,7 +39,20 @@ def _get_container_from_response(args: tuple[Any, ...], kwargs: dict[str, Any])
 
 def _auto_inject_handlers(app: App) -> None:
     for router in app.registered_routers:
-        for command_handler in router.command_handlers:
-            if not is_dishka_injected(command_handler.handler_as_func):
-                injected_handler = inject(command_handler.handler_as_func)
-                command_handler.handler_as_func = injected_handler
+        if isinstance(router, LazyRouter):
+            router.add_load_callback(_inject_router_handlers)
+        elif isinstance(router, CompiledRouter):
+            router.add_bind_callback(_inject_command_handler)
+        else:
+            _inject_router_handlers(router)
+
+
+def _inject_router_handlers(router: Router) -> None:
+    for command_handler in router.command_handlers:
+        _inject_command_handler(command_handler)
+
+
+def _inject_command_handler(command_handler: CommandHandler) -> None:
+    if not is_dishka_injected(command_handler.handler_as_func):
+        injected_handler = inject(command_handler.handler_as_func)
+        command_handler.handler_as_func = injected_handler
@@ -82,15 +82,54 @@ class ArgParser:
         self.processed_args: list[ValueArgument | BooleanArgument] = processed_args
 
         self.parsed_argspace: ArgSpace = ArgSpace([])
+        self.remaining_args: list[str] = []
 
         self._core: ArgumentParser = ArgumentParser(prog=name, description=description, epilog=epilog)
         self._register_args(processed_args)
 
     def _parse_args(self) -> None:
+        app_args, command_args = self._split_at_trigger(sys.argv[1:])
+        namespace, unknown_args = self._core.parse_known_args(app_args)
+        self.remaining_args = unknown_args + command_args
         self.parsed_argspace = ArgSpace.from_namespace(
-            namespace=self._core.parse_args(), processed_args=self.processed_args
+            namespace=namespace, processed_args=self.processed_args
         )
 
+    def _split_at_trigger(self, args: list[str]) -> tuple[list[str], list[str]]:
+        """
+        Private. Splits the arguments at the first positional one, the trigger of the one-shot command,
+        so the flags of the command are never taken for the arguments of the application,
+        even if they abbreviate one of them. The arguments of the application may still be abbreviated
+        :param args: the command line arguments without the program name
+        :return: the arguments of the application and the one-shot command with its flags
+        """
+        position: int = 0
+        while position < len(args) and args[position].startswith("-"):
+            position += 2 if self._is_value_option(args[position]) else 1
+        return args[:position], args[position:]
+
+    def _is_value_option(self, option_string: str) -> bool:
+        """
+        Private. Checks whether the option is followed by its value, the option is matched
+        the same way as by ArgumentParser: exactly or as an unambiguous abbreviation
+        :param option_string: the option as entered, e.g. --config or --conf
+        :return: is the option a value argument taking the next command line argument as bool
+        """
+        if "=" in option_string:
+            return False
+        matched_args: list[ValueArgument | BooleanArgument] = [
+            arg for arg in self.processed_args if arg.string_entity == option_string
+        ] or [arg for arg in self.processed_args if arg.string_entity.startswith(option_string)]
+        return len(matched_args) == 1 and isinstance(matched_args[0], ValueArgument)
+
+    def _reject_remaining_args(self) -> None:
+        """
+        Private. Fails the same way as a strict parse if arguments meant for one-shot mode are left
+        :return: None
+        """
+        if self.remaining_args:
+            self._core.error(f"unrecognized arguments: {' '.join(self.remaining_args)}")
+
     def _register_args(self, processed_args: list[ValueArgument | BooleanArgument]) -> None: # pragma: no cover
         if sys.version_info >= (3, 13):
             for arg in processed_args:
@@ -1,8 +1,11 @@
 __all__ = ["Orchestrator"]
 
+from typing import Sequence
+
 from dishka import Provider, make_container
 
-from argenta.app import App
+from argenta.app import App, ExitCode
+from argenta.app.script import ScriptSource, ScriptSummary
 from argenta.di.integration import setup_dishka
 from argenta.di.providers import SystemProvider
 from argenta.orchestrator.argparser import ArgParser
@@ -34,9 +37,37 @@ class Orchestrator:
         :param app: a running application
         :return: None
         """
+        self._arg_parser._reject_remaining_args()  # pyright: ignore[reportPrivateUsage]
+        self._setup_container(app)
+
+        app._run_polling()
+
+    def run_once(self, app: App, argv: Sequence[str] | None = None) -> ExitCode:
+        """
+        Public. Runs a single command without the interactive loop, banners and autocompleter,
+        e.g. `sys.exit(orchestrator.run_once(app))` for `prog <trigger> --flag value`
+        :param app: a running application
+        :param argv: the trigger followed by the flags, the arguments left by the arg parser by default
+        :return: exit code of the process as ExitCode
+        """
+        self._setup_container(app)
+
+        return app._run_once(self._arg_parser.remaining_args if argv is None else argv)
+
+    def run_script(self, app: App, source: ScriptSource, *, stop_on_error: bool = False) -> ScriptSummary:
+        """
+        Public. Runs the commands of a script with the dependency injection set up, see App.run_script
+        :param app: a running application
+        :param source: path of the script, file object or iterable of lines
+        :param stop_on_error: whether to stop on the first failed command instead of continuing
+        :return: per-command summary of the script as ScriptSummary
+        """
+        self._setup_container(app)
+
+        return app.run_script(source, stop_on_error=stop_on_error)
+
+    def _setup_container(self, app: App) -> None:
         container = make_container(
             SystemProvider(), *self._custom_providers, context={ArgParser: self._arg_parser}
         )
         setup_dishka(app, container, auto_inject=self._auto_inject_handlers)
-
-        app._run_polling()
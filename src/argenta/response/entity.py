@@ -1,15 +1,20 @@
 __all__ = ["Response"]
 
-from dishka import Container
+from typing import TYPE_CHECKING
 
 from argenta.command import InputFlags
 from argenta.response.status import ResponseStatus
 
+if TYPE_CHECKING:
+    from dishka import Container
+
 EMPTY_INPUT_FLAGS: InputFlags = InputFlags()
 
 
 class Response:
-    __dishka_container__: Container
+    __slots__ = ("status", "input_flags")
+
+    __dishka_container__: "Container"
 
     def __init__(
         self,
@@ -25,5 +30,5 @@ class Response:
         self.input_flags: InputFlags = input_flags
 
     @classmethod
-    def patch_by_container(cls, container: Container) -> None:
+    def patch_by_container(cls, container: "Container") -> None:
         cls.__dishka_container__ = container
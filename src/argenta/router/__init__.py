@@ -1 +1,2 @@
 from argenta.router.entity import Router as Router
+from argenta.router.lazy_router.entity import LazyRouter as LazyRouter
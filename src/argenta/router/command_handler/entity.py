@@ -1,33 +1,76 @@
 __all__ = ["CommandHandler", "CommandHandlers"]
 
-from collections.abc import Iterator
-from typing import Never
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING, Callable, Never
 
-from argenta.app.protocols import HandlerFunc
 from argenta.command import Command
 from argenta.response import Response
 
+if TYPE_CHECKING:
+    from argenta.app.protocols import HandlerFunc, Middleware
+
 
 class CommandHandler:
-    def __init__(self, handler_as_func: HandlerFunc, handled_command: Command):
+    __slots__ = ("handler_as_func", "handled_command", "middleware_chain")
+
+    def __init__(self, handler_as_func: "HandlerFunc", handled_command: Command):
         """
         Private. Entity of the model linking the handler and the command being processed
         :param handler: the handler being called
         :param handled_command: the command being processed
         """
-        self.handler_as_func: HandlerFunc = handler_as_func
+        self.handler_as_func: "HandlerFunc" = handler_as_func
         self.handled_command: Command = handled_command
+        self.middleware_chain: Callable[[Response], None] | None = None
 
     def handling(self, response: Response) -> None:
         """
-        Private. Direct processing of an input command
+        Private. Direct processing of an input command, through the compiled middleware chain if there is one
         :param response: the entity of response: various groups of flags and status of response
         :return: None
         """
+        middleware_chain = self.middleware_chain
+        if middleware_chain is None:
+            self.handler_as_func(response)
+        else:
+            middleware_chain(response)
+
+    def compile_middleware_chain(self, middlewares: Sequence["Middleware"]) -> None:
+        """
+        Private. Nests the middlewares around the handler into a single callable, the first middleware
+        is the outermost one, without middlewares the handler is called directly
+        :param middlewares: the middlewares of the application and of the router, in the order of their addition
+        :return: None
+        """
+        if not middlewares:
+            self.middleware_chain = None
+            return
+
+        middleware_chain: Callable[[Response], None] = self._call_handler
+        for middleware in reversed(middlewares):
+            middleware_chain = _wrap_middleware(middleware, middleware_chain)
+        self.middleware_chain = middleware_chain
+
+    def _call_handler(self, response: Response) -> None:
+        """
+        Private. The innermost link of the chain, the handler is looked up on every call,
+        so a handler rebound after the compilation (e.g. injected) is the one called
+        :param response: the entity of response
+        :return: None
+        """
         self.handler_as_func(response)
 
 
+def _wrap_middleware(middleware: "Middleware", call_next: Callable[[Response], None]) -> Callable[[Response], None]:
+    def middleware_layer(response: Response) -> None:
+        middleware(response, call_next)
+
+    return middleware_layer
+
+
 class CommandHandlers:
+    __slots__ = ("command_handlers", "paired_command_handler_trigger")
+
     def __init__(self, command_handlers: tuple[CommandHandler] | tuple[Never, ...] = tuple()):
         """
         Private. The model that unites all CommandHandler of the routers
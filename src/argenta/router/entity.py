@@ -1,11 +1,9 @@
 __all__ = ["Router"]
 
 from inspect import get_annotations, getfullargspec, getsourcefile, getsourcelines
-from typing import Callable
+from types import FunctionType
+from typing import TYPE_CHECKING, Callable, Iterable, Sequence
 
-from rich.console import Console
-
-from argenta.app.protocols import HandlerFunc
 from argenta.command import Command, InputCommand, InputFlags
 from argenta.command.flag import ValidationStatus
 from argenta.response import Response, ResponseStatus
@@ -16,6 +14,9 @@ from argenta.router.exceptions import (RepeatedAliasNameException,
                                        RequiredArgumentNotPassedException,
                                        TriggerContainSpacesException)
 
+if TYPE_CHECKING:
+    from argenta.app.protocols import HandlerFunc, Middleware
+
 
 class Router:
     def __init__(
@@ -40,8 +41,29 @@ class Router:
         self.command_handlers: CommandHandlers = CommandHandlers()
         self.aliases: set[str] = set()
         self.triggers: set[str] = set()
+        self.middlewares: list["Middleware"] = []
+
+    def add_middleware(self, middleware: "Middleware") -> None:
+        """
+        Public. Adds a middleware wrapping the handlers of the router, it is called with the response
+        and the next link of the chain, and calls the next link to proceed to the handler.
+        The middlewares added first are the outermost ones
+        :param middleware: the middleware being added
+        :return: None
+        """
+        self.middlewares.append(middleware)
+
+    def compile_middlewares(self, outer_middlewares: Sequence["Middleware"] = ()) -> None:
+        """
+        Private. Compiles the middleware chain of every handler of the router
+        :param outer_middlewares: the middlewares wrapping the middlewares of the router, e.g. of the application
+        :return: None
+        """
+        middlewares: list["Middleware"] = [*outer_middlewares, *self.middlewares]
+        for command_handler in self.command_handlers:
+            command_handler.compile_middleware_chain(middlewares)
 
-    def command(self, command: Command | str) -> Callable[[HandlerFunc], HandlerFunc]:
+    def command(self, command: Command | str) -> Callable[["HandlerFunc"], "HandlerFunc"]:
         """
         Public. Registers handler
         :param command: Registered command
@@ -55,32 +77,74 @@ class Router:
         self._validate_command(redefined_command)
         self._update_routing_keys(redefined_command)
         
-        def decorator(func: HandlerFunc) -> HandlerFunc:
+        def decorator(func: "HandlerFunc") -> "HandlerFunc":
             self._validate_func_args(func)
             self.command_handlers.add_handler(CommandHandler(func, redefined_command))
             return func
 
         return decorator
-        
-    def _validate_command(self, command: Command) -> None:
+
+    def register_many(self, handlers: Iterable[tuple[Command | str, "HandlerFunc"]]) -> None:
+        """
+        Public. Registers a batch of handlers, validating the whole batch in one pass before registering any of them,
+        the arguments of a handler function shared by several commands are validated once
+        :param handlers: pairs of the registered command and its handler
+        :return: None
+        """
+        batch: list[tuple[Command, HandlerFunc]] = [
+            (Command(command) if isinstance(command, str) else command, func) for command, func in handlers
+        ]
+        batch_triggers: set[str] = set()
+        batch_aliases: set[str] = set()
+        validated_funcs: set[int] = set()
+
+        for command, func in batch:
+            self._validate_command(command, batch_triggers=batch_triggers, batch_aliases=batch_aliases)
+            batch_triggers.add(command.trigger.lower())
+            batch_aliases.update(alias.lower() for alias in command.aliases)
+            if id(func) not in validated_funcs:
+                self._validate_func_args(func)
+                validated_funcs.add(id(func))
+
+        for command, func in batch:
+            self._update_routing_keys(command)
+            self.command_handlers.add_handler(CommandHandler(func, command))
+
+    def _validate_command(
+        self,
+        command: Command,
+        *,
+        batch_triggers: set[str] | None = None,
+        batch_aliases: set[str] | None = None,
+    ) -> None:
         """
-        Private. Validates the command registered in handler
+        Private. Validates the command registered in handler, the lookups are done against the existing
+        routing keys without building their union, so registering N commands stays linear
         :param command: validated command
+        :param batch_triggers: triggers of the batch being registered, see register_many
+        :param batch_aliases: aliases of the batch being registered, see register_many
         :return: None if command is valid else raise exception
         """
         command_name: str = command.trigger
         if command_name.find(" ") != -1:
             raise TriggerContainSpacesException()
-            
-        if command_name.lower() in self.triggers:
+
+        lowered_name: str = command_name.lower()
+        if lowered_name in self.triggers or (batch_triggers is not None and lowered_name in batch_triggers):
             raise RepeatedTriggerNameException()
-        
-        if command_name.lower() in self.aliases:
-            raise RepeatedAliasNameException({command_name.lower()})
-            
-        if overlapping := (self.aliases | self.triggers) & set(map(lambda x: x.lower(), command.aliases)):
+
+        if lowered_name in self.aliases or (batch_aliases is not None and lowered_name in batch_aliases):
+            raise RepeatedAliasNameException({lowered_name})
+
+        overlapping: set[str] = {
+            alias for alias in map(str.lower, command.aliases)
+            if alias in self.aliases or alias in self.triggers
+            or (batch_aliases is not None and alias in batch_aliases)
+            or (batch_triggers is not None and alias in batch_triggers)
+        }
+        if overlapping:
             raise RepeatedAliasNameException(overlapping)
-            
+
         flags_name: list[str] = [flag.string_entity.lower() for flag in command.registered_flags]
         if len(set(flags_name)) < len(flags_name):
             raise RepeatedFlagNameException()
@@ -136,20 +200,20 @@ class Router:
     @staticmethod
     def _structuring_input_flags(handled_command: Command, input_flags: InputFlags) -> Response:
         """
-        Private. Validates flags of input command
+        Private. Validates flags of input command, see Command.validate_input_flag
         :param handled_command: entity of the handled command
         :param input_flags:
         :return: entity of response as Response
         """
         invalid_value_flags, undefined_flags = False, False
+        validate_input_flag = handled_command.validate_input_flag
 
         for flag in input_flags:
-            flag_status: ValidationStatus = handled_command.validate_input_flag(flag)
-            flag.status = flag_status
-            if flag_status == ValidationStatus.INVALID:
-                invalid_value_flags = True
-            elif flag_status == ValidationStatus.UNDEFINED:
+            flag.status = validate_input_flag(flag)
+            if flag.status is ValidationStatus.UNDEFINED:
                 undefined_flags = True
+            elif flag.status is ValidationStatus.INVALID:
+                invalid_value_flags = True
 
         status = ResponseStatus.from_flags(
             has_invalid_value_flags=invalid_value_flags,
@@ -159,25 +223,38 @@ class Router:
         return Response(status=status, input_flags=input_flags)
 
     @staticmethod
-    def _validate_func_args(func: HandlerFunc) -> None:
+    def _validate_func_args(func: "HandlerFunc") -> None:
         """
         Private. Validates the arguments of the handler
         :param func: entity of the handler func
         :return: None if func is valid else raise exception
         """
-        transferred_args = getfullargspec(func).args
+        transferred_args: list[str] | tuple[str, ...]
+        func_annotations: dict[str, object]
+        if isinstance(func, FunctionType):
+            transferred_args = func.__code__.co_varnames[:func.__code__.co_argcount]
+            func_annotations = func.__annotations__
+        else:
+            transferred_args = getfullargspec(func).args
+            func_annotations = get_annotations(func)
+
         if len(transferred_args) == 0:
             raise RequiredArgumentNotPassedException()
 
         response_arg: str = transferred_args[0]
-        func_annotations: dict[str, None] = get_annotations(func)
-
         response_arg_annotation = func_annotations.get(response_arg)
 
         if response_arg_annotation is not None and response_arg_annotation is not Response:
-            source_line: int = getsourcelines(func)[1]
-            Console().print(
-                f'\nFile "{getsourcefile(func)}", line {source_line}\n[b red]WARNING:[/b red] [i]The typehint '
+            from argenta.app.lazy_console import DEFAULT_CONSOLE
+
+            source_file: str | None
+            source_line: int
+            if isinstance(func, FunctionType):
+                source_file, source_line = func.__code__.co_filename, func.__code__.co_firstlineno
+            else:
+                source_file, source_line = getsourcefile(func), getsourcelines(func)[1]
+            DEFAULT_CONSOLE.print(
+                f'\nFile "{source_file}", line {source_line}\n[b red]WARNING:[/b red] [i]The typehint '
                 + f"of argument([green]{response_arg}[/green]) passed to the handler must be [/i][bold blue]{Response}[/bold blue],"
                 + f" [i]but[/i] [bold blue]{response_arg_annotation}[/bold blue] [i]is specified[/i]",
                 highlight=False,
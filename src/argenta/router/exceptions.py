@@ -1,4 +1,5 @@
 __all__ = [
+    "LazyRouterCommandNotFoundException",
     "RepeatedFlagNameException",
     "RepeatedTriggerNameException",
     "RepeatedAliasNameException",
@@ -61,3 +62,18 @@ class TriggerContainSpacesException(Exception):
     @override
     def __str__(self) -> str:
         return "Command trigger cannot contain spaces"
+
+
+class LazyRouterCommandNotFoundException(Exception):
+    """
+    Private. Raised when the lazily imported router does not register a declared command
+    """
+    @override
+    def __init__(self, import_path: str, trigger: str) -> None:
+        self.import_path = import_path
+        self.trigger = trigger
+        super().__init__()
+
+    @override
+    def __str__(self) -> str:
+        return f"Router '{self.import_path}' does not register the declared command '{self.trigger}'"
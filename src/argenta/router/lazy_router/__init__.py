@@ -0,0 +1 @@
+from argenta.router.lazy_router.entity import LazyRouter as LazyRouter
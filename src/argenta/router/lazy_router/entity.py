@@ -0,0 +1,107 @@
+__all__ = ["LazyRouter"]
+
+from functools import partial
+from importlib import import_module
+from typing import TYPE_CHECKING, Callable, Iterable, Sequence, override
+
+from argenta.command import Command, InputFlags
+from argenta.response import Response
+from argenta.router.command_handler.entity import CommandHandler
+from argenta.router.entity import Router
+from argenta.router.exceptions import LazyRouterCommandNotFoundException
+
+if TYPE_CHECKING:
+    from argenta.app.protocols import Middleware
+
+
+class LazyRouter(Router):
+    def __init__(
+        self,
+        import_path: str,
+        *,
+        commands: Iterable[Command | str],
+        title: str = "Default title",
+        disable_redirect_stdout: bool = False,
+    ) -> None:
+        """
+        Public. Router standing in for the router of a module that is imported only on the first dispatch
+        to one of its commands, the help and the completion are served from the declared commands
+        :param import_path: path of the router as "package.module:attribute"
+        :param commands: declared commands of the router, their descriptions, aliases and flags
+               are used before the import, the flags are validated by the imported router
+        :param title: the title of the router, displayed when displaying the available commands
+        :param disable_redirect_stdout: see Router, must match the imported router
+        :return: None
+        """
+        module_name, separator, attribute_name = import_path.partition(":")
+        if not separator or not module_name or not attribute_name:
+            raise ValueError(f"Invalid router import path: {import_path!r}, expected 'package.module:attribute'")
+
+        super().__init__(title, disable_redirect_stdout=disable_redirect_stdout)
+        self.import_path: str = import_path
+        self._router: Router | None = None
+        self._load_callbacks: list[Callable[[Router], None]] = []
+
+        for command in commands:
+            declared_command = Command(command) if isinstance(command, str) else command
+            self._validate_command(declared_command)
+            self._update_routing_keys(declared_command)
+            self.command_handlers.add_handler(
+                CommandHandler(partial(self._handle_declared_command, declared_command.trigger), declared_command)
+            )
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._router is not None
+
+    def load(self) -> Router:
+        """
+        Public. Imports the module of the router once and checks that it registers every declared command
+        :return: the imported router as Router
+        """
+        if self._router is not None:
+            return self._router
+
+        module_name, _, attribute_name = self.import_path.partition(":")
+        router = getattr(import_module(module_name), attribute_name)
+        if not isinstance(router, Router):
+            raise TypeError(f"'{self.import_path}' is {type(router).__name__}, not Router")
+        for trigger in self.triggers:
+            if router.command_handlers.get_command_handler_by_trigger(trigger) is None:
+                raise LazyRouterCommandNotFoundException(self.import_path, trigger)
+
+        self._router = router
+        for callback in self._load_callbacks:
+            callback(router)
+        return router
+
+    def add_load_callback(self, callback: Callable[[Router], None]) -> None:
+        """
+        Private. Registers the callback called with the imported router, right away if it is already imported
+        :param callback: the callback, e.g. wrapping the handlers of the router
+        :return: None
+        """
+        if self._router is not None:
+            callback(self._router)
+        else:
+            self._load_callbacks.append(callback)
+
+    @override
+    def compile_middlewares(self, outer_middlewares: Sequence["Middleware"] = ()) -> None:
+        middlewares: list["Middleware"] = [*outer_middlewares, *self.middlewares]
+        self.add_load_callback(lambda router: router.compile_middlewares(middlewares))
+
+    @override
+    def process_input_command(self, input_command_flags: InputFlags, command_handler: CommandHandler) -> None:
+        router: Router = self.load()
+        loaded_handler: CommandHandler = self._get_loaded_handler(router, command_handler.handled_command.trigger)
+        router.process_input_command(input_command_flags, loaded_handler)
+
+    def _handle_declared_command(self, trigger: str, response: Response) -> None:
+        self._get_loaded_handler(self.load(), trigger).handling(response)
+
+    def _get_loaded_handler(self, router: Router, trigger: str) -> CommandHandler:
+        command_handler: CommandHandler | None = router.command_handlers.get_command_handler_by_trigger(trigger.lower())
+        if command_handler is None:
+            raise LazyRouterCommandNotFoundException(self.import_path, trigger)
+        return command_handler
@@ -241,3 +241,28 @@ def test_repeated_flags_trigger_repeated_flags_handler(monkeypatch: pytest.Monke
     output = capsys.readouterr().out
 
     assert 'Repeated input flags: "test --port 22 --port 33"' in output
+
+
+def test_ambiguous_abbreviation_triggers_ambiguous_command_handler(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    inputs = iter(["st", "q"])
+    monkeypatch.setattr('builtins.input', lambda _prompt="": _mock_input(inputs))
+
+    router = Router()
+    orchestrator = Orchestrator()
+
+    @router.command(Command('start'))
+    def start(_response: Response) -> None:  # pyright: ignore[reportUnusedFunction]
+        print('start command')
+
+    @router.command(Command('stop'))
+    def stop(_response: Response) -> None:  # pyright: ignore[reportUnusedFunction]
+        print('stop command')
+
+    app = App(override_system_messages=True, printer=print, allow_trigger_abbreviations=True)
+    app.include_router(router)
+    orchestrator.start_polling(app)
+
+    output = capsys.readouterr().out
+
+    assert "\nAmbiguous command: st, candidates: start, stop\n" in output
+    assert "start command" not in output
@@ -1,13 +1,16 @@
+import io
 import re
 import sys
 from collections.abc import Iterator
 
 import pytest
 
-from argenta import App, Orchestrator, Router
+from argenta import App, DataBridge, Orchestrator, Router
+from argenta.app import ExitCode
 from argenta.command import Command, PredefinedFlags, Flags
 from argenta.command.flag import Flag
 from argenta.command.flag.models import PossibleValues, ValidationStatus
+from argenta.di import FromDishka
 from argenta.response import Response
 
 
@@ -249,3 +252,111 @@ def test_two_predefined_flags_are_recognized_together(monkeypatch: pytest.Monkey
     output = capsys.readouterr().out
 
     assert '\nconnecting to host 192.168.32.1 and port 132\n' in output
+
+
+def test_abbreviated_trigger_executes_command(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    inputs = iter(["te", "so", "q"])
+    monkeypatch.setattr('builtins.input', lambda _prompt="": _mock_input(inputs))
+
+    router = Router()
+    orchestrator = Orchestrator()
+
+    @router.command(Command('test'))
+    def test(_response: Response) -> None:  # pyright: ignore[reportUnusedFunction]
+        print('test command')
+
+    @router.command(Command('some'))
+    def test2(_response: Response) -> None:  # pyright: ignore[reportUnusedFunction]
+        print('some command')
+
+    app = App(override_system_messages=True, printer=print, allow_trigger_abbreviations=True)
+    app.include_router(router)
+    orchestrator.start_polling(app)
+
+    output = capsys.readouterr().out
+
+    assert '\ntest command\n' in output
+    assert '\nsome command\n' in output
+
+
+def test_one_shot_command_from_argv_executes_with_injected_dependencies(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setattr(sys, 'argv', ['program.py', 'connect', '--host', '192.168.32.1'])
+
+    router = Router()
+    orchestrator = Orchestrator()
+
+    @router.command(Command('connect', flags=Flag('host')))
+    def connect(response: Response, data_bridge: FromDishka[DataBridge]) -> None:  # pyright: ignore[reportUnusedFunction]
+        host = response.input_flags.get_flag_by_name('host')
+        assert host is not None
+        print(f'connecting to host {host.input_value} with {type(data_bridge).__name__}')
+
+    app = App(override_system_messages=True, printer=print)
+    app.include_router(router)
+    exit_code = orchestrator.run_once(app)
+
+    output = capsys.readouterr().out
+
+    assert exit_code == ExitCode.SUCCESS
+    assert output == 'connecting to host 192.168.32.1 with DataBridge\n'
+
+
+def test_script_from_stdin_executes_without_prompt_and_frames(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setattr(sys, 'stdin', io.StringIO('# nightly job\ntest\n\nsome --verbose\n'))
+
+    router = Router()
+    orchestrator = Orchestrator()
+
+    @router.command(Command('test'))
+    def test(_response: Response) -> None:  # pyright: ignore[reportUnusedFunction]
+        print('test command')
+
+    @router.command(Command('some', flags=Flag('verbose', possible_values=PossibleValues.NEITHER)))
+    def some(_response: Response, data_bridge: FromDishka[DataBridge]) -> None:  # pyright: ignore[reportUnusedFunction]
+        print(f'some command with {type(data_bridge).__name__}')
+
+    app = App(override_system_messages=True, printer=print)
+    app.include_router(router)
+    summary = orchestrator.run_script(app, sys.stdin)
+
+    output = capsys.readouterr().out
+
+    assert output == 'test command\nsome command with DataBridge\n'
+    assert summary.exit_code == ExitCode.SUCCESS
+    assert [result.line_number for result in summary.results] == [2, 4]
+
+
+def test_subcommands_of_prefixed_router_execute_and_group_lists_its_commands(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    inputs = iter(["db migrate --force", "db", "q"])
+    monkeypatch.setattr('builtins.input', lambda _prompt="": _mock_input(inputs))
+
+    db_router = Router(title='Database:')
+    router = Router(title='Other:')
+    orchestrator = Orchestrator()
+
+    @db_router.command(Command('migrate', description='Apply migrations', flags=Flag('force', possible_values=PossibleValues.NEITHER)))
+    def migrate(response: Response) -> None:  # pyright: ignore[reportUnusedFunction]
+        force = response.input_flags.get_flag_by_name('force', with_status=ValidationStatus.VALID)
+        print(f'migrating, force={force is not None}')
+
+    @router.command(Command('other', description='Other command'))
+    def other(_response: Response) -> None:  # pyright: ignore[reportUnusedFunction]
+        pass
+
+    app = App(override_system_messages=True, printer=print, repeat_command_groups_printing=False)
+    app.include_router(db_router, prefix='db')
+    app.include_router(router)
+    orchestrator.start_polling(app)
+
+    output = capsys.readouterr().out
+    group_help = output.split('migrating, force=True')[1]
+
+    assert '\nmigrating, force=True\n' in output
+    assert 'db migrate *=*=* Apply migrations' in group_help
+    assert 'Other command' not in group_help
@@ -1,8 +1,13 @@
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+from argenta.router.exceptions import RepeatedAliasNameException, RepeatedTriggerNameException
 from argenta.router.exceptions import RepeatedAliasNameException
 import pytest
 from pytest import CaptureFixture
 
-from argenta.app import App
+from argenta.app import App, ExitCode
 from argenta.app.protocols import DescriptionMessageGenerator, NonStandardBehaviorHandler
 from argenta.command.models import Command, InputCommand
 from argenta.response import Response
@@ -17,32 +22,32 @@ from argenta.router import Router
 
 def test_default_exit_command_lowercase_q_is_recognized() -> None:
     app = App()
-    app._setup_system_router()
-    assert app._is_exit_command(InputCommand('q')) is True
+    app._setup_dispatch_state()
+    assert app._dispatch_table.get('q').is_exit_command is True  # type: ignore[union-attr]
 
 
 def test_default_exit_command_uppercase_q_is_recognized() -> None:
     app = App()
-    app._setup_system_router()
-    assert app._is_exit_command(InputCommand('Q')) is True
+    app._setup_dispatch_state()
+    assert app._dispatch_table.get('Q').is_exit_command is True  # type: ignore[union-attr]
 
 
 def test_custom_exit_command_is_recognized() -> None:
     app = App(exit_command=Command('quit'))
-    app._setup_system_router()
-    assert app._is_exit_command(InputCommand('quit')) is True
+    app._setup_dispatch_state()
+    assert app._dispatch_table.get('quit').is_exit_command is True  # type: ignore[union-attr]
 
 
 def test_exit_command_alias_is_recognized() -> None:
     app = App(exit_command=Command('q', aliases={'exit'}))
-    app._setup_system_router()
-    assert app._is_exit_command(InputCommand('exit')) is True
+    app._setup_dispatch_state()
+    assert app._dispatch_table.get('exit').is_exit_command is True  # type: ignore[union-attr]
 
 
 def test_non_exit_command_is_not_recognized() -> None:
     app = App(exit_command=Command('q', aliases={'exit'}))
-    app._setup_system_router()
-    assert app._is_exit_command(InputCommand('quit')) is False
+    app._setup_dispatch_state()
+    assert app._dispatch_table.get('quit') is None
 
 
 # ============================================================================
@@ -60,13 +65,15 @@ def test_registered_command_is_not_unknown() -> None:
         pass
         
     app.include_router(router)
-    assert app._is_unknown_command(InputCommand('fr')) is False
+    app._setup_dispatch_state()
+    assert 'fr' in app._dispatch_table
 
 
 def test_unregistered_command_is_unknown() -> None:
     app = App()
     app.set_unknown_command_handler(lambda command: None)
-    assert app._is_unknown_command(InputCommand('cr')) is True
+    app._setup_dispatch_state()
+    assert 'cr' not in app._dispatch_table
 
 
 # ============================================================================
@@ -275,6 +282,40 @@ def test_app_detects_collision_case_insensitive() -> None:
         app._pre_cycle_setup()
 
 
+def test_app_detects_collision_of_command_registered_after_inclusion() -> None:
+    app = App()
+    router1 = Router()
+    router2 = Router()
+
+    @router1.command('hello')
+    def handler1(_res: Response) -> None:
+        pass
+
+    app.include_router(router1)
+    app.include_router(router2)
+
+    @router2.command(Command('world', aliases={'HELLO'}))
+    def handler2(_res: Response) -> None:
+        pass
+
+    with pytest.raises(RepeatedAliasNameException):
+        app._pre_cycle_setup()
+
+
+def test_app_routes_command_registered_after_inclusion() -> None:
+    app = App()
+    router = Router()
+    app.include_router(router)
+
+    @router.command('late')
+    def handler(_res: Response) -> None:
+        pass
+
+    app._setup_dispatch_state()
+
+    assert app.registered_routers.get_router_by_trigger('late') is router
+
+
 # ============================================================================
 # Tests for startup messages
 # ============================================================================
@@ -332,7 +373,7 @@ def test_process_command_with_router_with_disabled_stdout_redirect(capsys: Captu
     app.include_router(router)
     
     app._pre_cycle_setup()
-    app._process_exist_and_valid_command(InputCommand('command'))
+    app._process_exist_and_valid_command(InputCommand('command'), app._dispatch_table.get('command'))  # type: ignore[arg-type]
     
     stdout = capsys.readouterr()
     
@@ -588,7 +629,8 @@ def test_app_with_router_and_custom_unknown_handler(capsys: CaptureFixture[str])
     app.set_unknown_command_handler(custom_unknown_handler)
     
     # Test that unknown command uses custom handler
-    assert app._is_unknown_command(InputCommand('unknown'))
+    app._setup_dispatch_state()
+    assert 'unknown' not in app._dispatch_table
     app._unknown_command_handler(InputCommand('unknown'))
     
     output = capsys.readouterr()
@@ -618,17 +660,308 @@ def test_app_handlers_work_with_multiple_routers() -> None:
     
     app.set_unknown_command_handler(custom_handler)
     
-    assert not app._is_unknown_command(InputCommand('cmd1'))
-    assert not app._is_unknown_command(InputCommand('cmd2'))
+    assert 'cmd1' in app._dispatch_table
+    assert 'cmd2' in app._dispatch_table
     
-    assert app._is_unknown_command(InputCommand('unknown'))
+    assert 'unknown' not in app._dispatch_table
     app._unknown_command_handler(InputCommand('unknown'))
     assert call_tracker['called']
 
 
-def test_process_exist_and_valid_command_raises_runtime_error_when_router_not_found() -> None:
-    app = App()
+def test_dispatch_table_is_compiled_once_before_polling() -> None:
+    app = App(override_system_messages=True, printer=print)
+    router = Router()
+
+    @router.command(Command('start', aliases={'run'}))
+    def handler(_res: Response) -> None:
+        pass
+
+    app.include_router(router)
     app._pre_cycle_setup()
-    
-    with pytest.raises(RuntimeError, match="Router for 'nonexistent' not found. Panic!"):
-        app._process_exist_and_valid_command(InputCommand('nonexistent'))
+    dispatch_table = app._dispatch_table
+
+    assert app._dispatch_table.get('RUN') is app._dispatch_table.get('start')
+    assert app._dispatch_table.get('q').is_exit_command  # type: ignore[union-attr]
+    app._pre_cycle_setup()
+    assert app._dispatch_table is dispatch_table
+
+
+def test_dispatch_input_command_uses_single_table_lookup(capsys: CaptureFixture[str]) -> None:
+    app = App(override_system_messages=True, printer=print)
+    router = Router()
+
+    @router.command(Command('start'))
+    def handler(_res: Response) -> None:
+        print('started')
+
+    app.include_router(router)
+    app._pre_cycle_setup()
+
+    with patch.object(router, 'finds_appropriate_handler') as mocked_lookup:
+        assert app._dispatch_input_command(InputCommand('START')) == ExitCode.SUCCESS
+
+    mocked_lookup.assert_not_called()
+    assert 'started' in capsys.readouterr().out
+    assert app._dispatch_input_command(InputCommand('q')) is None
+
+
+# ============================================================================
+# Tests for trigger abbreviations
+# ============================================================================
+
+
+def _app_with_abbreviations(allow_trigger_abbreviations: bool = True) -> App:
+    app = App(override_system_messages=True, allow_trigger_abbreviations=allow_trigger_abbreviations)
+    router = Router()
+
+    @router.command(Command('start', aliases={'run'}))
+    def start(_res: Response) -> None:  # pyright: ignore[reportUnusedFunction]
+        pass
+
+    @router.command(Command('stop'))
+    def stop(_res: Response) -> None:  # pyright: ignore[reportUnusedFunction]
+        pass
+
+    @router.command(Command('status'))
+    def status(_res: Response) -> None:  # pyright: ignore[reportUnusedFunction]
+        pass
+
+    app.include_router(router)
+    app._pre_cycle_setup()
+    return app
+
+
+def test_unique_prefix_is_expanded_to_full_trigger() -> None:
+    app = _app_with_abbreviations()
+    input_command = app._expand_abbreviated_trigger(InputCommand.parse('STAR --host 1'))
+    assert input_command.trigger == 'start'
+    assert input_command.input_flags.get_flag_by_name('host') is not None
+
+
+def test_exact_trigger_is_not_expanded() -> None:
+    app = _app_with_abbreviations()
+    input_command = InputCommand('Stop')
+    assert app._expand_abbreviated_trigger(input_command) is input_command
+
+
+def test_abbreviations_are_disabled_by_default() -> None:
+    app = _app_with_abbreviations(allow_trigger_abbreviations=False)
+    assert app._expand_abbreviated_trigger(InputCommand('star')).trigger == 'star'
+    assert app._get_ambiguous_triggers(InputCommand('sta')) == []
+
+
+def test_ambiguous_prefix_returns_candidates() -> None:
+    app = _app_with_abbreviations()
+    assert app._expand_abbreviated_trigger(InputCommand('sta')).trigger == 'sta'
+    assert app._get_ambiguous_triggers(InputCommand('sta')) == ['start', 'status']
+    assert app._get_ambiguous_triggers(InputCommand('x')) == []
+
+
+def test_ambiguous_command_handler_can_be_overridden() -> None:
+    app = _app_with_abbreviations()
+    received: list[tuple[str, list[str]]] = []
+    app.set_ambiguous_command_handler(lambda command, candidates: received.append((command.trigger, candidates)))
+    app._ambiguous_command_handler(InputCommand('st'), ['start', 'status', 'stop'])
+    assert received == [('st', ['start', 'status', 'stop'])]
+
+
+# ============================================================================
+# Tests for banners
+# ============================================================================
+
+
+def test_banners_are_not_rendered_on_init() -> None:
+    with patch('argenta.app.presentation.renderers.BANNER_CACHE') as banner_cache:
+        App()
+    banner_cache.get_or_render.assert_not_called()
+
+
+def test_disabled_banners_skip_farewell_message(capsys: CaptureFixture[str]) -> None:
+    app = App(override_system_messages=True, printer=print, disable_banners=True)
+    app._exit_command_handler(Response(ResponseStatus.ALL_FLAGS_VALID))
+    assert capsys.readouterr().out == ''
+
+
+# ============================================================================
+# Tests for startup imports
+# ============================================================================
+
+
+def test_app_construction_does_not_import_heavy_dependencies() -> None:
+    script = (
+        "import sys\n"
+        "from argenta import App, Command, Router\n"
+        "App().include_router(Router())\n"
+        "print(sorted({'rich', 'dishka', 'prompt_toolkit', 'art'} & set(sys.modules)))\n"
+    )
+    completed_process = subprocess.run(
+        [sys.executable, "-c", script],
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, sys.path))},
+    )
+
+    assert completed_process.stdout.strip() == "[]", completed_process.stderr
+
+
+def test_top_level_names_are_resolved_lazily() -> None:
+    import argenta
+    from argenta.orchestrator import Orchestrator
+
+    assert argenta.Orchestrator is Orchestrator
+    assert argenta.App is App
+    assert 'Orchestrator' in dir(argenta)
+    with pytest.raises(AttributeError):
+        getattr(argenta, 'Missing')
+
+
+# ============================================================================
+# Tests for subcommands
+# ============================================================================
+
+
+def _app_with_subcommands(**app_kwargs: object) -> App:
+    app = App(override_system_messages=True, printer=print, disable_banners=True, **app_kwargs)  # type: ignore[arg-type]
+    db_router = Router(title='Database:')
+    remote_router = Router(title='Remote:')
+
+    @db_router.command(Command('migrate', aliases={'m'}, description='Migrate'))
+    def migrate(res: Response) -> None:
+        print('migrate', [flag.name for flag in res.input_flags])
+
+    @remote_router.command(Command('add', description='Add remote'))
+    def add(_res: Response) -> None:
+        print('remote add')
+
+    app.include_router(db_router, prefix='db')
+    app.include_router(remote_router, prefix='git  remote')
+    return app
+
+
+def test_subcommands_are_dispatched_by_their_full_path() -> None:
+    app = _app_with_subcommands()
+
+    assert app.execute('db migrate -force').output == "migrate ['force']\n"
+    assert app.execute('DB M').output == 'migrate []\n'
+    assert app.execute('git remote add').output == 'remote add\n'
+    assert app.execute('migrate').exit_code == ExitCode.UNKNOWN_COMMAND
+    assert app.execute('db migrate extra').exit_code == ExitCode.INCORRECT_INPUT
+
+
+def test_unknown_subcommand_of_group_is_reported_with_its_path() -> None:
+    result = _app_with_subcommands().execute('db drop')
+
+    assert result.exit_code == ExitCode.UNKNOWN_COMMAND
+    assert 'Unknown command: db drop' in result.output
+
+
+def test_group_prints_description_of_its_subtree_only() -> None:
+    result = _app_with_subcommands().execute('git')
+
+    assert result.exit_code == ExitCode.SUCCESS
+    assert 'git remote add *=*=* Add remote' in result.output
+    assert 'Database:' not in result.output
+
+
+def test_subcommands_are_parsed_through_parse_cache() -> None:
+    app = _app_with_subcommands(parse_cache_size=8)
+
+    assert app.execute('db migrate').output == 'migrate []\n'
+    assert app.execute('db migrate').output == 'migrate []\n'
+    assert app.parse_cache_info is not None and app.parse_cache_info.hits == 1
+
+
+def test_run_once_dispatches_subcommand_from_args(capsys: CaptureFixture[str]) -> None:
+    assert _app_with_subcommands()._run_once(['db', 'migrate', '--force']) == ExitCode.SUCCESS
+    assert capsys.readouterr().out == "migrate ['force']\n"
+
+
+def test_same_trigger_under_different_prefixes_does_not_collide() -> None:
+    app = _app_with_subcommands()
+    router = Router()
+
+    @router.command('migrate')
+    def migrate(_res: Response) -> None:
+        pass
+
+    app.include_router(router)
+    app._setup_dispatch_state()
+
+    assert app.registered_routers.get_router_by_trigger('migrate') is router
+
+
+def test_repeated_subcommand_raises_collision() -> None:
+    app = _app_with_subcommands()
+    router = Router()
+
+    @router.command('migrate')
+    def migrate(_res: Response) -> None:
+        pass
+
+    app.include_router(router, prefix='DB')
+
+    with pytest.raises(RepeatedTriggerNameException):
+        app._setup_dispatch_state()
+
+
+@pytest.mark.parametrize('prefix', ['', '   ', 'db --force'])
+def test_include_router_rejects_invalid_prefix(prefix: str) -> None:
+    with pytest.raises(ValueError):
+        App().include_router(Router(), prefix=prefix)
+
+
+def test_middlewares_wrap_handler_in_order_of_addition() -> None:
+    app = App(override_system_messages=True, printer=print, disable_banners=True)
+    router = Router()
+
+    @router.command('deploy')
+    def deploy(_res: Response) -> None:
+        print('handler')
+
+    def make_middleware(name: str):
+        def middleware(response: Response, call_next) -> None:
+            print(f'{name} before')
+            call_next(response)
+            print(f'{name} after')
+        return middleware
+
+    router.add_middleware(make_middleware('router'))
+    app.add_middleware(make_middleware('outer'))
+    app.add_middleware(make_middleware('inner'))
+    app.include_router(router)
+
+    assert app.execute('deploy').output.splitlines() == [
+        'outer before', 'inner before', 'router before', 'handler', 'router after', 'inner after', 'outer after',
+    ]
+
+
+def test_middleware_can_skip_handler() -> None:
+    app = App(override_system_messages=True, printer=print, disable_banners=True)
+    router = Router()
+
+    @router.command('drop')
+    def drop(_res: Response) -> None:
+        print('dropped')
+
+    app.add_middleware(lambda response, call_next: print('denied'))
+    app.include_router(router)
+
+    assert app.execute('drop').output == 'denied\n'
+
+
+def test_handlers_without_middlewares_are_called_directly() -> None:
+    app = App(override_system_messages=True, printer=print, disable_banners=True)
+    router = Router()
+
+    @router.command('plain')
+    def plain(_res: Response) -> None:
+        pass
+
+    app.add_middleware(lambda response, call_next: None)
+    app.include_router(router)
+    app._setup_dispatch_state()
+
+    assert router.command_handlers.get_command_handler_by_trigger('plain').middleware_chain is not None
+    assert app._system_router.command_handlers.get_command_handler_by_trigger('q').middleware_chain is None
+    assert app.execute('q').exit_code == ExitCode.SUCCESS
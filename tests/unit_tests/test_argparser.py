@@ -294,7 +294,7 @@ def test_argparser_parse_args_populates_argspace_correctly(
     mocker: MockerFixture, processed_args: list[ValueArgument | BooleanArgument]
 ) -> None:
     mock_namespace: Namespace = Namespace(config='config.json', debug=True)
-    mocker.patch('argparse.ArgumentParser.parse_args', return_value=mock_namespace)
+    mocker.patch('argparse.ArgumentParser.parse_known_args', return_value=(mock_namespace, []))
 
     parser: ArgParser = ArgParser(processed_args=processed_args)
     parser._parse_args()
@@ -313,3 +313,55 @@ def test_argparser_parse_args_populates_argspace_correctly(
     assert debug_arg is not None
     assert debug_arg.value is True
     assert debug_arg.founder_class is BooleanArgument
+
+
+def test_argparser_keeps_unknown_args_as_remaining(
+    mocker: MockerFixture, processed_args: list[ValueArgument | BooleanArgument]
+) -> None:
+    mocker.patch('sys.argv', ['program.py', '--config', 'prod.json', 'deploy', '--force'])
+
+    parser: ArgParser = ArgParser(processed_args=processed_args)
+    parser._parse_args()
+
+    config_arg: InputArgument | None = parser.parsed_argspace.get_by_name('config')
+    assert config_arg is not None
+    assert config_arg.value == 'prod.json'
+    assert parser.remaining_args == ['deploy', '--force']
+
+
+def test_argparser_leaves_command_flags_matching_app_argument_prefix_to_command(
+    mocker: MockerFixture, processed_args: list[ValueArgument | BooleanArgument]
+) -> None:
+    mocker.patch('sys.argv', ['program.py', 'deploy', '--conf', 'prod'])
+
+    parser: ArgParser = ArgParser(processed_args=processed_args)
+    parser._parse_args()
+
+    config_arg: InputArgument | None = parser.parsed_argspace.get_by_name('config')
+    assert config_arg is not None
+    assert config_arg.value == 'dev.json'
+    assert parser.remaining_args == ['deploy', '--conf', 'prod']
+
+
+def test_argparser_accepts_abbreviated_app_argument_before_trigger(
+    mocker: MockerFixture, processed_args: list[ValueArgument | BooleanArgument]
+) -> None:
+    mocker.patch('sys.argv', ['program.py', '--conf', 'prod.json', 'deploy', '--force'])
+
+    parser: ArgParser = ArgParser(processed_args=processed_args)
+    parser._parse_args()
+
+    config_arg: InputArgument | None = parser.parsed_argspace.get_by_name('config')
+    assert config_arg is not None
+    assert config_arg.value == 'prod.json'
+    assert parser.remaining_args == ['deploy', '--force']
+
+
+def test_argparser_rejects_remaining_args(mocker: MockerFixture) -> None:
+    mocker.patch('sys.argv', ['program.py', 'deploy'])
+
+    parser: ArgParser = ArgParser(processed_args=[])
+    parser._parse_args()
+
+    with pytest.raises(SystemExit):
+        parser._reject_remaining_args()
@@ -1,4 +1,5 @@
 import os
+import subprocess
 import sys
 import tempfile
 from typing import Any, Callable
@@ -10,11 +11,10 @@ from prompt_toolkit.completion import CompleteEvent
 from prompt_toolkit.document import Document
 from prompt_toolkit.history import InMemoryHistory
 
-from argenta.app.autocompleter.entity import (
-    AutoCompleter,
-    CommandLexer,
-    HistoryCompleter
-)
+from argenta.app.autocompleter.completers import CommandLexer, HistoryCompleter
+from argenta.app.autocompleter.entity import AutoCompleter
+from argenta.app.history import IndexedHistory, TailFileHistory
+from argenta.app.prefix_tree import PrefixTree
 
 
 COMMANDS: set[str] = {"start", "stop", "status"}
@@ -54,6 +54,12 @@ def test_command_lexer_highlights_valid_command() -> None:
     assert tokens == [("class:valid", "start server")]
 
 
+def test_command_lexer_highlights_subcommand_by_its_group() -> None:
+    lexer = CommandLexer({"db migrate"})
+    assert lexer.lex_document(Document("db migrate"))(0) == [("class:valid", "db migrate")]
+    assert lexer.lex_document(Document("migrate"))(0) == [("class:invalid", "migrate")]
+
+
 def test_command_lexer_highlights_invalid_command() -> None:
     lexer = CommandLexer({"start", "stop"})
     doc = Document("invalid command")
@@ -91,6 +97,41 @@ def test_history_completer_returns_matching_commands() -> None:
     assert "stop server" not in completion_texts
 
 
+def test_history_completer_uses_given_prefix_tree_for_static_commands() -> None:
+    history = InMemoryHistory()
+    completer = HistoryCompleter(history, {"status"}, PrefixTree({"status", "stop"}))
+
+    completions = list(completer.get_completions(Document("st"), CompleteEvent()))
+
+    assert [c.text for c in completions] == ["status", "stop"]
+
+
+def test_history_completer_loads_older_entries_when_recent_ones_do_not_match(tmp_path: Any) -> None:
+    filename = str(tmp_path / "history")
+    tail_history = TailFileHistory(filename, loaded_entries_limit=2)
+    for string in ["deploy prod", "start", "stop"]:
+        tail_history.store_string(string)
+    history = IndexedHistory(tail_history)
+    completer = HistoryCompleter(history, set())
+
+    assert [c.text for c in completer.get_completions(Document("st"), CompleteEvent())] == ["start", "stop"]
+    assert "deploy prod" not in history.index
+
+    assert [c.text for c in completer.get_completions(Document("de"), CompleteEvent())] == ["deploy prod"]
+
+
+def test_history_completer_serves_indexed_history_and_picks_up_new_entries() -> None:
+    history = IndexedHistory(InMemoryHistory(["start server", "stop server"]))
+    completer = HistoryCompleter(history, {"status", "start server"})
+
+    completions = list(completer.get_completions(Document("st"), CompleteEvent()))
+    assert [c.text for c in completions] == ["start server", "status", "stop server"]
+
+    history.append_string("stash")
+    completions = list(completer.get_completions(Document("sta"), CompleteEvent()))
+    assert [c.text for c in completions] == ["start server", "stash", "status"]
+
+
 def test_history_completer_returns_all_when_empty_input() -> None:
     history = InMemoryHistory()
     history.append_string("start")
@@ -192,7 +233,7 @@ def test_autocompleter_initial_setup_with_commands() -> None:
     completer = AutoCompleter()
     
     with patch.object(sys.stdin, 'isatty', return_value=True), \
-         patch('argenta.app.autocompleter.entity.PromptSession') as mock_session:
+         patch('prompt_toolkit.PromptSession') as mock_session:
         completer.initial_setup({"start", "stop", "status"})
     
     assert completer._session is not None
@@ -208,8 +249,8 @@ def test_autocompleter_initial_setup_with_history_file() -> None:
         completer = AutoCompleter(history_filename=history_file)
         
         with patch.object(sys.stdin, 'isatty', return_value=True), \
-             patch('argenta.app.autocompleter.entity.PromptSession'), \
-             patch('argenta.app.autocompleter.entity.ThreadedHistory') as mock_threaded_history:
+             patch('prompt_toolkit.PromptSession'), \
+             patch('prompt_toolkit.history.ThreadedHistory') as mock_threaded_history:
             completer.initial_setup({"start", "stop"})
         
         assert completer._session is not None
@@ -220,12 +261,23 @@ def test_autocompleter_initial_setup_with_history_file() -> None:
             os.unlink(history_file)
 
 
+def test_autocompleter_uses_tail_file_history_when_history_is_bounded() -> None:
+    bounded_completer = AutoCompleter(history_filename="history.txt", history_entries_limit=50)
+    unbounded_completer = AutoCompleter(history_filename="history.txt")
+
+    bounded_history = bounded_completer._create_file_history("history.txt")
+
+    assert isinstance(bounded_history, TailFileHistory)
+    assert bounded_history.loaded_entries_limit == 50
+    assert not isinstance(unbounded_completer._create_file_history("history.txt"), TailFileHistory)
+
+
 def test_autocompleter_initial_setup_without_history_file() -> None:
     completer = AutoCompleter(history_filename=None)
     
     with patch.object(sys.stdin, 'isatty', return_value=True), \
-         patch('argenta.app.autocompleter.entity.PromptSession'), \
-         patch('argenta.app.autocompleter.entity.InMemoryHistory') as mock_in_memory:
+         patch('prompt_toolkit.PromptSession'), \
+         patch('prompt_toolkit.history.InMemoryHistory') as mock_in_memory:
         completer.initial_setup({"start", "stop"})
     
     assert completer._session is not None
@@ -237,7 +289,7 @@ def test_autocompleter_initial_setup_with_custom_autocomplete_button() -> None:
     completer = AutoCompleter(autocomplete_button="c-space")
     
     with patch.object(sys.stdin, 'isatty', return_value=True), \
-         patch('argenta.app.autocompleter.entity.PromptSession'):
+         patch('prompt_toolkit.PromptSession'):
         completer.initial_setup({"start", "stop"})
     
     assert completer._session is not None
@@ -248,7 +300,7 @@ def test_autocompleter_initial_setup_without_auto_suggestions() -> None:
     completer = AutoCompleter(auto_suggestions=False)
     
     with patch.object(sys.stdin, 'isatty', return_value=True), \
-         patch('argenta.app.autocompleter.entity.PromptSession') as mock_session:
+         patch('prompt_toolkit.PromptSession') as mock_session:
         completer.initial_setup({"start", "stop"})
     
     assert completer._session is not None
@@ -260,7 +312,7 @@ def test_autocompleter_initial_setup_without_command_highlighting() -> None:
     completer = AutoCompleter(command_highlighting=False)
     
     with patch.object(sys.stdin, 'isatty', return_value=True), \
-         patch('argenta.app.autocompleter.entity.PromptSession') as mock_session:
+         patch('prompt_toolkit.PromptSession') as mock_session:
         completer.initial_setup({"start", "stop"})
     
     assert completer._session is not None
@@ -282,8 +334,8 @@ def test_autocompleter_key_binding_handler_with_complete_state() -> None:
         return decorator
     
     with patch.object(sys.stdin, 'isatty', return_value=True), \
-         patch('argenta.app.autocompleter.entity.PromptSession'), \
-         patch('argenta.app.autocompleter.entity.KeyBindings') as mock_kb_class:
+         patch('prompt_toolkit.PromptSession'), \
+         patch('prompt_toolkit.key_binding.KeyBindings') as mock_kb_class:
         
         mock_kb = MagicMock()
         mock_kb.add = capture_kb_add
@@ -316,8 +368,8 @@ def test_autocompleter_key_binding_handler_no_completions() -> None:
         return decorator
     
     with patch.object(sys.stdin, 'isatty', return_value=True), \
-         patch('argenta.app.autocompleter.entity.PromptSession'), \
-         patch('argenta.app.autocompleter.entity.KeyBindings') as mock_kb_class:
+         patch('prompt_toolkit.PromptSession'), \
+         patch('prompt_toolkit.key_binding.KeyBindings') as mock_kb_class:
         
         mock_kb = MagicMock()
         mock_kb.add = capture_kb_add
@@ -353,8 +405,8 @@ def test_autocompleter_key_binding_handler_single_completion() -> None:
         return decorator
     
     with patch.object(sys.stdin, 'isatty', return_value=True), \
-         patch('argenta.app.autocompleter.entity.PromptSession'), \
-         patch('argenta.app.autocompleter.entity.KeyBindings') as mock_kb_class:
+         patch('prompt_toolkit.PromptSession'), \
+         patch('prompt_toolkit.key_binding.KeyBindings') as mock_kb_class:
         
         mock_kb = MagicMock()
         mock_kb.add = capture_kb_add
@@ -391,8 +443,8 @@ def test_autocompleter_key_binding_handler_multiple_completions() -> None:
         return decorator
     
     with patch.object(sys.stdin, 'isatty', return_value=True), \
-         patch('argenta.app.autocompleter.entity.PromptSession'), \
-         patch('argenta.app.autocompleter.entity.KeyBindings') as mock_kb_class:
+         patch('prompt_toolkit.PromptSession'), \
+         patch('prompt_toolkit.key_binding.KeyBindings') as mock_kb_class:
         
         mock_kb = MagicMock()
         mock_kb.add = capture_kb_add
@@ -476,3 +528,21 @@ def test_autocompleter_prompt_with_string_in_normal_mode() -> None:
     mock_session.prompt.assert_called_once()
     call_args = mock_session.prompt.call_args
     assert isinstance(call_args[0][0], HTML)
+
+
+def test_autocompleter_non_interactive_setup_does_not_import_prompt_toolkit() -> None:
+    script = (
+        "import sys\n"
+        "from argenta.app import AutoCompleter\n"
+        "AutoCompleter().initial_setup({'start'})\n"
+        "print('prompt_toolkit' in sys.modules)\n"
+    )
+    completed_process = subprocess.run(
+        [sys.executable, "-c", script],
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, sys.path))},
+    )
+
+    assert completed_process.stdout.strip() == "False", completed_process.stderr
@@ -0,0 +1,63 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from art import text2art
+
+from argenta.app.banner_cache import BannerCache
+
+
+def test_banner_is_rendered_with_art(tmp_path: Path) -> None:
+    cache = BannerCache(str(tmp_path))
+    assert cache.get_or_render('Argenta', 'tarty1') == text2art('Argenta', font='tarty1')
+
+
+def test_rendered_banner_is_stored_on_disk(tmp_path: Path) -> None:
+    BannerCache(str(tmp_path)).get_or_render('Argenta', 'tarty1')
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_cached_banner_is_read_without_rendering(tmp_path: Path) -> None:
+    expected = BannerCache(str(tmp_path)).get_or_render('Argenta', 'tarty1')
+    with patch.object(BannerCache, '_render') as render:
+        assert BannerCache(str(tmp_path)).get_or_render('Argenta', 'tarty1') == expected
+    render.assert_not_called()
+
+
+def test_banner_is_kept_in_memory_after_first_lookup(tmp_path: Path) -> None:
+    cache = BannerCache(str(tmp_path))
+    expected = cache.get_or_render('Argenta', 'chanky')
+    for banner_path in tmp_path.iterdir():
+        banner_path.unlink()
+    assert cache.get_or_render('Argenta', 'chanky') == expected
+    assert not os.listdir(tmp_path)
+
+
+def test_cache_is_keyed_on_text_font_and_art_version(tmp_path: Path) -> None:
+    cache = BannerCache(str(tmp_path))
+    cache.get_or_render('Argenta', 'tarty1')
+    cache.get_or_render('Argenta', 'chanky')
+    cache.get_or_render('See you', 'chanky')
+    assert len(os.listdir(tmp_path)) == 3
+
+    with patch.object(BannerCache, '_get_art_version', return_value='0.0'):
+        BannerCache(str(tmp_path)).get_or_render('Argenta', 'tarty1')
+    assert len(os.listdir(tmp_path)) == 4
+
+
+def test_art_version_is_read_from_installed_distribution(tmp_path: Path) -> None:
+    import art
+
+    assert BannerCache(str(tmp_path))._get_art_version() == art.__version__
+
+
+def test_unwritable_cache_directory_is_ignored(tmp_path: Path) -> None:
+    blocking_file = tmp_path / 'banners'
+    blocking_file.write_text('')
+    cache = BannerCache(str(blocking_file))
+    assert cache.get_or_render('Argenta', 'tarty1') == text2art('Argenta', font='tarty1')
+
+
+def test_default_directory_follows_xdg_cache_home(tmp_path: Path) -> None:
+    with patch.dict(os.environ, {'XDG_CACHE_HOME': str(tmp_path)}):
+        assert BannerCache().directory == os.path.join(tmp_path, 'argenta', 'banners')
@@ -2,7 +2,7 @@ import pytest
 from unittest.mock import Mock
 
 from argenta.app.behavior_handlers.models import BehaviorHandlersFabric, BehaviorHandlersSettersMixin
-from argenta.app.presentation.renderers import PlainRenderer
+from argenta.app.presentation.renderers import PlainRenderer, RichRenderer
 from argenta.command.models import InputCommand
 from argenta.response import Response, ResponseStatus
 
@@ -90,13 +90,42 @@ class TestBehaviorHandlersFabric:
         assert "unknown" in call_arg
         assert "most similar" not in call_arg
 
+    def test_generate_ambiguous_command_handler(self, behavior_fabric: BehaviorHandlersFabric, mock_printer: Mock):
+        handler = behavior_fabric.generate_ambiguous_command_handler()
+
+        handler(InputCommand("st"), ["start", "stop"])
+
+        mock_printer.assert_called_once()
+        call_arg = mock_printer.call_args[0][0]
+        assert "Ambiguous command" in call_arg
+        assert "start, stop" in call_arg
+
+    def test_ambiguous_command_handler_escapes_rich_markup(self, mock_printer: Mock, mock_most_similar_getter: Mock):
+        fabric = BehaviorHandlersFabric(mock_printer, RichRenderer(), mock_most_similar_getter)
+        handler = fabric.generate_ambiguous_command_handler()
+
+        handler(InputCommand("[bold]st"), ["[bold]start", "[bold]stop"])
+
+        call_arg = mock_printer.call_args[0][0]
+        assert "[blue]\\[bold]st[/blue]" in call_arg
+        assert "[blue]\\[bold]start, \\[bold]stop[/blue]" in call_arg
+
     def test_generate_exit_command_handler(self, behavior_fabric: BehaviorHandlersFabric, mock_printer: Mock):
         handler = behavior_fabric.generate_exit_command_handler("Goodbye!")
         
         response = Response(ResponseStatus.ALL_FLAGS_VALID)
         handler(response)
         
-        mock_printer.assert_called_once_with("Goodbye!")
+        mock_printer.assert_called_once_with("\nGoodbye! | https://github.com/koloideal/Argenta | made by kolo")
+
+    def test_generate_exit_command_handler_without_farewell_message(
+        self, behavior_fabric: BehaviorHandlersFabric, mock_printer: Mock
+    ):
+        handler = behavior_fabric.generate_exit_command_handler(None)
+
+        handler(Response(ResponseStatus.ALL_FLAGS_VALID))
+
+        mock_printer.assert_not_called()
 
     def test_generate_description_message_generator(self, behavior_fabric: BehaviorHandlersFabric):
         generator = behavior_fabric.generate_description_message_generator()
@@ -0,0 +1,161 @@
+import io
+import subprocess
+import sys
+from collections.abc import Iterator
+from contextlib import redirect_stdout
+from importlib import import_module
+from pathlib import Path
+
+import pytest
+
+from argenta import App, Command, Router
+from argenta.app import ExitCode
+from argenta.codegen import CompiledRoutes, generate_dispatch_module
+from argenta.orchestrator import ArgParser, Orchestrator
+from argenta.response import Response
+
+HANDLERS_MODULE: str = """
+import re
+from datetime import timedelta
+
+from argenta import Command, Router
+from argenta.command import Flag, Flags, PossibleValues
+from argenta.data_bridge import DataBridge
+from argenta.di import FromDishka
+from argenta.response import Response
+
+router = Router(title="Shop commands:")
+admin = Router(title="Admin commands:", disable_redirect_stdout=True)
+
+
+@router.command(Command("buy", description="Buy an item", aliases={"b", "purchase"}, flags=Flags([
+    Flag("item", possible_values=["apple", "pear"]),
+    Flag("count", possible_values=re.compile(r"^\\d+$"), type=int),
+    Flag("wait", type=timedelta),
+    Flag("gift", prefix="-", possible_values=PossibleValues.NEITHER),
+])))
+def buy(response: Response) -> None:
+    for flag in response.input_flags:
+        print(flag.string_entity, repr(flag.value), flag.status.value)
+    print("bought", response.status.value)
+
+
+@router.command(Command("stock", description="Show the stock"))
+def stock(response: Response, data_bridge: FromDishka[DataBridge]) -> None:
+    print("stock", type(data_bridge).__name__, response.status.value)
+
+
+@admin.command("reset")
+def reset(response: Response) -> None:
+    print("reset", response.status.value)
+"""
+
+APP_MODULE: str = """
+from argenta import App
+from argenta_test_shop.handlers import admin, router
+
+app = App(override_system_messages=True, printer=print, disable_banners=True)
+app.include_router(router)
+app.include_router(admin, prefix="admin")
+"""
+
+
+@pytest.fixture
+def package_directory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    package = tmp_path / "argenta_test_shop"
+    package.mkdir()
+    (package / "__init__.py").write_text("", encoding="utf-8")
+    (package / "handlers.py").write_text(HANDLERS_MODULE, encoding="utf-8")
+    (package / "app.py").write_text(APP_MODULE, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield tmp_path
+    for module_name in [name for name in sys.modules if name.startswith("argenta_test_shop")]:
+        sys.modules.pop(module_name)
+
+
+def _load_compiled_app(package_directory: Path) -> App:
+    source: str = generate_dispatch_module(import_module("argenta_test_shop.app").app, source="argenta_test_shop.app:app")
+    (package_directory / "argenta_test_shop" / "dispatch.py").write_text(source, encoding="utf-8")
+    for module_name in ["argenta_test_shop.handlers", "argenta_test_shop.app"]:
+        sys.modules.pop(module_name)
+
+    routes: CompiledRoutes = import_module("argenta_test_shop.dispatch").ROUTES
+    compiled_app = App(override_system_messages=True, printer=print, disable_banners=True)
+    compiled_app.include_compiled_routes(routes)
+    return compiled_app
+
+
+def _render_help(app: App) -> str:
+    output = io.StringIO()
+    with redirect_stdout(output):
+        app._pre_cycle_setup()
+    return output.getvalue()
+
+
+def test_compiled_app_dispatches_the_same_as_original(package_directory: Path) -> None:
+    compiled_app = _load_compiled_app(package_directory)
+    app = import_module("argenta_test_shop.app").app
+
+    assert _render_help(compiled_app) == _render_help(app)
+    for command in [
+        "buy --item apple --count 3 -gift",
+        "B --item plum",
+        "purchase --count x",
+        "buy --wait 1h30m",
+        "buy --wait soon",
+        "admin reset",
+        "admin",
+        "bu",
+        "unknown",
+    ]:
+        result, compiled_result = app.execute(command), compiled_app.execute(command)
+        assert (compiled_result.exit_code, compiled_result.output) == (result.exit_code, result.output)
+
+
+def test_compiled_app_imports_handlers_on_first_dispatch(package_directory: Path) -> None:
+    compiled_app = _load_compiled_app(package_directory)
+
+    assert "argenta_test_shop.handlers" not in sys.modules
+    assert compiled_app.execute("admin reset").output == "reset ALL_FLAGS_VALID\n"
+    assert "argenta_test_shop.handlers" in sys.modules
+
+
+def test_compiled_app_injects_dependencies_through_orchestrator(
+    package_directory: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    compiled_app = _load_compiled_app(package_directory)
+    monkeypatch.setattr(sys, "argv", ["shop"])
+    orchestrator = Orchestrator(arg_parser=ArgParser(processed_args=[]))
+
+    assert orchestrator.run_once(compiled_app, ["stock"]) == ExitCode.SUCCESS
+    assert orchestrator.run_once(compiled_app, ["stock"]) == ExitCode.SUCCESS
+    assert capsys.readouterr().out == "stock DataBridge ALL_FLAGS_VALID\n" * 2
+
+
+def test_generation_fails_for_handler_not_importable_by_name() -> None:
+    router = Router()
+
+    def create_handler() -> object:
+        def handler(response: Response) -> None:
+            pass
+
+        return handler
+
+    router.command(Command("closure"))(create_handler())
+    app = App(override_system_messages=True, disable_banners=True)
+    app.include_router(router)
+
+    with pytest.raises(ValueError, match="closure"):
+        generate_dispatch_module(app, source="closure:app")
+
+
+def test_command_line_writes_dispatch_module(package_directory: Path) -> None:
+    output_path: Path = package_directory / "argenta_test_shop" / "dispatch.py"
+    subprocess.run(
+        [sys.executable, "-m", "argenta.codegen", "argenta_test_shop.app:app", "-o", str(output_path)],
+        check=True,
+        cwd=package_directory,
+        env={"PYTHONPATH": ":".join(path for path in sys.path if path)},
+    )
+
+    assert "ROUTES = CompiledRoutes(" in output_path.read_text(encoding="utf-8")
@@ -34,6 +34,19 @@ def test_parse_handles_triple_prefix_flags() -> None:
     InputFlag('host', input_value='192.168.0.0', prefix='---')
 
 
+def test_from_tokens_matches_parse() -> None:
+    cmd = InputCommand.from_tokens(['ssh', '--host', '192.168.0.3', '-v'])
+    assert cmd.trigger == 'ssh'
+    assert cmd.input_flags == InputCommand.parse('ssh --host 192.168.0.3 -v').input_flags
+
+
+def test_from_tokens_keeps_tokens_with_spaces() -> None:
+    cmd = InputCommand.from_tokens(['echo', '--text', 'hello world'])
+    flag = cmd.input_flags.get_flag_by_name('text')
+    assert flag is not None
+    assert flag.input_value == 'hello world'
+
+
 # ============================================================================
 # Tests for InputCommand parsing - error cases
 # ============================================================================
@@ -59,6 +72,11 @@ def test_parse_raises_error_for_empty_command() -> None:
         InputCommand.parse('')
 
     
+def test_from_tokens_raises_error_for_empty_tokens() -> None:
+    with pytest.raises(EmptyInputCommandException):
+        InputCommand.from_tokens([])
+
+
 def test_parse_raises_error_slash_on_the_end() -> None:
     with pytest.raises(UnprocessedInputFlagException):
         InputCommand.parse('ssh --host 192.168.0.3\\')
@@ -117,3 +135,54 @@ def test_validate_input_flag_returns_undefined_for_unregistered_flag_in_multiple
 def test_validate_input_flag_returns_undefined_when_command_has_no_flags() -> None:
     command = Command('some')
     assert command.validate_input_flag(InputFlag('case', input_value='', status=None)) == ValidationStatus.UNDEFINED
+
+
+# ============================================================================
+# Tests for compiled flag validators
+# ============================================================================
+
+
+@pytest.mark.parametrize(
+    ('possible_values', 'input_value'),
+    [
+        (PossibleValues.ALL, 'value'),
+        (PossibleValues.ALL, ''),
+        (PossibleValues.NEITHER, ''),
+        (PossibleValues.NEITHER, 'value'),
+        (['dev', 'prod'], 'prod'),
+        (['dev', 'prod'], 'test'),
+        (('dev', 'prod'), 'dev'),
+        ({'dev', 'prod'}, 'stage'),
+        (re.compile(r'\d+'), '8080'),
+        (re.compile(r'\d+'), '80a'),
+        (re.compile(r'\d+'), 'a80'),
+        ('abc', 'bc'),
+    ],
+)
+def test_compiled_validator_agrees_with_flag_validation(
+    possible_values: list[str] | tuple[str, ...] | set[str] | re.Pattern[str] | PossibleValues | str,
+    input_value: str,
+) -> None:
+    flag = Flag('test', possible_values=possible_values)
+    assert bool(flag.compile_value_validator()(input_value)) is flag.validate_input_flag_value(input_value)
+
+
+def test_command_compiles_validators_keyed_by_string_entity() -> None:
+    command = Command('some', flags=Flags([Flag('env', possible_values=['dev']), Flag('v', prefix='-')]))
+    assert set(command.flag_validators) == {'--env', '-v'}
+
+
+def test_compiled_list_validator_is_independent_from_later_list_changes() -> None:
+    allowed_values = ['dev']
+    command = Command('some', flags=Flag('env', possible_values=allowed_values))
+    allowed_values.append('prod')
+    assert command.validate_input_flag(InputFlag('env', input_value='prod')) == ValidationStatus.INVALID
+
+
+def test_validate_input_flag_stores_converted_value_of_typed_flag() -> None:
+    command = Command('some', flags=Flags([Flag('port', type=int), Flag('host')]))
+    port, host, bad_port = InputFlag('port', input_value='80'), InputFlag('host', input_value='x'), InputFlag('port', input_value='x')
+    assert command.validate_input_flag(port) == ValidationStatus.VALID
+    assert command.validate_input_flag(host) == ValidationStatus.VALID
+    assert command.validate_input_flag(bad_port) == ValidationStatus.INVALID
+    assert (port.value, host.value, bad_port.value) == (80, 'x', 'x')
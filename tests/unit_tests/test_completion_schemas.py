@@ -0,0 +1,92 @@
+import re
+
+import pytest
+from prompt_toolkit.completion import CompleteEvent
+from prompt_toolkit.document import Document
+from prompt_toolkit.history import InMemoryHistory
+
+from argenta.app.autocompleter.completers import HistoryCompleter
+from argenta.app.completion_schemas import CompletionSchemas
+from argenta.command import Command, Flag, Flags, PossibleValues
+from argenta.response import Response
+from argenta.router import Router
+
+
+@pytest.fixture
+def completion_schemas() -> CompletionSchemas:
+    router = Router()
+
+    @router.command(Command('deploy', aliases={'dep'}, flags=Flags([
+        Flag('env', possible_values=['prod', 'stage', 'dev']),
+        Flag('region', possible_values={'eu-west', 'eu-north', 'us-east'}),
+        Flag('tag', possible_values=re.compile(r'^v\d+$')),
+        Flag('verbose', prefix='-', possible_values=PossibleValues.NEITHER),
+        Flag('message', possible_values=['hello world']),
+    ])))
+    def deploy(_res: Response) -> None:  # pyright: ignore[reportUnusedFunction]
+        pass
+
+    return CompletionSchemas([router])
+
+
+def _complete(completion_schemas: CompletionSchemas, text: str) -> list[str]:
+    completer = HistoryCompleter(InMemoryHistory(), {'deploy', 'dep'}, completion_schemas=completion_schemas)
+    return [completion.text for completion in completer.get_completions(Document(text), CompleteEvent())]
+
+
+def test_schema_enumerates_only_finite_values(completion_schemas: CompletionSchemas) -> None:
+    schema = completion_schemas.get_schema('DEPLOY')
+    assert schema is not None
+    assert schema.flag_strings == ['--env', '--message', '--region', '--tag', '-verbose']
+    assert schema.get_values_with_prefix('--env', '') == ['dev', 'prod', 'stage']
+    assert schema.get_values_with_prefix('--tag', 'v') == []
+    assert not schema.has_values('-verbose')
+    assert completion_schemas.get_schema('dep') is schema
+    assert completion_schemas.get_schema('unknown') is None
+
+
+def test_completes_flag_names_after_trigger(completion_schemas: CompletionSchemas) -> None:
+    assert _complete(completion_schemas, 'deploy --re') == ['--region']
+    assert _complete(completion_schemas, 'dep -') == ['--env', '--message', '--region', '--tag', '-verbose']
+
+
+def test_skips_already_entered_flags(completion_schemas: CompletionSchemas) -> None:
+    assert _complete(completion_schemas, 'deploy --env prod -verbose ') == ['--message', '--region', '--tag']
+
+
+def test_completes_values_of_flag_with_finite_values(completion_schemas: CompletionSchemas) -> None:
+    assert _complete(completion_schemas, 'deploy --region eu-') == ['eu-north', 'eu-west']
+    assert _complete(completion_schemas, 'deploy --env ') == ['dev', 'prod', 'stage']
+
+
+def test_quotes_values_with_spaces(completion_schemas: CompletionSchemas) -> None:
+    assert _complete(completion_schemas, 'deploy --message ') == ["'hello world'"]
+
+
+def test_pattern_valued_flag_has_no_value_completions(completion_schemas: CompletionSchemas) -> None:
+    assert _complete(completion_schemas, 'deploy --tag v') == []
+
+
+def test_trigger_and_unknown_commands_are_not_completed_with_flags(completion_schemas: CompletionSchemas) -> None:
+    assert _complete(completion_schemas, 'dep') == ['dep', 'deploy']
+    assert _complete(completion_schemas, 'unknown --') == []
+
+
+def test_completes_flags_of_subcommand() -> None:
+    router = Router()
+
+    @router.command(Command('migrate', flags=Flags([Flag('force'), Flag('dry-run')])))
+    def migrate(_res: Response) -> None:  # pyright: ignore[reportUnusedFunction]
+        pass
+
+    completion_schemas = CompletionSchemas([router], prefixes={router: 'db schema'})
+    completer = HistoryCompleter(InMemoryHistory(), {'db schema migrate'}, completion_schemas=completion_schemas)
+
+    assert completion_schemas.find_schema(['DB', 'schema', 'migrate', '--force']) == (
+        completion_schemas.get_schema('db schema migrate'), 3
+    )
+    assert completion_schemas.find_schema(['migrate']) == (None, 0)
+    assert [c.text for c in completer.get_completions(Document('db schema migrate --'), CompleteEvent())] == [
+        '--dry-run', '--force'
+    ]
+    assert [c.text for c in completer.get_completions(Document('db s'), CompleteEvent())] == ['db schema migrate']
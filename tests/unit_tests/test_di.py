@@ -1,9 +1,12 @@
+import sys
+from types import ModuleType
 from typing import Generator
 
 import pytest
 from dishka import Container, make_container
 
 from argenta import App, DataBridge, Router
+from argenta.command import InputCommand
 from argenta.di.integration import (
     FromDishka,
     _auto_inject_handlers,
@@ -107,6 +110,28 @@ def test_auto_inject_handlers_injects_dependencies_into_handlers(container: Cont
     _auto_inject_handlers(app)  # check idempotency
 
 
+def test_auto_inject_handlers_injects_lazy_router_handlers_on_load(
+    container: Container, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    Response.patch_by_container(container)
+    module = ModuleType('lazy_di_handlers')
+    module.router = Router()  # type: ignore[attr-defined]
+
+    @module.router.command('command')  # type: ignore[attr-defined]
+    def handler(_res: Response, data_bridge: FromDishka[DataBridge]) -> None:  # pyright: ignore[reportUnusedFunction]
+        print(type(data_bridge).__name__)
+
+    monkeypatch.setitem(sys.modules, 'lazy_di_handlers', module)
+    app = App()
+    app.include_lazy_router('lazy_di_handlers:router', triggers=['command'])
+
+    _auto_inject_handlers(app)
+    lazy_router = next(iter(app.registered_routers))
+    lazy_router.finds_appropriate_handler(InputCommand('command'))
+
+    assert capsys.readouterr().out == 'DataBridge\n'
+
+
 # ============================================================================
 # Tests for container dependency resolution
 # ============================================================================F
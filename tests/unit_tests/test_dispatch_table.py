@@ -0,0 +1,103 @@
+import pytest
+
+from argenta.app.dispatch_table import DispatchTable
+from argenta.command import Command
+from argenta.response import Response
+from argenta.router import Router
+
+
+@pytest.fixture
+def routers() -> tuple[Router, Router]:
+    router = Router(disable_redirect_stdout=True)
+    system_router = Router()
+
+    @router.command(Command("Start", aliases={"run"}))
+    def start(_: Response) -> None:
+        pass
+
+    @system_router.command(Command("q"))
+    def exit_(_: Response) -> None:
+        pass
+
+    return router, system_router
+
+
+def test_dispatch_table_resolves_triggers_and_aliases_case_insensitively(routers: tuple[Router, Router]) -> None:
+    router, system_router = routers
+    dispatch_table = DispatchTable(routers, system_router=system_router)
+
+    start_entry = dispatch_table.get("START")
+    assert start_entry is not None
+    assert start_entry.router is router
+    assert start_entry.command_handler.handled_command.trigger == "Start"
+    assert start_entry.is_redirect_stdout_disabled is True
+    assert start_entry.is_exit_command is False
+    assert dispatch_table.get("Run") is start_entry
+    assert len(dispatch_table) == 3
+
+
+def test_dispatch_table_marks_commands_of_system_router_as_exit(routers: tuple[Router, Router]) -> None:
+    _, system_router = routers
+    exit_entry = DispatchTable(routers, system_router=system_router).get("Q")
+
+    assert exit_entry is not None
+    assert exit_entry.is_exit_command is True
+
+
+def test_dispatch_table_returns_none_for_unknown_trigger(routers: tuple[Router, Router]) -> None:
+    dispatch_table = DispatchTable(routers)
+
+    assert dispatch_table.get("stop") is None
+    assert "stop" not in dispatch_table
+    assert "start" in dispatch_table
+    assert 1 not in dispatch_table
+
+
+def test_dispatch_table_keeps_first_registered_router_for_duplicate_trigger() -> None:
+    first_router, second_router = Router(), Router()
+
+    @first_router.command(Command("start"))
+    def first(_: Response) -> None:
+        pass
+
+    @second_router.command(Command("START"))
+    def second(_: Response) -> None:
+        pass
+
+    entry = DispatchTable([first_router, second_router]).get("start")
+
+    assert entry is not None
+    assert entry.router is first_router
+
+
+def test_dispatch_table_is_bound_back_from_positions(routers: tuple[Router, Router]) -> None:
+    router, system_router = routers
+    positions = DispatchTable(routers, system_router=system_router).get_positions(routers)
+
+    assert positions == {"start": (0, 0), "run": (0, 0), "q": (1, 0)}
+
+    dispatch_table = DispatchTable.from_positions(routers, positions, system_router=system_router)
+    start_entry, run_entry, exit_entry = dispatch_table.get("start"), dispatch_table.get("RUN"), dispatch_table.get("q")
+    assert start_entry is not None and start_entry is run_entry
+    assert start_entry.command_handler is next(iter(router.command_handlers))
+    assert start_entry.is_redirect_stdout_disabled
+    assert exit_entry is not None and exit_entry.is_exit_command
+
+
+def test_dispatch_table_normalizes_triggers_like_router_collision_checks() -> None:
+    router = Router()
+
+    @router.command(Command("straße"))
+    def strasse_with_eszett(_: Response) -> None:
+        pass
+
+    @router.command(Command("strasse"))
+    def strasse(_: Response) -> None:
+        pass
+
+    dispatch_table = DispatchTable([router])
+    eszett_entry, plain_entry = dispatch_table.get("STRAßE"), dispatch_table.get("Strasse")
+
+    assert eszett_entry is not None and eszett_entry.command_handler.handled_command.trigger == "straße"
+    assert plain_entry is not None and plain_entry.command_handler.handled_command.trigger == "strasse"
+    assert len(dispatch_table) == 2
@@ -0,0 +1,95 @@
+import sys
+
+import pytest
+
+from argenta.app import App, ExitCode
+from argenta.app.execution import ExecutionResult
+from argenta.command import Command
+from argenta.response import Response
+from argenta.router import Router
+
+
+@pytest.fixture
+def app() -> App:
+    router = Router()
+
+    @router.command(Command('echo'))
+    def echo(response: Response) -> None:
+        print(f'echo {response.status.value}')
+
+    @router.command(Command('fail'))
+    def fail(_response: Response) -> None:
+        print('before failure')
+        raise ValueError('handler failed')
+
+    app = App(override_system_messages=True, printer=print)
+    app.include_router(router)
+    return app
+
+
+def test_execute_captures_handler_output(app: App, capsys: pytest.CaptureFixture[str]) -> None:
+    result = app.execute('echo')
+
+    assert result.exit_code == ExitCode.SUCCESS
+    assert result.output == 'echo ALL_FLAGS_VALID\n'
+    assert result.exception is None
+    assert result.duration >= 0
+    assert capsys.readouterr().out == ''
+
+
+def test_execute_captures_system_messages(app: App) -> None:
+    result = app.execute('ehco')
+
+    assert result.exit_code == ExitCode.UNKNOWN_COMMAND
+    assert result.output == 'Unknown command: ehco, most similar: echo\n'
+
+
+def test_execute_returns_incorrect_input_for_syntax_errors(app: App) -> None:
+    assert app.execute('echo value').exit_code == ExitCode.INCORRECT_INPUT
+    assert app.execute('').exit_code == ExitCode.INCORRECT_INPUT
+
+
+def test_execute_returns_exception_raised_by_handler(app: App) -> None:
+    result = app.execute('fail')
+
+    assert result.exit_code == ExitCode.HANDLER_ERROR
+    assert isinstance(result.exception, ValueError)
+    assert result.exception.__traceback__ is not None
+    assert result.output == 'before failure\n'
+
+
+def test_execute_restores_stdout(app: App) -> None:
+    stdout = sys.stdout
+    app.execute('fail')
+    assert sys.stdout is stdout
+
+
+def test_execute_of_exit_command_succeeds_silently(app: App) -> None:
+    result = app.execute('q')
+    assert result == ExecutionResult('q', ExitCode.SUCCESS, '', result.duration)
+
+
+def test_execute_many_returns_results_in_order(app: App) -> None:
+    results = list(app.execute_many(['echo', 'missing', 'echo --flag']))
+
+    assert [result.raw_command for result in results] == ['echo', 'missing', 'echo --flag']
+    assert [result.exit_code for result in results] == [
+        ExitCode.SUCCESS,
+        ExitCode.UNKNOWN_COMMAND,
+        ExitCode.SUCCESS,
+    ]
+    assert results[2].output == 'echo UNDEFINED_FLAGS\n'
+
+
+def test_execute_many_is_lazy(app: App) -> None:
+    results = app.execute_many(iter(['echo', 'fail']))
+
+    assert next(results).exit_code == ExitCode.SUCCESS
+    assert next(results).exit_code == ExitCode.HANDLER_ERROR
+
+
+def test_execute_sets_up_dispatch_state_once(app: App) -> None:
+    app.execute('echo')
+    app.execute_many(['echo'])
+    assert app.run_script(['echo']).exit_code == ExitCode.SUCCESS
+    assert app.registered_routers.registered_routers.count(app._system_router) == 1
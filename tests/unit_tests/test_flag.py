@@ -1,9 +1,11 @@
 import re
+from datetime import timedelta
 
 import pytest
 
-from argenta.command.flag import Flag, InputFlag, PossibleValues
+from argenta.command.flag import Flag, InputFlag, PossibleValues, ValidationStatus
 from argenta.command import Flags, InputFlags
+from argenta.command.flag.converters import to_bool, to_duration, to_json
 
 
 # ============================================================================
@@ -355,3 +357,105 @@ def test_flags_bool_returns_false_when_empty() -> None:
 def test_flags_getitem_returns_flag_at_index() -> None:
     flags = Flags([Flag('one'), Flag('two')])
     assert flags[1] == Flag('two')
+
+
+# ============================================================================
+# Tests for flag collections - name index
+# ============================================================================
+
+
+def test_flags_get_by_name_returns_first_registered_of_same_named_flags() -> None:
+    short_flag = Flag('H', prefix='-')
+    flags = Flags([short_flag, Flag('H', prefix='---')])
+    assert flags.get_flag_by_name('H') is short_flag
+
+
+def test_flags_contains_flag_added_after_creation() -> None:
+    flags = Flags([Flag('one')])
+    flags.add_flags([Flag('two', prefix='-')])
+    assert Flag('two', prefix='-') in flags
+    assert Flag('two') not in flags
+
+
+def test_input_flags_get_by_name_and_status_skips_same_named_flag_with_other_status() -> None:
+    invalid_flag = InputFlag('port', input_value='x', status=ValidationStatus.INVALID)
+    valid_flag = InputFlag('port', input_value='80', status=ValidationStatus.VALID)
+    flags = InputFlags([invalid_flag])
+    flags.add_flag(valid_flag)
+    assert flags.get_flag_by_name('port', with_status=ValidationStatus.VALID) is valid_flag
+
+
+def test_input_flags_get_by_name_and_status_sees_status_set_after_adding() -> None:
+    flag = InputFlag('port', input_value='80')
+    flags = InputFlags([flag])
+    flag.status = ValidationStatus.VALID
+    assert flags.get_flag_by_name('port', with_status=ValidationStatus.VALID) is flag
+    assert flags.get_flag_by_name('port', with_status=ValidationStatus.INVALID, default=False) is False
+
+
+def test_input_flags_keeps_insertion_order_and_positional_access() -> None:
+    flags = InputFlags([InputFlag(f'flag{i}', input_value='') for i in range(100)])
+    assert [flag.name for flag in flags] == [f'flag{i}' for i in range(100)]
+    assert flags[42].name == 'flag42'
+
+
+# ============================================================================
+# Tests for typed flag values
+# ============================================================================
+
+
+@pytest.mark.parametrize(('value', 'expected'), [('', True), ('Yes', True), ('on', True), ('0', False), ('off', False)])
+def test_to_bool_converts_known_values(value: str, expected: bool) -> None:
+    assert to_bool(value) is expected
+
+
+@pytest.mark.parametrize(('value', 'expected'), [
+    ('90', timedelta(seconds=90)),
+    ('1.5', timedelta(seconds=1.5)),
+    ('1h30m', timedelta(hours=1, minutes=30)),
+    ('2d250ms', timedelta(days=2, milliseconds=250)),
+])
+def test_to_duration_converts_seconds_and_units(value: str, expected: timedelta) -> None:
+    assert to_duration(value) == expected
+
+
+@pytest.mark.parametrize('converter', [to_bool, to_duration, to_json])
+def test_converters_raise_value_error_on_invalid_value(converter: object) -> None:
+    with pytest.raises(ValueError):
+        converter('1x{')  # type: ignore[operator]
+
+
+def test_flag_without_type_has_no_converter() -> None:
+    assert Flag('port').compile_value_converter() is None
+
+
+def test_flag_type_with_precompiled_converter_is_replaced() -> None:
+    assert Flag('force', type=bool).compile_value_converter() is to_bool
+    assert Flag('port', type=int).compile_value_converter() is int
+
+
+def test_input_flags_get_value_returns_converted_value_of_valid_flag() -> None:
+    flag = InputFlag('port', input_value='80', status=ValidationStatus.VALID)
+    flag.value = 80
+    flags = InputFlags([flag, InputFlag('host', input_value='x', status=ValidationStatus.INVALID)])
+    assert flags.get_value('port') == 80
+    assert flags.get_value('host', default='localhost') == 'localhost'
+
+
+def test_input_flags_typed_accessors_convert_untyped_flag() -> None:
+    flag = InputFlag('port', input_value='80', status=ValidationStatus.VALID)
+    flags = InputFlags([flag, InputFlag('verbose', input_value='', status=ValidationStatus.VALID)])
+    assert flags.get_int('port') == 80
+    assert flags.get_float('port') == 80.0
+    assert flags.get_bool('verbose') is True
+    assert flags.get_bool('port', default=False) is False
+    assert flags.get_int('missing', default=1) == 1
+
+
+def test_input_flags_typed_accessors_keep_value_of_untyped_flag() -> None:
+    flag = InputFlag('port', input_value='80', status=ValidationStatus.VALID)
+    flags = InputFlags([flag])
+    assert flags.get_float('port') == 80.0
+    assert flags.get_int('port') == 80
+    assert type(flags.get_int('port')) is int
+    assert flags.get_value('port') == '80'
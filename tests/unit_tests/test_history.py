@@ -0,0 +1,209 @@
+import os
+import random
+import threading
+from pathlib import Path
+
+import pytest
+from prompt_toolkit.history import FileHistory, InMemoryHistory
+
+from argenta.app.history import IndexedHistory, PrefixIndex, TailFileHistory
+
+
+def test_prefix_index_returns_sorted_unique_matches() -> None:
+    index = PrefixIndex(["stop", "start", "status", "start", "help"])
+    assert index.get_with_prefix("st") == ["start", "status", "stop"]
+    assert index.get_with_prefix("") == ["help", "start", "status", "stop"]
+    assert index.get_with_prefix("x") == []
+    assert len(index) == 4
+
+
+def test_prefix_index_is_updated_incrementally() -> None:
+    index = PrefixIndex(["start"])
+    assert index.get_with_prefix("s") == ["start"]
+    index.add("stop")
+    index.add("sa")
+    assert index.get_with_prefix("s") == ["sa", "start", "stop"]
+    assert "stop" in index
+
+
+def test_prefix_index_handles_max_code_point_in_prefix() -> None:
+    last_char = chr(0x10FFFF)
+    index = PrefixIndex(["a" + last_char, "a" + last_char + "b", "b"])
+    assert index.get_with_prefix("a" + last_char) == ["a" + last_char, "a" + last_char + "b"]
+    assert index.get_with_prefix(last_char) == []
+
+
+def test_prefix_index_matches_linear_scan_on_random_entries() -> None:
+    rnd = random.Random(11)
+    entries: list[str] = []
+    index = PrefixIndex()
+    for _ in range(2000):
+        entry = "".join(rnd.choice("ab ") for _ in range(rnd.randint(0, 5)))
+        entries.append(entry)
+        index.add(entry)
+        if rnd.random() < 0.1:
+            prefix = "".join(rnd.choice("ab") for _ in range(rnd.randint(0, 2)))
+            assert index.get_with_prefix(prefix) == sorted({e for e in entries if e.startswith(prefix)})
+
+
+def test_prefix_index_accepts_entries_from_several_threads() -> None:
+    index = PrefixIndex()
+
+    def add_entries(thread_number: int) -> None:
+        for i in range(1000):
+            index.add(f"cmd {thread_number} {i}")
+            index.get_with_prefix(f"cmd {thread_number}")
+
+    threads = [threading.Thread(target=add_entries, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(index.get_with_prefix("cmd ")) == 4000
+
+
+def test_indexed_history_indexes_loaded_and_appended_strings() -> None:
+    history = IndexedHistory(InMemoryHistory(["start server", "stop server"]))
+    history.ensure_loaded()
+    assert history.index.get_with_prefix("st") == ["start server", "stop server"]
+
+    history.append_string("status")
+    assert history.index.get_with_prefix("sta") == ["start server", "status"]
+    assert history.get_strings() == ["status"]
+
+
+def test_indexed_history_loads_wrapped_history_once() -> None:
+    history = IndexedHistory(InMemoryHistory(["start"]))
+    assert list(history.load_history_strings()) == ["start"]
+    history.history.store_string("hidden")
+    history.ensure_loaded()
+    assert "hidden" not in history.index
+
+
+def _file_history_strings(filename: str) -> list[str]:
+    return list(FileHistory(filename).load_history_strings())
+
+
+def test_tail_file_history_loads_newest_entries_in_file_history_format(tmp_path: Path) -> None:
+    filename = str(tmp_path / "history")
+    file_history = FileHistory(filename)
+    for i in range(10):
+        file_history.store_string(f"cmd {i}")
+    file_history.store_string("multi\nline")
+
+    tail_history = TailFileHistory(filename, loaded_entries_limit=3)
+
+    assert list(tail_history.load_history_strings()) == ["multi\nline", "cmd 9", "cmd 8"]
+
+
+def test_tail_file_history_reads_across_blocks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("argenta.app.history.entity.READ_BLOCK_SIZE", 5)
+    filename = str(tmp_path / "history")
+    tail_history = TailFileHistory(filename, loaded_entries_limit=100)
+    for string in ["first", "sécond\n+third", "", "last"]:
+        tail_history.store_string(string)
+
+    assert list(tail_history.load_history_strings()) == _file_history_strings(filename)
+
+
+def test_tail_file_history_without_file_loads_nothing(tmp_path: Path) -> None:
+    tail_history = TailFileHistory(str(tmp_path / "missing"), loaded_entries_limit=10)
+    assert list(tail_history.load_history_strings()) == []
+    assert list(tail_history.load_older_history_strings()) == []
+
+
+def test_tail_file_history_reaches_older_entries_through_offset_index(tmp_path: Path) -> None:
+    filename = str(tmp_path / "history")
+    tail_history = TailFileHistory(filename, loaded_entries_limit=2)
+    for i in range(5):
+        tail_history.store_string(f"cmd {i}")
+
+    assert list(tail_history.load_older_history_strings(skip=2)) == ["cmd 2", "cmd 1", "cmd 0"]
+    assert os.path.getsize(tail_history.offsets_filename) == 5 * 8
+
+    FileHistory(filename).store_string("written elsewhere")
+    tail_history.store_string("cmd 5")
+    assert list(tail_history.load_older_history_strings(skip=5)) == ["cmd 1", "cmd 0"]
+    assert list(tail_history.load_older_history_strings())[:2] == ["cmd 5", "written elsewhere"]
+
+
+def test_tail_file_history_rebuilds_offset_index_for_replaced_file(tmp_path: Path) -> None:
+    filename = str(tmp_path / "history")
+    tail_history = TailFileHistory(filename, loaded_entries_limit=2)
+    for i in range(5):
+        tail_history.store_string(f"long command number {i}")
+    list(tail_history.load_older_history_strings())
+
+    os.remove(filename)
+    tail_history.store_string("new")
+
+    assert list(tail_history.load_older_history_strings()) == ["new"]
+
+
+def test_tail_file_history_compacts_file_in_background(tmp_path: Path) -> None:
+    filename = str(tmp_path / "history")
+    tail_history = TailFileHistory(filename, loaded_entries_limit=10, max_file_size=2000)
+    for i in range(200):
+        tail_history.store_string(f"cmd {i % 20}")
+        if tail_history._compaction_thread is not None:
+            tail_history._compaction_thread.join()
+
+    history_strings = _file_history_strings(filename)
+    assert os.path.getsize(filename) <= 2000
+    assert history_strings[0] == "cmd 19"
+    assert set(history_strings) == {f"cmd {i}" for i in range(20)}
+    assert list(tail_history.load_older_history_strings()) == history_strings
+
+
+@pytest.mark.parametrize("kwargs", [{"loaded_entries_limit": 0}, {"loaded_entries_limit": 1, "max_file_size": 0}])
+def test_tail_file_history_rejects_invalid_limits(tmp_path: Path, kwargs: dict[str, int]) -> None:
+    with pytest.raises(ValueError):
+        TailFileHistory(str(tmp_path / "history"), **kwargs)
+
+
+def test_indexed_history_indexes_older_entries_on_demand(tmp_path: Path) -> None:
+    filename = str(tmp_path / "history")
+    tail_history = TailFileHistory(filename, loaded_entries_limit=2)
+    for i in range(5):
+        tail_history.store_string(f"cmd {i}")
+    history = IndexedHistory(tail_history)
+    history.ensure_loaded()
+    history.store_string("cmd 5")
+
+    assert history.index.get_with_prefix("cmd") == ["cmd 3", "cmd 4", "cmd 5"]
+    assert history.load_older_history() is True
+    assert history.index.get_with_prefix("cmd") == [f"cmd {i}" for i in range(6)]
+    assert history.load_older_history() is False
+
+
+def test_indexed_history_pages_older_entries_in_bounded_chunks_until_match(tmp_path: Path) -> None:
+    tail_history = TailFileHistory(str(tmp_path / "history"), loaded_entries_limit=2)
+    tail_history.store_string("match 0")
+    for i in range(1, 100):
+        tail_history.store_string(f"cmd {i}")
+    history = IndexedHistory(tail_history)
+
+    assert history.load_older_history("cmd", chunk_size=10) is True
+    assert len(history.index) == 12
+    assert history.load_older_history("match", chunk_size=10, chunks_limit=3) is True
+    assert len(history.index) == 42
+    assert history.load_older_history("match", chunk_size=10) is True
+    assert history.index.get_with_prefix("match") == ["match 0"]
+    assert len(history.index) == 100
+    assert history.load_older_history("match", chunk_size=10) is False
+
+
+def test_tail_file_history_pages_older_entries_with_limit(tmp_path: Path) -> None:
+    tail_history = TailFileHistory(str(tmp_path / "history"), loaded_entries_limit=2)
+    for i in range(5):
+        tail_history.store_string(f"cmd {i}")
+
+    assert list(tail_history.load_older_history_strings(skip=1, limit=2)) == ["cmd 3", "cmd 2"]
+    assert list(tail_history.load_older_history_strings(skip=4, limit=2)) == ["cmd 0"]
+    assert list(tail_history.load_older_history_strings(skip=5, limit=2)) == []
+
+
+def test_indexed_history_without_tail_history_has_no_older_entries() -> None:
+    history = IndexedHistory(InMemoryHistory(["start"]))
+    assert history.load_older_history() is False
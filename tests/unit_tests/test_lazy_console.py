@@ -0,0 +1,29 @@
+import sys
+from unittest.mock import MagicMock, patch
+
+from pytest import CaptureFixture
+
+from argenta.app.lazy_console import LazyConsole
+
+
+def test_console_is_not_created_on_init() -> None:
+    with patch('rich.console.Console') as console_class:
+        LazyConsole()
+    console_class.assert_not_called()
+
+
+def test_console_is_created_once_on_first_print() -> None:
+    console_class = MagicMock()
+    with patch('rich.console.Console', console_class):
+        lazy_console = LazyConsole(highlight=False)
+        lazy_console.print('first')
+        lazy_console.print('second', style='bold')
+
+    console_class.assert_called_once_with(highlight=False)
+    console_class.return_value.print.assert_any_call('first')
+    console_class.return_value.print.assert_any_call('second', style='bold')
+
+
+def test_print_writes_to_stdout(capsys: CaptureFixture[str]) -> None:
+    LazyConsole(file=sys.stdout).print('[bold]hello[/bold]')
+    assert 'hello' in capsys.readouterr().out
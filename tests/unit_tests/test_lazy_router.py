@@ -0,0 +1,123 @@
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from argenta.app import App, ExitCode
+from argenta.app.completion_schemas import CompletionSchemas
+from argenta.command import Command, Flag, Flags
+from argenta.router import LazyRouter, Router
+from argenta.router.exceptions import LazyRouterCommandNotFoundException
+
+ROUTER_MODULE: str = """
+from argenta.command import Command, Flag, Flags
+from argenta.response import Response
+from argenta.router import Router
+
+router = Router(title="Reports:")
+
+
+@router.command(Command("report", aliases={"rep"}, flags=Flags([Flag("format", possible_values=["csv", "json"])])))
+def report(response: Response) -> None:
+    print("report", response.status, [flag.input_value for flag in response.input_flags])
+
+not_router = object()
+"""
+
+
+@pytest.fixture
+def module_name(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, request: pytest.FixtureRequest) -> Iterator[str]:
+    name = f"lazy_reports_{request.node.name}".replace("[", "_").replace("]", "_")
+    (tmp_path / f"{name}.py").write_text(ROUTER_MODULE, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield name
+    sys.modules.pop(name, None)
+
+
+def _app() -> App:
+    return App(override_system_messages=True, printer=print, disable_banners=True)
+
+
+def test_module_is_imported_only_on_first_dispatch(module_name: str) -> None:
+    app = _app()
+    app.include_lazy_router(
+        f"{module_name}:router",
+        triggers=[Command("report", description="Build report", aliases={"rep"})],
+        title="Reports:",
+    )
+    app._setup_dispatch_state()
+
+    assert module_name not in sys.modules
+    assert app.execute("unknown").exit_code == ExitCode.UNKNOWN_COMMAND
+    assert module_name not in sys.modules
+
+    result = app.execute("REP --format json")
+
+    assert result.exit_code == ExitCode.SUCCESS
+    assert result.output == "report ResponseStatus.ALL_FLAGS_VALID ['json']\n"
+    assert module_name in sys.modules
+
+
+def test_help_and_completion_are_served_from_declared_commands(module_name: str) -> None:
+    router = LazyRouter(
+        f"{module_name}:router",
+        commands=[Command("report", description="Build report", flags=Flags([Flag("format", possible_values=["csv"])]))],
+    )
+    app = _app()
+    app.include_router(router)
+    app._setup_dispatch_state()
+
+    help_output = app._renderer.render_command_groups_description(app._description_message_generator, app.registered_routers)
+    schema = CompletionSchemas([router]).get_schema("report")
+
+    assert "report *=*=* Build report" in help_output
+    assert schema is not None and schema.get_values_with_prefix("--format", "") == ["csv"]
+    assert not router.is_loaded
+    assert module_name not in sys.modules
+
+
+def test_flags_are_validated_by_imported_router(module_name: str) -> None:
+    app = _app()
+    app.include_lazy_router(f"{module_name}:router", triggers=["report"], prefix="docs")
+
+    assert app.execute("docs report --format xml").output == "report ResponseStatus.INVALID_VALUE_FLAGS ['xml']\n"
+
+
+def test_undeclared_command_of_imported_router_raises(module_name: str) -> None:
+    router = LazyRouter(f"{module_name}:router", commands=["report", "export"])
+
+    with pytest.raises(LazyRouterCommandNotFoundException, match="export"):
+        router.load()
+
+
+def test_import_path_must_point_to_router(module_name: str) -> None:
+    with pytest.raises(TypeError):
+        LazyRouter(f"{module_name}:not_router", commands=["report"]).load()
+
+
+@pytest.mark.parametrize("import_path", ["module", ":router", "module:"])
+def test_invalid_import_path_raises(import_path: str) -> None:
+    with pytest.raises(ValueError):
+        LazyRouter(import_path, commands=["report"])
+
+
+def test_load_callbacks_receive_imported_router_once(module_name: str) -> None:
+    loaded_routers: list[Router] = []
+    router = LazyRouter(f"{module_name}:router", commands=["report"])
+    router.add_load_callback(loaded_routers.append)
+
+    imported_router = router.load()
+    router.load()
+    router.add_load_callback(loaded_routers.append)
+
+    assert loaded_routers == [imported_router, imported_router]
+    assert router.is_loaded
+
+
+def test_middlewares_wrap_handler_of_imported_router(module_name: str) -> None:
+    app = _app()
+    app.include_lazy_router(f"{module_name}:router", triggers=["report"])
+    app.add_middleware(lambda response, call_next: (print("before"), call_next(response)))
+
+    assert app.execute("report").output == "before\nreport ResponseStatus.ALL_FLAGS_VALID []\n"
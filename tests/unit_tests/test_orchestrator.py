@@ -3,6 +3,7 @@ from dishka import Provider
 from pytest_mock import MockerFixture
 
 from argenta import App, Router
+from argenta.app import ExitCode
 from argenta.command import Command
 from argenta.orchestrator import Orchestrator
 from argenta.orchestrator.argparser import ArgParser
@@ -257,3 +258,103 @@ def test_orchestrator_accepts_multiple_custom_providers(
     call_args = mock_make_container.call_args[0]
     assert provider1 in call_args
     assert provider2 in call_args
+
+
+# ============================================================================
+# Tests for run_once method
+# ============================================================================
+
+
+def test_run_once_executes_command_and_returns_success(
+    mock_argparser: ArgParser, sample_app: App, sample_router: Router, capsys: pytest.CaptureFixture[str]
+) -> None:
+    sample_app.include_router(sample_router)
+
+    exit_code = Orchestrator(arg_parser=mock_argparser).run_once(sample_app, ['test'])
+
+    assert exit_code == ExitCode.SUCCESS
+    assert capsys.readouterr().out == 'test command executed\n'
+
+
+def test_run_once_does_not_run_interactive_setup(
+    mocker: MockerFixture, mock_argparser: ArgParser, sample_app: App, sample_router: Router
+) -> None:
+    pre_cycle_setup = mocker.patch.object(sample_app, '_pre_cycle_setup')
+    initial_setup = mocker.patch.object(sample_app._autocompleter, 'initial_setup')
+    sample_app.include_router(sample_router)
+
+    Orchestrator(arg_parser=mock_argparser).run_once(sample_app, ['test'])
+
+    pre_cycle_setup.assert_not_called()
+    initial_setup.assert_not_called()
+
+
+def test_run_once_returns_handler_error_code_when_handler_raises(
+    mock_argparser: ArgParser, sample_app: App, capsys: pytest.CaptureFixture[str]
+) -> None:
+    router = Router()
+
+    @router.command('fail')
+    def fail(_response: Response) -> None:
+        raise RuntimeError('disk is full')
+
+    sample_app.include_router(router)
+
+    exit_code = Orchestrator(arg_parser=mock_argparser).run_once(sample_app, ['fail'])
+
+    error_output = capsys.readouterr().err
+    assert exit_code == ExitCode.HANDLER_ERROR
+    assert error_output.startswith('Traceback (most recent call last):\n')
+    assert "raise RuntimeError('disk is full')" in error_output
+    assert error_output.endswith('RuntimeError: disk is full\n')
+
+
+def test_run_once_uses_remaining_args_by_default(
+    mocker: MockerFixture, sample_app: App, sample_router: Router, capsys: pytest.CaptureFixture[str]
+) -> None:
+    mocker.patch('sys.argv', ['program.py', 'test'])
+    sample_app.include_router(sample_router)
+
+    exit_code = Orchestrator().run_once(sample_app)
+
+    assert exit_code == ExitCode.SUCCESS
+    assert 'test command executed' in capsys.readouterr().out
+
+
+def test_run_once_returns_unknown_command_code(
+    mock_argparser: ArgParser, sample_app: App, sample_router: Router, capsys: pytest.CaptureFixture[str]
+) -> None:
+    sample_app.include_router(sample_router)
+
+    exit_code = Orchestrator(arg_parser=mock_argparser).run_once(sample_app, ['tset'])
+
+    assert exit_code == ExitCode.UNKNOWN_COMMAND
+    assert 'Unknown command: tset, most similar: test' in capsys.readouterr().out
+
+
+@pytest.mark.parametrize('argv', [[], ['test', 'value'], ['test', '--flag', '--flag']])
+def test_run_once_returns_incorrect_input_code(
+    mock_argparser: ArgParser, sample_app: App, sample_router: Router, argv: list[str]
+) -> None:
+    sample_app.include_router(sample_router)
+
+    assert Orchestrator(arg_parser=mock_argparser).run_once(sample_app, argv) == ExitCode.INCORRECT_INPUT
+
+
+def test_run_once_can_be_called_repeatedly(
+    mock_argparser: ArgParser, sample_app: App, sample_router: Router
+) -> None:
+    sample_app.include_router(sample_router)
+    orchestrator = Orchestrator(arg_parser=mock_argparser)
+
+    assert orchestrator.run_once(sample_app, ['test']) == ExitCode.SUCCESS
+    assert orchestrator.run_once(sample_app, ['q']) == ExitCode.SUCCESS
+
+
+def test_start_polling_rejects_args_left_by_argparser(mocker: MockerFixture, sample_app: App) -> None:
+    mocker.patch('sys.argv', ['program.py', 'test'])
+    run_polling = mocker.patch.object(sample_app, '_run_polling')
+
+    with pytest.raises(SystemExit):
+        Orchestrator().start_polling(sample_app)
+    run_polling.assert_not_called()
@@ -0,0 +1,88 @@
+import pytest
+
+from argenta.app import App
+from argenta.app.parse_cache import ParseCache, ParseCacheInfo
+from argenta.command.exceptions import UnprocessedInputFlagException
+from argenta.command.flag.models import ValidationStatus
+
+
+# ============================================================================
+# Tests for ParseCache - hits, misses and evictions
+# ============================================================================
+
+
+def test_parse_cache_counts_miss_then_hit() -> None:
+    cache = ParseCache(max_size=2)
+    cache.parse('start --port 80')
+    cache.parse('start --port 80')
+    assert cache.get_info() == ParseCacheInfo(hits=1, misses=1, evictions=0, size=1, max_size=2)
+
+
+def test_parse_cache_returns_same_parse_result_on_hit() -> None:
+    cache = ParseCache(max_size=2)
+    first = cache.parse('start --port 80 -v')
+    second = cache.parse('start --port 80 -v')
+    assert second.trigger == first.trigger == 'start'
+    assert [(f.prefix, f.name, f.input_value) for f in second.input_flags] == \
+        [('--', 'port', '80'), ('-', 'v', '')]
+
+
+def test_parse_cache_evicts_least_recently_used_entry() -> None:
+    cache = ParseCache(max_size=2)
+    cache.parse('first')
+    cache.parse('second')
+    cache.parse('first')
+    cache.parse('third')
+    cache.parse('first')
+    cache.parse('second')
+    assert cache.get_info() == ParseCacheInfo(hits=2, misses=4, evictions=2, size=2, max_size=2)
+
+
+def test_parse_cache_result_is_not_poisoned_by_status_mutation() -> None:
+    cache = ParseCache(max_size=2)
+    for flag in cache.parse('start --port 80').input_flags:
+        flag.status = ValidationStatus.INVALID
+        flag.input_value = 'changed'
+
+    flag = cache.parse('start --port 80').input_flags.get_flag_by_name('port')
+    assert flag is not None
+    assert flag.status is None
+    assert flag.input_value == '80'
+
+
+def test_parse_cache_does_not_cache_errors() -> None:
+    cache = ParseCache(max_size=2)
+    for _ in range(2):
+        with pytest.raises(UnprocessedInputFlagException):
+            cache.parse('start value')
+    assert cache.get_info() == ParseCacheInfo(hits=0, misses=2, evictions=0, size=0, max_size=2)
+
+
+def test_parse_cache_clear_resets_entries_and_counters() -> None:
+    cache = ParseCache(max_size=2)
+    cache.parse('start')
+    cache.parse('start')
+    cache.clear()
+    assert cache.get_info() == ParseCacheInfo(hits=0, misses=0, evictions=0, size=0, max_size=2)
+
+
+def test_parse_cache_rejects_non_positive_size() -> None:
+    with pytest.raises(ValueError):
+        ParseCache(max_size=0)
+
+
+# ============================================================================
+# Tests for the parse cache exposed on App
+# ============================================================================
+
+
+def test_app_parse_cache_is_disabled_by_default() -> None:
+    app = App(override_system_messages=True)
+    assert app.parse_cache_info is None
+
+
+def test_app_exposes_parse_cache_counters() -> None:
+    app = App(override_system_messages=True, parse_cache_size=8)
+    app._parse_input_command('start')
+    app._parse_input_command('start')
+    assert app.parse_cache_info == ParseCacheInfo(hits=1, misses=1, evictions=0, size=1, max_size=8)
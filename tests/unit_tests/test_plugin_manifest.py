@@ -0,0 +1,193 @@
+import json
+import os
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from argenta.app import App, ExitCode
+from argenta.app.plugin_manifest import PluginManifestCache
+from argenta.router import LazyRouter
+
+PLUGIN_MODULE: str = """
+import re
+
+from argenta.command import Command, Flag, Flags, PossibleValues
+from argenta.response import Response
+from argenta.router import Router
+
+router = Router(title="Plugin commands:")
+
+
+@router.command(Command("deploy", description="Deploy the app", aliases={"dep"}, flags=Flags([
+    Flag("env", possible_values=["prod", "dev"]),
+    Flag("tag", possible_values=re.compile(r"^v\\d+$", re.IGNORECASE)),
+    Flag("verbose", prefix="-", possible_values=PossibleValues.NEITHER),
+])))
+def deploy(response: Response) -> None:
+    print("deploy", response.status.value)
+"""
+
+
+def _install_plugin(site_directory: Path, version: str) -> None:
+    for dist_info in site_directory.glob("argenta_test_plugin-*.dist-info"):
+        for file in dist_info.iterdir():
+            file.unlink()
+        dist_info.rmdir()
+    dist_info = site_directory / f"argenta_test_plugin-{version}.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(f"Metadata-Version: 2.1\nName: argenta-test-plugin\nVersion: {version}\n")
+    (dist_info / "entry_points.txt").write_text("[argenta_test.routers]\ndeploy = argenta_test_plugin:router\n")
+
+
+@pytest.fixture
+def site_directory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    site_directory = tmp_path / "site"
+    site_directory.mkdir()
+    (site_directory / "argenta_test_plugin.py").write_text(PLUGIN_MODULE, encoding="utf-8")
+    _install_plugin(site_directory, "1.0")
+    monkeypatch.syspath_prepend(str(site_directory))
+    yield site_directory
+    sys.modules.pop("argenta_test_plugin", None)
+
+
+@pytest.fixture
+def manifest_cache(tmp_path: Path) -> PluginManifestCache:
+    return PluginManifestCache(str(tmp_path / "manifests"))
+
+
+def test_first_discovery_imports_plugins_and_writes_manifest(
+    site_directory: Path, manifest_cache: PluginManifestCache
+) -> None:
+    routers = manifest_cache.discover_routers("argenta_test.routers")
+
+    assert [router.title for router in routers] == ["Plugin commands:"]
+    assert not isinstance(routers[0], LazyRouter)
+    assert "argenta_test_plugin" in sys.modules
+    assert len(os.listdir(manifest_cache.directory)) == 1
+
+
+def test_next_discovery_builds_lazy_routers_from_manifest(
+    site_directory: Path, manifest_cache: PluginManifestCache
+) -> None:
+    manifest_cache.discover_routers("argenta_test.routers")
+    sys.modules.pop("argenta_test_plugin")
+
+    router = manifest_cache.discover_routers("argenta_test.routers")[0]
+    command = next(iter(router.command_handlers)).handled_command
+    flags = {flag.string_entity: flag for flag in command.registered_flags}
+
+    assert isinstance(router, LazyRouter)
+    assert "argenta_test_plugin" not in sys.modules
+    assert router.title == "Plugin commands:"
+    assert (command.trigger, command.description, list(command.aliases)) == ("deploy", "Deploy the app", ["dep"])
+    assert flags["--env"].validate_input_flag_value("prod")
+    assert flags["--tag"].validate_input_flag_value("V12")
+    assert flags["-verbose"].validate_input_flag_value("")
+
+
+def test_changed_distribution_invalidates_manifest(site_directory: Path, manifest_cache: PluginManifestCache) -> None:
+    manifest_cache.discover_routers("argenta_test.routers")
+    _install_plugin(site_directory, "2.0")
+
+    assert not isinstance(manifest_cache.discover_routers("argenta_test.routers")[0], LazyRouter)
+
+
+def test_modified_import_path_with_same_distributions_keeps_manifest(
+    site_directory: Path, manifest_cache: PluginManifestCache
+) -> None:
+    manifest_cache.discover_routers("argenta_test.routers")
+    sys.modules.pop("argenta_test_plugin")
+    (site_directory / "unrelated.txt").write_text("")
+
+    assert isinstance(manifest_cache.discover_routers("argenta_test.routers")[0], LazyRouter)
+    assert isinstance(manifest_cache.discover_routers("argenta_test.routers")[0], LazyRouter)
+    assert "argenta_test_plugin" not in sys.modules
+
+
+def test_damaged_manifest_is_rebuilt(site_directory: Path, manifest_cache: PluginManifestCache) -> None:
+    manifest_cache.discover_routers("argenta_test.routers")
+    for manifest_name in os.listdir(manifest_cache.directory):
+        Path(manifest_cache.directory, manifest_name).write_text("{broken")
+
+    assert not isinstance(manifest_cache.discover_routers("argenta_test.routers")[0], LazyRouter)
+    assert isinstance(manifest_cache.discover_routers("argenta_test.routers")[0], LazyRouter)
+
+
+def test_app_dispatches_plugin_command_imported_on_first_use(
+    site_directory: Path, manifest_cache: PluginManifestCache
+) -> None:
+    manifest_cache.discover_routers("argenta_test.routers")
+    sys.modules.pop("argenta_test_plugin")
+    app = App(override_system_messages=True, printer=print, disable_banners=True)
+    app.include_entry_point_routers("argenta_test.routers", manifest_cache=manifest_cache)
+
+    app._setup_dispatch_state()
+    help_output = app._renderer.render_command_groups_description(app._description_message_generator, app.registered_routers)
+
+    assert "deploy *=*=* Deploy the app" in help_output
+    assert "argenta_test_plugin" not in sys.modules
+
+    result = app.execute("dep --env prod")
+
+    assert result.exit_code == ExitCode.SUCCESS
+    assert result.output == "deploy ALL_FLAGS_VALID\n"
+
+
+def test_entry_point_must_refer_to_router(site_directory: Path, manifest_cache: PluginManifestCache) -> None:
+    (site_directory / "argenta_test_plugin.py").write_text("router = object()\n", encoding="utf-8")
+
+    with pytest.raises(TypeError):
+        manifest_cache.discover_routers("argenta_test.routers")
+
+
+def test_edited_plugin_module_invalidates_manifest(site_directory: Path, manifest_cache: PluginManifestCache) -> None:
+    manifest_cache.discover_routers("argenta_test.routers")
+    sys.modules.pop("argenta_test_plugin")
+    plugin_module = site_directory / "argenta_test_plugin.py"
+    plugin_module.write_text(PLUGIN_MODULE.replace("Deploy the app", "Deploy the edited app"), encoding="utf-8")
+    modification_time = plugin_module.stat().st_mtime + 10
+    os.utime(plugin_module, (modification_time, modification_time))
+
+    router = manifest_cache.discover_routers("argenta_test.routers")[0]
+
+    assert not isinstance(router, LazyRouter)
+    assert next(iter(router.command_handlers)).handled_command.description == "Deploy the edited app"
+    assert isinstance(manifest_cache.discover_routers("argenta_test.routers")[0], LazyRouter)
+
+
+@pytest.mark.parametrize("routers", [None, "broken", [{"import_path": "argenta_test_plugin:router"}], [{
+    "import_path": "argenta_test_plugin:router", "title": "Plugin commands:", "disable_redirect_stdout": False,
+    "commands": [{"trigger": "deploy", "description": "", "aliases": [], "flags": [{"name": "env"}]}],
+}]])
+def test_manifest_of_unexpected_shape_is_rebuilt(
+    site_directory: Path, manifest_cache: PluginManifestCache, routers: object
+) -> None:
+    manifest_cache.discover_routers("argenta_test.routers")
+    for manifest_name in os.listdir(manifest_cache.directory):
+        manifest_path = Path(manifest_cache.directory, manifest_name)
+        manifest = json.loads(manifest_path.read_text())
+        manifest["routers"] = routers
+        manifest_path.write_text(json.dumps(manifest))
+
+    assert not isinstance(manifest_cache.discover_routers("argenta_test.routers")[0], LazyRouter)
+    assert isinstance(manifest_cache.discover_routers("argenta_test.routers")[0], LazyRouter)
+
+
+def test_files_written_to_working_directory_keep_manifest(
+    site_directory: Path, manifest_cache: PluginManifestCache, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    working_directory = tmp_path / "work"
+    working_directory.mkdir()
+    monkeypatch.chdir(working_directory)
+    monkeypatch.syspath_prepend("")
+    manifest_cache.discover_routers("argenta_test.routers")
+    sys.modules.pop("argenta_test_plugin")
+
+    (working_directory / "app.log").write_text("started")
+    modification_time = working_directory.stat().st_mtime + 10
+    os.utime(working_directory, (modification_time, modification_time))
+
+    assert isinstance(manifest_cache.discover_routers("argenta_test.routers")[0], LazyRouter)
+    assert "argenta_test_plugin" not in sys.modules
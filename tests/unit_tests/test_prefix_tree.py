@@ -0,0 +1,59 @@
+import random
+
+import pytest
+
+from argenta.app.prefix_tree import PrefixTree
+
+
+@pytest.fixture
+def prefix_tree() -> PrefixTree:
+    return PrefixTree({"start", "stop", "status", "help", "s"})
+
+
+def test_resolve_unique_prefix_returns_the_only_matching_key(prefix_tree: PrefixTree) -> None:
+    assert prefix_tree.resolve_unique_prefix("sta") is None
+    assert prefix_tree.resolve_unique_prefix("star") == "start"
+    assert prefix_tree.resolve_unique_prefix("sto") == "stop"
+    assert prefix_tree.resolve_unique_prefix("h") == "help"
+
+
+def test_resolve_unique_prefix_returns_full_key_itself(prefix_tree: PrefixTree) -> None:
+    assert prefix_tree.resolve_unique_prefix("status") == "status"
+
+
+def test_resolve_unique_prefix_returns_none_for_unknown_prefix(prefix_tree: PrefixTree) -> None:
+    assert prefix_tree.resolve_unique_prefix("x") is None
+    assert prefix_tree.resolve_unique_prefix("starting") is None
+
+
+def test_count_keys_with_prefix(prefix_tree: PrefixTree) -> None:
+    assert prefix_tree.count_keys_with_prefix("") == 5
+    assert prefix_tree.count_keys_with_prefix("s") == 4
+    assert prefix_tree.count_keys_with_prefix("sta") == 2
+    assert prefix_tree.count_keys_with_prefix("q") == 0
+
+
+def test_get_keys_with_prefix_returns_sorted_keys(prefix_tree: PrefixTree) -> None:
+    assert prefix_tree.get_keys_with_prefix("st") == ["start", "status", "stop"]
+    assert prefix_tree.get_keys_with_prefix("st", limit=2) == ["start", "status"]
+    assert prefix_tree.get_keys_with_prefix("z") == []
+
+
+def test_contains_and_len(prefix_tree: PrefixTree) -> None:
+    prefix_tree.add("start")
+    assert len(prefix_tree) == 5
+    assert "s" in prefix_tree
+    assert "st" not in prefix_tree
+    assert 1 not in prefix_tree
+
+
+def test_prefix_tree_matches_linear_scan_on_random_keys() -> None:
+    rnd = random.Random(3)
+    for _ in range(300):
+        keys = {"".join(rnd.choice("abc") for _ in range(rnd.randint(0, 6))) for _ in range(rnd.randint(0, 30))}
+        prefix_tree = PrefixTree(keys)
+        for prefix in {"".join(rnd.choice("abcd") for _ in range(rnd.randint(0, 4))) for _ in range(20)}:
+            expected = sorted(key for key in keys if key.startswith(prefix))
+            assert prefix_tree.get_keys_with_prefix(prefix) == expected
+            assert prefix_tree.count_keys_with_prefix(prefix) == len(expected)
+            assert prefix_tree.resolve_unique_prefix(prefix) == (expected[0] if len(expected) == 1 else None)
@@ -40,6 +40,12 @@ class TestRichRenderer:
         assert "[red], most similar:[/red]" in result
         assert "[blue]unknown[/blue]" in result
 
+    def test_render_text_for_ambiguous_command_handler(self):
+        result = RichRenderer.render_text_for_ambiguous_command_handler("st", ["start", "stop"])
+        assert "[red]Ambiguous command:[/red]" in result
+        assert "[blue]st[/blue]" in result
+        assert "[blue]start, stop[/blue]" in result
+
     def test_render_messages_on_startup(self):
         messages = ["Message 1", "Message 2"]
         result = RichRenderer.render_messages_on_startup(messages)
@@ -102,6 +108,10 @@ class TestPlainRenderer:
         result = PlainRenderer.render_text_for_unknown_command_handler("unknwn", "unknown")
         assert result == "Unknown command: unknwn, most similar: unknown"
 
+    def test_render_text_for_ambiguous_command_handler(self):
+        result = PlainRenderer.render_text_for_ambiguous_command_handler("st", ["start", "stop"])
+        assert result == "Ambiguous command: st, candidates: start, stop"
+
     def test_render_messages_on_startup(self):
         renderer = PlainRenderer()
         messages = ["Message 1", "Message 2"]
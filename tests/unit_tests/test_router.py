@@ -1,4 +1,7 @@
+import os
 import re
+import subprocess
+import sys
 
 import pytest
 from pytest import CaptureFixture
@@ -7,6 +10,7 @@ from argenta.command import Command, InputCommand, Flags, InputFlags
 from argenta.command.flag import Flag, InputFlag
 from argenta.command.flag.models import PossibleValues, ValidationStatus
 from argenta.response.entity import Response
+from argenta.response.status import ResponseStatus
 from argenta.router import Router
 from argenta.router.exceptions import (
     RepeatedAliasNameException,
@@ -81,6 +85,24 @@ def test_validate_func_args_accepts_missing_type_hint(capsys: CaptureFixture[str
     assert output.out == ''
 
 
+def test_structuring_input_flags_converts_value_of_typed_flag() -> None:
+    cmd = Command('cmd', flags=Flags([Flag('port', type=int), Flag('host')]))
+    input_flags = InputFlags([InputFlag('port', input_value='8080'), InputFlag('host', input_value='local')])
+    response = Router._structuring_input_flags(cmd, input_flags)
+    assert response.status == ResponseStatus.ALL_FLAGS_VALID
+    assert response.input_flags.get_value('port') == 8080
+    assert response.input_flags.get_value('host') == 'local'
+
+
+def test_structuring_input_flags_marks_flag_with_failed_conversion_as_invalid() -> None:
+    cmd = Command('cmd', flags=Flag('port', type=int))
+    input_flags = InputFlags([InputFlag('port', input_value='http')])
+    response = Router._structuring_input_flags(cmd, input_flags)
+    assert response.status == ResponseStatus.INVALID_VALUE_FLAGS
+    assert input_flags[0].status == ValidationStatus.INVALID
+    assert input_flags[0].value == 'http'
+
+
 # ============================================================================
 # Tests for input flag structuring - undefined flags
 # ============================================================================
@@ -316,6 +338,61 @@ def test_validate_command_raises_error_for_alias_collision_case_insensitive() ->
             pass
 
 
+# ============================================================================
+# Tests for register_many
+# ============================================================================
+
+
+def test_register_many_registers_all_handlers(capsys: CaptureFixture[str]) -> None:
+    router = Router()
+
+    def handler(res: Response) -> None:
+        print(f'handled {res.status}')
+
+    router.register_many([('first', handler), (Command('second', aliases={'sec'}), handler)])
+    router.finds_appropriate_handler(InputCommand('SEC'))
+
+    assert router.triggers == {'first', 'second'}
+    assert router.aliases == {'sec'}
+    assert 'handled' in capsys.readouterr().out
+
+
+def test_register_many_detects_collision_inside_batch_without_registering() -> None:
+    router = Router()
+
+    def handler(_res: Response) -> None:
+        pass
+
+    with pytest.raises(RepeatedAliasNameException):
+        router.register_many([(Command('first', aliases={'f'}), handler), (Command('second', aliases={'F'}), handler)])
+
+    assert router.triggers == set()
+    assert list(router.command_handlers) == []
+
+
+def test_register_many_detects_collision_with_registered_trigger() -> None:
+    router = Router()
+
+    @router.command('first')
+    def handler(_res: Response) -> None:
+        pass
+
+    with pytest.raises(RepeatedTriggerNameException):
+        router.register_many([('second', handler), ('FIRST', handler)])
+
+    assert router.triggers == {'first'}
+
+
+def test_register_many_validates_handler_args() -> None:
+    router = Router()
+
+    def handler() -> None:  # pyright: ignore[reportUnusedFunction]
+        pass
+
+    with pytest.raises(RequiredArgumentNotPassedException):
+        router.register_many([('first', handler)])  # pyright: ignore[reportArgumentType]
+
+
 # ============================================================================
 # Tests for RegisteredRouters
 # ============================================================================
@@ -406,3 +483,35 @@ def test_registered_routers_returns_none_for_unknown_trigger() -> None:
     registered_routers.add_registered_router(router)
     
     assert registered_routers.get_router_by_trigger('unknown') is None
+
+
+@pytest.mark.parametrize('module', ['argenta.router', 'argenta.router.exceptions', 'argenta.command'])
+def test_subpackage_can_be_imported_before_app(module: str) -> None:
+    completed_process = subprocess.run(
+        [sys.executable, '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+        env={**os.environ, 'PYTHONPATH': os.pathsep.join(filter(None, sys.path))},
+    )
+
+    assert completed_process.returncode == 0, completed_process.stderr
+
+
+def test_compiled_middleware_chain_calls_handler_rebound_after_compilation() -> None:
+    router = Router()
+    calls: list[str] = []
+
+    @router.command('hello')
+    def handler(_res: Response) -> None:
+        calls.append('old')
+
+    router.compile_middlewares()
+    command_handler = router.command_handlers.get_command_handler_by_trigger('hello')
+    assert command_handler.middleware_chain is None
+
+    router.add_middleware(lambda response, call_next: (calls.append('middleware'), call_next(response)))
+    router.compile_middlewares()
+    command_handler.handler_as_func = lambda _res: calls.append('new')
+    command_handler.handling(Response(ResponseStatus.ALL_FLAGS_VALID))
+
+    assert calls == ['middleware', 'new']
@@ -0,0 +1,110 @@
+import io
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from pytest import CaptureFixture
+
+from argenta.app import App, ExitCode
+from argenta.app.script import ScriptCommandResult, ScriptSummary
+from argenta.command import Command
+from argenta.response import Response
+from argenta.router import Router
+
+
+@pytest.fixture
+def app() -> App:
+    router = Router()
+
+    @router.command(Command('echo'))
+    def echo(_response: Response) -> None:
+        print('echo')
+
+    @router.command(Command('fail'))
+    def fail(_response: Response) -> None:
+        raise ValueError('handler failed')
+
+    app = App(override_system_messages=True, printer=print)
+    app.include_router(router)
+    return app
+
+
+def test_run_script_executes_lines_from_iterable(app: App, capsys: CaptureFixture[str]) -> None:
+    summary = app.run_script(['echo', 'echo'])
+
+    assert capsys.readouterr().out == 'echo\necho\n'
+    assert [result.exit_code for result in summary.results] == [ExitCode.SUCCESS, ExitCode.SUCCESS]
+    assert summary.exit_code == ExitCode.SUCCESS
+
+
+def test_run_script_skips_comments_and_empty_lines(app: App) -> None:
+    summary = app.run_script(io.StringIO('# setup\n\n  echo  \n   # indented comment\n'))
+
+    assert summary.results == [ScriptCommandResult(3, 'echo', ExitCode.SUCCESS)]
+
+
+def test_run_script_reads_file_path(app: App, tmp_path: Path) -> None:
+    script_path = tmp_path / 'commands.txt'
+    script_path.write_text('echo\nunknown\n', encoding='utf-8')
+
+    summary = app.run_script(script_path)
+
+    assert [result.exit_code for result in summary.results] == [ExitCode.SUCCESS, ExitCode.UNKNOWN_COMMAND]
+    assert app.run_script(str(script_path)).exit_code == ExitCode.UNKNOWN_COMMAND
+
+
+def test_run_script_continues_after_errors_by_default(app: App, capsys: CaptureFixture[str]) -> None:
+    summary = app.run_script(['fail', 'echo --x', 'ech"o', 'echo'])
+
+    assert [result.exit_code for result in summary.results] == [
+        ExitCode.HANDLER_ERROR,
+        ExitCode.SUCCESS,
+        ExitCode.INCORRECT_INPUT,
+        ExitCode.SUCCESS,
+    ]
+    assert isinstance(summary.results[0].exception, ValueError)
+    assert summary.exit_code == ExitCode.HANDLER_ERROR
+    assert len(summary.failed_results) == 2
+    assert not summary.is_stopped_on_error
+    captured = capsys.readouterr()
+    assert 'Incorrect flag syntax: ech"o' in captured.out
+    assert 'ValueError: handler failed' in captured.err
+    assert summary.results[0].exception.__traceback__ is not None
+
+
+def test_run_script_stops_on_first_error(app: App) -> None:
+    summary = app.run_script(['echo', 'missing', 'echo'], stop_on_error=True)
+
+    assert [result.raw_command for result in summary.results] == ['echo', 'missing']
+    assert summary.is_stopped_on_error
+    assert summary.exit_code == ExitCode.UNKNOWN_COMMAND
+
+
+def test_run_script_ends_on_exit_command(app: App, capsys: CaptureFixture[str]) -> None:
+    summary = app.run_script(['echo', 'q', 'echo'])
+
+    assert len(summary.results) == 1
+    assert capsys.readouterr().out == 'echo\n'
+
+
+def test_run_script_reads_lines_lazily(app: App) -> None:
+    consumed: list[str] = []
+
+    def lines() -> Iterator[str]:
+        for line in ['echo', 'q', 'echo']:
+            consumed.append(line)
+            yield line
+
+    app.run_script(lines())
+
+    assert consumed == ['echo', 'q']
+
+
+def test_run_script_can_be_called_repeatedly(app: App) -> None:
+    assert app.run_script(['echo']).exit_code == ExitCode.SUCCESS
+    assert app.run_script(['echo']).exit_code == ExitCode.SUCCESS
+
+
+def test_script_summary_repr() -> None:
+    summary = ScriptSummary([ScriptCommandResult(1, 'x', ExitCode.UNKNOWN_COMMAND)], is_stopped_on_error=True)
+    assert repr(summary) == 'ScriptSummary<executed=1, failed=1, is_stopped_on_error=True>'
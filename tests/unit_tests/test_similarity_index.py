@@ -0,0 +1,114 @@
+import difflib
+import random
+
+import pytest
+
+from argenta.app.similarity_index import TrigramIndex
+
+
+@pytest.fixture
+def trigram_index() -> TrigramIndex:
+    index = TrigramIndex()
+    index.build({"start", "stop", "status", "restart", "help"})
+    return index
+
+
+def test_get_most_similar_returns_closest_trigger(trigram_index: TrigramIndex) -> None:
+    assert trigram_index.get_most_similar("strat") == ["start"]
+    assert trigram_index.get_most_similar("hlep") == ["help"]
+
+
+def test_get_most_similar_returns_top_k_in_order(trigram_index: TrigramIndex) -> None:
+    assert trigram_index.get_most_similar("stat", limit=3) == ["start", "status", "restart"]
+
+
+def test_get_most_similar_respects_cutoff(trigram_index: TrigramIndex) -> None:
+    assert trigram_index.get_most_similar("xyz") == []
+
+
+def test_get_most_similar_on_empty_index() -> None:
+    assert TrigramIndex().get_most_similar("start") == []
+
+
+def test_build_replaces_previous_triggers(trigram_index: TrigramIndex) -> None:
+    trigram_index.build({"deploy"})
+    assert trigram_index.get_most_similar("strat") == []
+    assert trigram_index.get_most_similar("deplyo") == ["deploy"]
+
+
+@pytest.mark.parametrize("kwargs", [{"cutoff": 1.5}, {"cutoff": -0.1}, {"candidates_limit": 0}, {"fallback_limit": -1}])
+def test_invalid_parameters_raise_value_error(kwargs: dict[str, float]) -> None:
+    with pytest.raises(ValueError):
+        TrigramIndex(**kwargs)  # pyright: ignore[reportArgumentType]
+
+
+def test_get_most_similar_agrees_with_difflib_on_typos() -> None:
+    rnd = random.Random(5)
+    words = ["".join(rnd.choice("abcdefghijklmnop") for _ in range(rnd.randint(3, 12))) for _ in range(300)]
+    index = TrigramIndex()
+    index.build(words)
+
+    agreements = 0
+    for word in rnd.sample(words, 100):
+        position = rnd.randrange(len(word))
+        typo = word[:position] + rnd.choice("abcdefghijklmnop") + word[position + 1:]
+        expected = difflib.get_close_matches(typo, words, n=1)
+        agreements += index.get_most_similar(typo) == expected
+    assert agreements >= 95
+
+
+def test_trigger_sharing_no_trigrams_is_found_by_fallback_rerank() -> None:
+    triggers = ["abc", "xyz", "deploy"]
+    assert difflib.get_close_matches("bac", triggers, n=1) == ["abc"]
+
+    index = TrigramIndex()
+    index.build(triggers)
+    assert index.get_most_similar("bac") == ["abc"]
+
+    index_without_fallback = TrigramIndex(fallback_limit=0)
+    index_without_fallback.build(triggers)
+    assert index_without_fallback.get_most_similar("bac") == []
+
+
+def test_best_match_outside_candidates_is_found_by_fallback_rerank() -> None:
+    triggers = ["adacdb", "babb", "ccdcad", "bdc"]
+    assert difflib.get_close_matches("bdad", triggers, n=1) == ["ccdcad"]
+
+    index = TrigramIndex(candidates_limit=1)
+    index.build(triggers)
+    assert index.get_most_similar("bdad") == ["ccdcad"]
+
+    index_without_fallback = TrigramIndex(candidates_limit=1, fallback_limit=0)
+    index_without_fallback.build(triggers)
+    assert index_without_fallback.get_most_similar("bdad") == []
+
+
+def test_get_most_similar_matches_difflib_ratio_on_random_typos() -> None:
+    rnd = random.Random(7)
+    alphabet = "abcdefghijklmnop"
+    words = ["".join(rnd.choice(alphabet) for _ in range(rnd.randint(3, 12))) for _ in range(1000)]
+    index = TrigramIndex()
+    index.build(words)
+
+    disagreements = 0
+    for word in rnd.sample(words, 300):
+        position = rnd.randrange(len(word))
+        typo = word[:position] + rnd.choice(alphabet) + word[position + 1:]
+        expected = difflib.get_close_matches(typo, words, n=1)
+        actual = index.get_most_similar(typo)
+        if actual != expected:
+            disagreements += 1
+            assert len(actual) == len(expected) == 1
+            assert difflib.SequenceMatcher(None, actual[0], typo).ratio() == (
+                difflib.SequenceMatcher(None, expected[0], typo).ratio()
+            )
+    assert disagreements <= 3
+
+
+def test_overlap_tied_at_candidates_cut_triggers_fallback_rerank() -> None:
+    triggers = ["abcx", "abcy", "abcz"]
+    assert difflib.get_close_matches("abc", triggers, n=1) == ["abcz"]
+
+    index = TrigramIndex(candidates_limit=1)
+    index.build(triggers)
+    assert index.get_most_similar("abc") == ["abcz"]
@@ -0,0 +1,98 @@
+import os
+from pathlib import Path
+
+import pytest
+from pytest import CaptureFixture
+
+from argenta.app import App, ExitCode, StartupSnapshot
+from argenta.command import Command, Flag, Flags
+from argenta.response import Response
+from argenta.router import Router
+
+
+def _build_app(snapshot_directory: Path, description: str = "Start the app") -> App:
+    app = App(
+        override_system_messages=True,
+        printer=print,
+        disable_banners=True,
+        startup_snapshot=StartupSnapshot(str(snapshot_directory), name="test-app"),
+    )
+    router = Router(title="Main commands:")
+
+    @router.command(Command("start", description=description, aliases={"run"}, flags=Flags([Flag("mode", possible_values=["fast", "slow"])])))
+    def start(response: Response) -> None:
+        print("started", response.status.value)
+
+    app.include_router(router, prefix="app")
+    return app
+
+
+def test_startup_snapshot_is_loaded_by_next_launch(tmp_path: Path, capsys: CaptureFixture[str]) -> None:
+    cold_app = _build_app(tmp_path)
+    cold_app._pre_cycle_setup()
+    cold_output = capsys.readouterr().out
+
+    assert cold_app._compiled_startup_state is None
+    assert len(list(tmp_path.glob("*.pickle"))) == 1
+
+    warm_app = _build_app(tmp_path)
+    warm_app._pre_cycle_setup()
+
+    assert warm_app._compiled_startup_state is not None
+    assert capsys.readouterr().out == cold_output
+    assert warm_app.execute("app run --mode fast").exit_code == ExitCode.SUCCESS
+    assert warm_app.execute("app start --mode fast").output == "started ALL_FLAGS_VALID\n"
+    assert warm_app._most_similar_command("app strt") == "app start"
+
+
+def test_startup_snapshot_is_recompiled_when_routers_change(tmp_path: Path, capsys: CaptureFixture[str]) -> None:
+    _build_app(tmp_path)._pre_cycle_setup()
+    capsys.readouterr()
+
+    changed_app = _build_app(tmp_path, description="Start the app quickly")
+    changed_app._pre_cycle_setup()
+
+    assert changed_app._compiled_startup_state is None
+    assert "Start the app quickly" in capsys.readouterr().out
+
+    reloaded_app = _build_app(tmp_path, description="Start the app quickly")
+    reloaded_app._setup_dispatch_state()
+    assert reloaded_app._compiled_startup_state is not None
+
+
+@pytest.mark.parametrize("content", [b"", b"garbage", b"not a key\n\x80\x05"])
+def test_damaged_startup_snapshot_is_recompiled(tmp_path: Path, content: bytes) -> None:
+    _build_app(tmp_path)._setup_dispatch_state()
+    Path(StartupSnapshot(str(tmp_path), name="test-app")._get_snapshot_path()).write_bytes(content)
+
+    app = _build_app(tmp_path)
+    app._setup_dispatch_state()
+
+    assert app._compiled_startup_state is None
+    assert app.execute("app start").exit_code == ExitCode.SUCCESS
+
+
+def test_startup_snapshot_key_ignores_set_order(tmp_path: Path) -> None:
+    snapshot = StartupSnapshot(str(tmp_path), name="test-app")
+    first_app, second_app = _build_app(tmp_path), _build_app(tmp_path)
+    first_app._setup_system_router()
+    second_app._setup_system_router()
+
+    assert snapshot.get_key(first_app.registered_routers) == snapshot.get_key(second_app.registered_routers)
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="file ownership is checked on POSIX only")
+@pytest.mark.parametrize("is_directory_shared", [False, True])
+def test_startup_snapshot_writable_by_others_is_ignored(
+    tmp_path: Path, capsys: CaptureFixture[str], is_directory_shared: bool
+) -> None:
+    _build_app(tmp_path)._pre_cycle_setup()
+    capsys.readouterr()
+    shared_path = tmp_path if is_directory_shared else Path(StartupSnapshot(str(tmp_path), name="test-app")._get_snapshot_path())
+    shared_path.chmod(shared_path.stat().st_mode | 0o002)
+
+    app = _build_app(tmp_path)
+    app._setup_dispatch_state()
+
+    assert app._compiled_startup_state is None
+    assert app.execute("app start").exit_code == ExitCode.SUCCESS
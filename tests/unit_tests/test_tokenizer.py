@@ -0,0 +1,150 @@
+import random
+import shlex
+from typing import Callable, cast
+
+import pytest
+
+from argenta.command.exceptions import (
+    EmptyInputCommandException,
+    InputCommandException,
+    RepeatedInputFlagsException,
+    UnprocessedInputFlagException,
+)
+from argenta.command.flag.models import PREFIX_TYPE, InputFlag
+from argenta.command.flag import InputFlags
+from argenta.command.models import InputCommand
+from argenta.command.tokenizer import tokenize
+
+
+def _shlex_tokens(raw_command: str) -> list[str]:
+    lexer = shlex.shlex(raw_command, posix=True)
+    lexer.whitespace_split = True
+    lexer.commenters = ""
+    return list(lexer)
+
+
+def _shlex_parse(raw_command: str) -> InputCommand:
+    """Reference implementation: the shlex-based parser the tokenizer replaced"""
+    try:
+        tokens = _shlex_tokens(raw_command)
+    except ValueError as e:
+        raise UnprocessedInputFlagException from e
+
+    if not tokens:
+        raise EmptyInputCommandException
+
+    flags = InputFlags()
+    i = 1
+    while i < len(tokens):
+        token = tokens[i]
+        if token.startswith("---"):
+            prefix, name = "---", token[3:]
+        elif token.startswith("--"):
+            prefix, name = "--", token[2:]
+        elif token.startswith("-"):
+            prefix, name = "-", token[1:]
+        else:
+            raise UnprocessedInputFlagException
+
+        if i + 1 < len(tokens) and not tokens[i + 1].startswith("-"):
+            input_value = tokens[i + 1]
+            i += 2
+        else:
+            input_value = ""
+            i += 1
+
+        input_flag = InputFlag(name, prefix=cast(PREFIX_TYPE, prefix), input_value=input_value)
+        if input_flag in flags:
+            raise RepeatedInputFlagsException(input_flag)
+        flags.add_flag(input_flag)
+
+    return InputCommand(tokens[0], input_flags=flags)
+
+
+def _tokenize_or_error(raw_command: str) -> list[str] | str:
+    try:
+        return list(tokenize(raw_command))
+    except ValueError as e:
+        return str(e)
+
+
+def _shlex_or_error(raw_command: str) -> list[str] | str:
+    try:
+        return _shlex_tokens(raw_command)
+    except ValueError as e:
+        return str(e)
+
+
+def _parse_outcome(parser: Callable[[str], InputCommand], raw_command: str) -> object:
+    try:
+        command = parser(raw_command)
+    except InputCommandException as e:
+        return type(e)
+    return (
+        command.trigger,
+        [(flag.prefix, flag.name, flag.input_value) for flag in command.input_flags],
+    )
+
+
+CORNER_CASES: list[str] = [
+    "",
+    "   ",
+    "start",
+    "  start  ",
+    "start\t--host\r\nlocalhost",
+    "cmd --text 'hello world' --msg \"test message\"",
+    "cmd --empty '' --other \"\"",
+    "cmd --glued ab'cd'\"ef\"",
+    'cmd --escaped "a \\" b \\\\ c \\n"',
+    "cmd --single 'no \\ escapes'",
+    "cmd --space a\\ b",
+    "cmd 'unclosed",
+    'cmd "unclosed',
+    "cmd trailing\\",
+    'cmd "trailing\\',
+    "cmd --value '-5'",
+    "cmd '--quoted-flag' value",
+    "cmd -a --bb ---ccc ----dddd",
+    "ssh --host 192.168.0.3 9977",
+    "ssh --host 1 --host 2 'unclosed",
+    "cmd\x0b--vertical-tab",
+    "cmd --unicode значение",
+]
+
+
+@pytest.mark.parametrize("raw_command", CORNER_CASES)
+def test_tokenize_matches_shlex_on_corner_cases(raw_command: str) -> None:
+    assert _tokenize_or_error(raw_command) == _shlex_or_error(raw_command)
+
+
+def test_tokenize_matches_shlex_on_random_input() -> None:
+    rnd = random.Random(42)
+    alphabet = ["a", "b", "-", "--", " ", "\t", "\n", "'", '"', "\\", "\x0b", "é", "#", ""]
+    for _ in range(20000):
+        raw_command = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 14)))
+        assert _tokenize_or_error(raw_command) == _shlex_or_error(raw_command), repr(raw_command)
+
+
+@pytest.mark.parametrize("raw_command", CORNER_CASES)
+def test_parse_matches_shlex_based_parser_on_corner_cases(raw_command: str) -> None:
+    assert _parse_outcome(InputCommand.parse, raw_command) == _parse_outcome(_shlex_parse, raw_command)
+
+
+def test_parse_matches_shlex_based_parser_on_random_input() -> None:
+    rnd = random.Random(7)
+    alphabet = ["cmd", " ", " ", "-a", "--b", "---c", "-a", "v", "'x y'", '"', "'", "\\"]
+    for _ in range(20000):
+        raw_command = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 10)))
+        assert _parse_outcome(InputCommand.parse, raw_command) == \
+            _parse_outcome(_shlex_parse, raw_command), repr(raw_command)
+
+
+def test_syntax_error_takes_precedence_over_repeated_flags() -> None:
+    with pytest.raises(UnprocessedInputFlagException):
+        InputCommand.parse("ssh --host 1 --host 2 'unclosed")
+
+
+def test_parse_keeps_quoted_empty_value() -> None:
+    flag = InputCommand.parse("cmd --name ''").input_flags.get_flag_by_name("name")
+    assert flag is not None
+    assert flag.input_value == ""
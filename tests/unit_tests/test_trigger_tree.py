@@ -0,0 +1,43 @@
+import pytest
+
+from argenta.app.trigger_tree import TriggerTree
+
+
+@pytest.fixture
+def trigger_tree() -> TriggerTree:
+    return TriggerTree({"db migrate", "db seed", "git remote add", "git", "q"})
+
+
+def test_join_trigger_path_joins_subcommand_tokens(trigger_tree: TriggerTree) -> None:
+    assert list(trigger_tree.join_trigger_path(["DB", "Migrate", "--force"])) == ["DB Migrate", "--force"]
+    assert list(trigger_tree.join_trigger_path(["git", "remote", "add", "-v", "x"])) == ["git remote add", "-v", "x"]
+
+
+def test_join_trigger_path_passes_single_token_triggers_through(trigger_tree: TriggerTree) -> None:
+    assert list(trigger_tree.join_trigger_path(["q", "--force"])) == ["q", "--force"]
+    assert list(trigger_tree.join_trigger_path(["unknown", "value"])) == ["unknown", "value"]
+    assert list(trigger_tree.join_trigger_path([])) == []
+
+
+def test_join_trigger_path_keeps_unknown_token_after_command_as_flag_token(trigger_tree: TriggerTree) -> None:
+    assert list(trigger_tree.join_trigger_path(["git", "status"])) == ["git", "status"]
+    assert list(trigger_tree.join_trigger_path(["db", "migrate", "up"])) == ["db migrate", "up"]
+
+
+def test_join_trigger_path_joins_unknown_subcommand_of_group(trigger_tree: TriggerTree) -> None:
+    assert list(trigger_tree.join_trigger_path(["db", "drop", "-f"])) == ["db drop", "-f"]
+    assert list(trigger_tree.join_trigger_path(["db", "-f"])) == ["db", "-f"]
+
+
+def test_is_group(trigger_tree: TriggerTree) -> None:
+    assert trigger_tree.is_group("db")
+    assert trigger_tree.is_group("GIT remote")
+    assert trigger_tree.is_group("git")
+    assert not trigger_tree.is_group("db migrate")
+    assert not trigger_tree.is_group("q")
+    assert not trigger_tree.is_group("unknown")
+
+
+def test_tree_without_subcommands_is_empty() -> None:
+    assert not TriggerTree({"start", "stop"})
+    assert TriggerTree({"db migrate"})